@@ -0,0 +1,263 @@
+import numpy as np
+from utils import generatePopulation
+from partner_selection import top_k_indices, partner_indices, top_partner_indices
+from powell_method import powell_steps, MaxFunEvalsReached
+from convergence_trace import ConvergenceTrace
+from powell_schedule import FixedWindows, MilestoneRecorder
+
+
+class CDeepsoPowellAskTell:
+    """
+    Interface ask/tell do PC-DEEPSO (mesma lógica de
+    `c_deepso_powell_global_best_paralelo`, modo não in-place).
+
+    O laço de avaliação fica com quem usa o objeto: `ask()` devolve a próxima
+    matriz (N, D) a avaliar — o enxame movido ou um ponto (1, D) da busca do
+    Powell — e `tell(fitness)` recebe os N valores e avança o estado. Assim a
+    avaliação pode ir para um pool de processos, um serviço em lote ou um
+    simulador externo. Orçamento, marcos de avaliações, agendamento do
+    Powell e curva de convergência são controlados aqui dentro.
+
+    Exemplo
+    -------
+    >>> opt = CDeepsoPowellAskTell(1000, 500, -100, 100, max_fun_evals=3_000_000)
+    >>> while not opt.done:
+    ...     points = opt.ask()
+    ...     opt.tell(function(points))
+    >>> g_best_fitness, g_best, g_best_fitness_list, *_ = opt.result()
+
+    Parameters
+    ----------
+    dimension, swarmSize, lowerBound, upperBound : int, int, float, float
+        Como em `c_deepso_powell_global_best_paralelo`.
+    max_fun_evals : int
+        Orçamento de avaliações; o último lote é truncado para não excedê-lo.
+    percent_powell_func_evals : float
+        Fração do orçamento dividida entre as três janelas do Powell.
+    max_iter : int, opcional
+        Limite de iterações do enxame.
+    line_search_method : str
+        'golden' ou 'brent', repassado à busca linear do Powell.
+    rng : numpy.random.Generator, SeedSequence ou int, opcional
+        Fonte de aleatoriedade da execução (ver `np.random.default_rng`).
+    powell_schedule : powell_schedule.PowellSchedule, opcional
+        Quando o Powell começa; padrão: FixedWindows.cec2013.
+    milestone_recorder : powell_schedule.MilestoneRecorder, opcional
+        Marcos de avaliações registrados; padrão: 120k e 600k.
+    """
+
+    def __init__(self, dimension, swarmSize, lowerBound, upperBound, max_fun_evals,
+                 percent_powell_func_evals=0.1,
+                 max_iter=None,
+                 W_i=0.40,
+                 W_a=0.37,
+                 W_c=0.75,
+                 max_v=1.01,
+                 T_com=0.58,
+                 T_mut=0.1,
+                 type='sgpb',
+                 F=0.8,
+                 line_search_method='golden',
+                 rng=None,
+                 powell_schedule=None,
+                 milestone_recorder=None):
+        self.rng = np.random.default_rng(rng)
+        self.dimension = dimension
+        self.swarmSize = swarmSize
+        self.lowerBound = lowerBound
+        self.upperBound = upperBound
+        self.max_fun_evals = max_fun_evals
+        self.max_iter = max_iter
+        self.W_i, self.W_a, self.W_c = W_i, W_a, W_c
+        self.max_v = max_v
+        self.T_com = T_com
+        self.T_mut = T_mut
+        self.type = type
+        self.F = F
+        self.line_search_method = line_search_method
+
+        powell_func_evals = int(max_fun_evals * percent_powell_func_evals)
+        self.powell_schedule = FixedWindows.cec2013(powell_func_evals) if powell_schedule is None else powell_schedule
+        self.milestone_recorder = MilestoneRecorder() if milestone_recorder is None else milestone_recorder
+        self.num_top_particles = max(1, swarmSize // 10)
+
+        self.k = 0
+        self.swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, self.rng)
+        self.velocity = np.zeros((swarmSize, dimension))
+        self.fitness_list = None
+        self.g_best = None
+        self.g_best_fitness = np.inf
+        self.g_best_fitness_list = ConvergenceTrace()
+        self.function_evals = 0
+        self.g_best_fitness_before_powell = None
+        self.g_best_fitness_after_powell = None
+        self.done = False
+
+        # Fases: 'init' (população inicial), 'swarm', 'powell', 'candidate' e 'done'
+        self._phase = 'init'
+        self._pending = None
+        self._powell = None
+        self._powell_point = None
+        self._powell_stop_func_evals = None
+        self._candidate = None
+
+    @property
+    def remaining_evals(self):
+        return self.max_fun_evals - self.function_evals
+
+    def ask(self):
+        """
+        Próxima matriz (N, D) de pontos a avaliar. Chamadas repetidas sem
+        `tell` devolvem o mesmo lote.
+        """
+        if self.done:
+            raise RuntimeError("a otimização já terminou; use result()")
+        if self._pending is None:
+            if self._phase == 'init':
+                self._pending = self.swarm[:self.remaining_evals]
+            elif self._phase == 'swarm':
+                self._move()
+                self._pending = self.swarm[:self.remaining_evals]
+            elif self._phase == 'powell':
+                self._pending = self._powell_point[np.newaxis]
+            elif self._phase == 'candidate':
+                self._pending = self._candidate[np.newaxis]
+        return self._pending
+
+    def tell(self, fitness):
+        """Informa os valores do objetivo para o lote devolvido pelo último `ask`."""
+        if self._pending is None:
+            raise RuntimeError("tell() chamado sem um ask() pendente")
+        fitness = np.asarray(fitness, dtype=np.float64).reshape(-1)
+        if len(fitness) != len(self._pending):
+            raise ValueError(f"esperados {len(self._pending)} valores, recebidos {len(fitness)}")
+        points = self._pending
+        self._pending = None
+        if self._phase in ('init', 'swarm'):
+            self._tell_population(points, fitness)
+        else:
+            self._tell_point(points[0], fitness[0])
+
+    def run(self, function):
+        """Executa até o fim avaliando cada lote com `function` (matriz (N, D) -> (N,))."""
+        while not self.done:
+            self.tell(function(self.ask()))
+        return self.result()
+
+    def result(self):
+        """Mesma tupla devolvida por `c_deepso_powell_global_best_paralelo`."""
+        return self.g_best_fitness, self.g_best, self.g_best_fitness_list, [], [], self.function_evals, \
+            self.milestone_recorder.get(120_000), self.milestone_recorder.get(600_000), \
+            self.g_best_fitness_before_powell, self.g_best_fitness_after_powell
+
+    def _tell_population(self, points, fitness):
+        population_evals = len(fitness)
+        self.fitness_list = fitness
+        self.function_evals += population_evals
+
+        self.milestone_recorder.record_population(self.function_evals, self.g_best_fitness)
+
+        candidate_g_best_index = np.argmin(fitness)
+        if fitness[candidate_g_best_index] < self.g_best_fitness:
+            self.g_best_fitness = fitness[candidate_g_best_index]
+            self.g_best = points[candidate_g_best_index].copy()
+        self.g_best_fitness_list.extend_constant(self.g_best_fitness, population_evals)
+
+        if self.function_evals >= self.max_fun_evals:
+            self._finish()
+            return
+        if self._phase == 'init':
+            self._phase = 'swarm'
+            return
+
+        powell_phase = self.powell_schedule(self.function_evals, self.k, self.g_best_fitness, self.swarm, fitness)
+        if powell_phase is None:
+            self._end_iteration()
+            return
+        self._powell_stop_func_evals = self.max_fun_evals if powell_phase.budget is None \
+            else self.function_evals + powell_phase.budget
+        self.g_best_fitness_before_powell = self.g_best_fitness
+        self._powell = powell_steps(self.g_best, (self.lowerBound, self.upperBound), max_iter=powell_phase.max_iter,
+                                    line_search_method=self.line_search_method)
+        self._powell_point = next(self._powell)
+        self._phase = 'powell'
+
+    def _tell_point(self, point, result):
+        self.function_evals += 1
+        if result < self.g_best_fitness:
+            self.g_best_fitness = result
+            self.g_best = point.copy()
+            self.g_best_fitness_list.append(result)
+        else:
+            self.g_best_fitness_list.append(self.g_best_fitness)
+        self.milestone_recorder.record_point(self.function_evals, self.g_best_fitness)
+        if self.function_evals >= self.max_fun_evals:
+            self._finish()
+            return
+
+        if self._phase == 'candidate':
+            self.g_best_fitness_after_powell = self.g_best_fitness
+            self._end_iteration()
+            return
+
+        try:
+            if self.function_evals >= self._powell_stop_func_evals:
+                self._powell.throw(MaxFunEvalsReached())
+            self._powell_point = self._powell.send(result)
+        except StopIteration as stop:
+            self._powell = None
+            self._candidate = stop.value.copy()
+            self._phase = 'candidate'
+
+    def _end_iteration(self):
+        self.k += 1
+        if self.max_iter is not None and self.max_iter == self.k:
+            self._finish()
+        else:
+            self._phase = 'swarm'
+
+    def _finish(self):
+        if self._powell is not None:
+            self._powell.close()
+            self._powell = None
+        self._phase = 'done'
+        self.done = True
+
+    def _top_particles(self):
+        top_indices = top_k_indices(self.fitness_list, self.num_top_particles)
+        return self.swarm[top_indices], top_indices
+
+    def _move(self):
+        swarm = self.swarm
+        # Mutação dos pesos e do g_best
+        mutation = self.rng.normal(0, 1, size=4)
+        self.W_i = np.clip(self.W_i + (self.T_mut * mutation[0]), 0, 1)
+        self.W_a = np.clip(self.W_a + (self.T_mut * mutation[1]), 0, 1)
+        self.W_c = np.clip(self.W_c + (self.T_mut * mutation[2]), 0, 1)
+
+        # Extrai Xr conforme o tipo selecionado
+        if self.type == 'sg':
+            Xr_matrix = swarm[partner_indices(self.rng, self.swarmSize)]
+        elif self.type == 'pb':
+            top_particles, top_indices = self._top_particles()
+            Xr_matrix = top_particles[top_partner_indices(self.rng, top_indices, self.swarmSize)]
+        else:
+            Xr_matrix = swarm[partner_indices(self.rng, self.swarmSize)]
+            top_particles, top_indices = self._top_particles()
+            random_top_indices = top_partner_indices(self.rng, top_indices, self.swarmSize)
+            Xr_matrix = (Xr_matrix + top_particles[random_top_indices]) / 2
+
+        # Calcula X_st com a estratégia current-to-best-2
+        X_st_matrix = Xr_matrix + self.F * (self.g_best - Xr_matrix)
+
+        # Gera matriz/vetor de comunicação
+        C = self.rng.choice([0, 1], size=self.dimension, p=[1 - self.T_com, self.T_com])
+        selected_global_best = np.clip(self.g_best * (1 + self.T_mut * mutation[3]),
+                                       self.lowerBound, self.upperBound)
+
+        # Equação de movimento nas matrizes
+        inertia = self.W_i * self.velocity
+        cognitive = self.W_a * (X_st_matrix - swarm)
+        social = self.W_c * C * (selected_global_best - swarm)
+        self.velocity = np.clip(inertia + cognitive + social, -self.max_v, self.max_v)
+        self.swarm = np.clip(swarm + self.velocity, self.lowerBound, self.upperBound)
@@ -0,0 +1,242 @@
+import os
+import importlib.util
+from functools import lru_cache
+import numpy as np
+from functions import cec_elliptic, cec_rastrigin, cec_ackley, cec_schwefel, sphere, shifted_rosenbrock
+from incremental_functions import (RotatedGroupIncremental, EllipticIncremental, RastriginIncremental,
+                                   AckleyIncremental, SphereIncremental, RosenbrockIncremental)
+
+# Implementação vetorizada das 15 funções do CEC2013 LSGO. Segue a implementação
+# de referência em C++ (pacote cec2013lsgo): mesmos arquivos de dados em
+# `cdatafiles`, mesma ordem de subcomponentes e as transformações T_osz, T_asy e
+# Lambda aplicadas dentro de cada função base (ver functions.cec_*).
+#
+# Cada função aceita um ponto (D,) ou uma matriz (N, D) e avalia o enxame
+# inteiro de uma vez: os subcomponentes de mesmo tamanho são empilhados e
+# rotacionados com um único produto matricial.
+
+# (função base dos subcomponentes, função base da parte separável, limites)
+_DEFINITIONS = {
+    1: (None, cec_elliptic, 100),
+    2: (None, cec_rastrigin, 5),
+    3: (None, cec_ackley, 32),
+    4: (cec_elliptic, cec_elliptic, 100),
+    5: (cec_rastrigin, cec_rastrigin, 5),
+    6: (cec_ackley, cec_ackley, 32),
+    7: (cec_schwefel, sphere, 100),
+    8: (cec_elliptic, None, 100),
+    9: (cec_rastrigin, None, 5),
+    10: (cec_ackley, None, 32),
+    11: (cec_schwefel, None, 100),
+    # Na referência em C++ a f12 usa z = x - xopt (o ótimo fica em xopt + 1)
+    12: (None, shifted_rosenbrock, 100),
+    13: (cec_schwefel, None, 100),
+    14: (cec_schwefel, None, 100),
+    15: (None, cec_schwefel, 100),
+}
+
+_OVERLAP = 5
+_ROTATION_SIZES = (25, 50, 100)
+
+
+def default_data_dir():
+    """
+    Pasta com os arquivos F{k}-*.txt. Usa a variável de ambiente
+    CEC2013_DATA_DIR, senão `cdatafiles` no diretório atual (como o código em
+    C++), senão a pasta `cdatafiles` do pacote cec2013lsgo, se instalado.
+    """
+    if os.environ.get('CEC2013_DATA_DIR'):
+        return os.environ['CEC2013_DATA_DIR']
+    if os.path.isdir('cdatafiles'):
+        return 'cdatafiles'
+    spec = importlib.util.find_spec('cec2013lsgo')
+    if spec is not None and spec.origin is not None:
+        candidate = os.path.join(os.path.dirname(spec.origin), 'cdatafiles')
+        if os.path.isdir(candidate):
+            return candidate
+    return 'cdatafiles'
+
+
+def _read_values(path):
+    # Os arquivos usam vírgulas e/ou quebras de linha como separadores
+    with open(path) as file:
+        return np.array(file.read().replace(',', ' ').split(), dtype=float)
+
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+
+@lru_cache(maxsize=None)
+def _load_data(function_id, data_dir):
+    """Lê os arquivos de dados de uma função uma única vez por processo."""
+    prefix = os.path.join(data_dir, f"F{function_id}")
+    data = {'xopt': _read_only(_read_values(f"{prefix}-xopt.txt"))}
+    if _DEFINITIONS[function_id][0] is not None:
+        permutation = _read_values(f"{prefix}-p.txt").astype(int)
+        # Os arquivos de permutação são indexados a partir de 1
+        if permutation.min() == 1:
+            permutation -= 1
+        data['p'] = _read_only(permutation)
+        data['s'] = _read_only(_read_values(f"{prefix}-s.txt").astype(int))
+        data['w'] = _read_only(_read_values(f"{prefix}-w.txt"))
+        for m in sorted(set(data['s'].tolist())):
+            rotation = _read_values(f"{prefix}-R{m}.txt").reshape(m, m)
+            data[f'R{m}'] = _read_only(rotation)
+    return data
+
+
+class _GroupBlock:
+    """Subcomponentes de mesmo tamanho m, empilhados para avaliação em lote."""
+
+    def __init__(self, indices, shifts, rotation, weights):
+        self.indices = _read_only(np.array(indices))
+        self.shifts = _read_only(np.array(shifts, dtype=float))
+        self.rotation = rotation
+        self.weights = _read_only(np.array(weights, dtype=float))
+
+
+class CEC2013Function:
+    """
+    Função f{function_id} do CEC2013 LSGO avaliada em lote.
+
+    Parameters
+    ----------
+    function_id : int
+        Número da função (1 a 15).
+    data_dir : str, optional
+        Pasta com os arquivos de dados (ver `default_data_dir`).
+    """
+
+    def __init__(self, function_id, data_dir=None):
+        if function_id not in _DEFINITIONS:
+            raise ValueError("function_id must be between 1 and 15.")
+        self.function_id = function_id
+        self.data_dir = default_data_dir() if data_dir is None else data_dir
+        self.group_base, self.separable_base, bound = _DEFINITIONS[function_id]
+        self.lower, self.upper = -bound, bound
+
+        data = _load_data(function_id, self.data_dir)
+        xopt = data['xopt']
+        self.groups, self.group_shifts, self.group_rotations, self.group_weights = [], [], [], []
+        self.separable_indices = None
+        self.separable_shift = None
+
+        if self.group_base is None:
+            self.dimension = len(xopt)
+            self.separable_indices = _read_only(np.arange(self.dimension))
+            self.separable_shift = xopt
+        else:
+            permutation, sizes, weights = data['p'], data['s'], data['w']
+            overlap = _OVERLAP if function_id in (13, 14) else 0
+            # f13/f14: subcomponentes consecutivos compartilham `overlap` variáveis (D = 905)
+            self.dimension = len(permutation) if overlap == 0 else int(sizes.sum()) - overlap * (len(sizes) - 1)
+            # Na f14 (conflitante) cada subcomponente tem o seu próprio deslocamento
+            group_shifts = np.split(xopt, np.cumsum(sizes)[:-1]) if function_id == 14 else None
+            c = 0
+            for k, m in enumerate(sizes):
+                start = c - k * overlap
+                indices = permutation[start:start + m]
+                self.groups.append(indices)
+                self.group_shifts.append(group_shifts[k] if group_shifts is not None else xopt[indices])
+                self.group_rotations.append(data[f'R{m}'])
+                self.group_weights.append(weights[k])
+                c += m
+            if self.separable_base is not None:
+                self.separable_indices = permutation[c:]
+                self.separable_shift = xopt[self.separable_indices]
+
+        self._blocks = []
+        for m in sorted(set(len(g) for g in self.groups)):
+            members = [k for k, g in enumerate(self.groups) if len(g) == m]
+            self._blocks.append(_GroupBlock([self.groups[k] for k in members],
+                                            [self.group_shifts[k] for k in members],
+                                            self.group_rotations[members[0]],
+                                            [self.group_weights[k] for k in members]))
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        total = np.zeros(x.shape[:-1])
+        for block in self._blocks:
+            # (..., G, m) -> um único produto matricial para todos os subcomponentes do bloco
+            z = (x[..., block.indices] - block.shifts) @ block.rotation.T
+            total = total + self.group_base(z) @ block.weights
+        if self.separable_indices is not None:
+            total = total + self.separable_base(x[..., self.separable_indices] - self.separable_shift)
+        return total[()]
+
+    def get_info(self):
+        return {'lower': self.lower, 'upper': self.upper, 'dimension': self.dimension,
+                'best': 0.0, 'threshold': 0}
+
+    def incremental(self):
+        """
+        Objetivo incremental equivalente para o Powell (ver incremental_functions),
+        ou None quando não há ganho (f15, em que cada coordenada afeta todas as
+        somas parciais).
+        """
+        separable = None
+        if self.separable_indices is not None:
+            n = len(self.separable_indices)
+            separable = {
+                cec_elliptic: lambda: EllipticIncremental(n, self.separable_shift, cec=True),
+                cec_rastrigin: lambda: RastriginIncremental(n, self.separable_shift, cec=True),
+                cec_ackley: lambda: AckleyIncremental(n, self.separable_shift, cec=True),
+                sphere: lambda: SphereIncremental(n, self.separable_shift),
+                shifted_rosenbrock: lambda: RosenbrockIncremental(n, self.separable_shift),
+            }.get(self.separable_base, lambda: None)()
+            if separable is None:
+                return None
+        if not self.groups:
+            return separable
+        return RotatedGroupIncremental(self.dimension, self.groups, self.group_shifts, self.group_rotations,
+                                       self.group_weights, self.group_base, self.separable_indices, separable)
+
+
+class Benchmark:
+    """Mesma interface do `cec2013lsgo.cec2013.Benchmark`, usando as funções em lote."""
+
+    def __init__(self, data_dir=None):
+        self.data_dir = data_dir
+
+    def get_function(self, function_id):
+        return CEC2013Function(function_id, self.data_dir)
+
+    def get_info(self, function_id):
+        return CEC2013Function(function_id, self.data_dir).get_info()
+
+    def get_num_functions(self):
+        return len(_DEFINITIONS)
+
+    def next_run(self):
+        pass
+
+
+def compare_with_reference(function_ids=range(1, 16), n_points=10, seed=0, data_dir=None):
+    """
+    Compara os valores com o pacote de referência cec2013lsgo em pontos
+    aleatórios e no ótimo xopt. Retorna uma lista de dicionários com o erro
+    relativo máximo de cada função.
+    """
+    from cec2013lsgo.cec2013 import Benchmark as ReferenceBenchmark
+
+    reference = ReferenceBenchmark()
+    rng = np.random.default_rng(seed)
+    rows = []
+    for function_id in function_ids:
+        function = CEC2013Function(function_id, data_dir)
+        reference_function = reference.get_function(function_id)
+        points = rng.uniform(function.lower, function.upper, (n_points, function.dimension))
+        if function.separable_shift is not None and len(function.separable_shift) == function.dimension:
+            points = np.vstack([points, function.separable_shift])
+        expected = np.array([reference_function(p) for p in points])
+        obtained = function(points)
+        relative_error = np.abs(obtained - expected) / np.maximum(np.abs(expected), 1e-12)
+        rows.append({'funcao': f'f{function_id}', 'erro_relativo_max': float(np.max(relative_error))})
+    return rows
+
+
+if __name__ == "__main__":
+    for row in compare_with_reference():
+        print(f"{row['funcao']}: erro relativo máximo = {row['erro_relativo_max']:.3e}")
@@ -0,0 +1,50 @@
+import os
+import json
+import numpy as np
+
+# Sufixo das chaves cujo valor é um dicionário gravado como JSON (ex.: estado do gerador)
+_JSON_SUFFIX = '__json'
+
+
+def save_checkpoint(path, state):
+    """
+    Grava `state` (dicionário de arrays, escalares, dicionários ou None) em um
+    .npz comprimido. O arquivo é escrito em um temporário e renomeado, então
+    um checkpoint anterior nunca é substituído por um arquivo pela metade.
+    Chaves com valor None são omitidas e voltam como None em `load_checkpoint`.
+    """
+    arrays = {}
+    for key, value in state.items():
+        if value is None:
+            continue
+        if isinstance(value, dict):
+            arrays[key + _JSON_SUFFIX] = np.array(json.dumps(value, default=int))
+        else:
+            arrays[key] = np.asarray(value)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temporary = f"{path}.tmp.npz"
+    np.savez_compressed(temporary, **arrays)
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path):
+    """Estado gravado por `save_checkpoint`, ou None se não houver checkpoint em `path`."""
+    if path is None or not os.path.exists(path):
+        return None
+    state = {}
+    with np.load(path) as data:
+        for key in data.files:
+            value = data[key]
+            if key.endswith(_JSON_SUFFIX):
+                state[key[:-len(_JSON_SUFFIX)]] = json.loads(value.item())
+            else:
+                state[key] = value.item() if value.ndim == 0 else value
+    return state
+
+
+def remove_checkpoint(path):
+    if path is not None and os.path.exists(path):
+        os.remove(path)
+
@@ -0,0 +1,267 @@
+import numpy as np
+from itertools import repeat
+
+
+class ConvergenceTrace:
+    """
+    Curva de convergência (melhor fitness após cada avaliação de função)
+    armazenada apenas nos pontos de mudança.
+
+    Como o melhor fitness só muda quando há melhora, guardamos os pares
+    (índice da avaliação, valor) em arrays NumPy que crescem por duplicação.
+    Para 3M avaliações isso ocupa alguns KB em vez de uma lista com 3M floats,
+    e o objeto é serializado de forma compacta ao voltar do ProcessPoolExecutor.
+
+    A interface imita a lista antiga (`len`, iteração, indexação), então os
+    scripts que escrevem o CSV com `enumerate(g_best_list)` continuam funcionando.
+    """
+
+    def __init__(self, capacity=1024):
+        self._evals = np.empty(capacity, dtype=np.int64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+        self._length = 0
+
+    def _reserve(self, extra):
+        needed = self._size + extra
+        if needed <= len(self._evals):
+            return
+        capacity = max(needed, 2 * len(self._evals), 1)
+        evals = np.empty(capacity, dtype=np.int64)
+        values = np.empty(capacity, dtype=np.float64)
+        evals[:self._size] = self._evals[:self._size]
+        values[:self._size] = self._values[:self._size]
+        self._evals, self._values = evals, values
+
+    def append(self, value):
+        self.extend_constant(value, 1)
+
+    def extend_constant(self, value, count):
+        """Equivalente a `lista.extend([value] * count)`."""
+        if count <= 0:
+            return
+        if self._size == 0 or value != self._values[self._size - 1]:
+            self._reserve(1)
+            self._evals[self._size] = self._length
+            self._values[self._size] = value
+            self._size += 1
+        self._length += count
+
+    def extend(self, values):
+        """Equivalente a `lista.extend(values)` para uma sequência arbitrária."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if values.size == 0:
+            return
+        change = np.empty(values.size, dtype=bool)
+        change[0] = self._size == 0 or values[0] != self._values[self._size - 1]
+        np.not_equal(values[1:], values[:-1], out=change[1:])
+        positions = np.flatnonzero(change)
+        self._reserve(len(positions))
+        self._evals[self._size:self._size + len(positions)] = self._length + positions
+        self._values[self._size:self._size + len(positions)] = values[positions]
+        self._size += len(positions)
+        self._length += values.size
+
+    @classmethod
+    def from_change_points(cls, evals, values, length):
+        """Reconstrói a curva a partir dos pontos de mudança (aceita arrays mapeados em memória)."""
+        trace = cls.__new__(cls)
+        trace.__setstate__({'evals': evals, 'values': values, 'length': length})
+        return trace
+
+    @property
+    def change_points(self):
+        """Tupla (avaliações, valores) com os pontos onde a curva muda."""
+        return self._evals[:self._size], self._values[:self._size]
+
+    def best_at(self, k):
+        """Melhor fitness registrado na avaliação `k` (base 0), via busca binária."""
+        if k < 0:
+            k += self._length
+        if not 0 <= k < self._length:
+            raise IndexError("avaliação fora da curva de convergência")
+        position = np.searchsorted(self._evals[:self._size], k, side='right') - 1
+        return float(self._values[position])
+
+    def sample(self, evals):
+        """Valores da curva nas avaliações `evals` (array de índices base 0)."""
+        evals = np.asarray(evals)
+        positions = np.searchsorted(self._evals[:self._size], evals, side='right') - 1
+        return self._values[positions]
+
+    def to_array(self):
+        """Expande a curva para um array denso com uma posição por avaliação."""
+        counts = np.diff(np.append(self._evals[:self._size], self._length))
+        return np.repeat(self._values[:self._size], counts)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        evals, values = self.change_points
+        ends = np.append(evals[1:], self._length)
+        for start, end, value in zip(evals.tolist(), ends.tolist(), values.tolist()):
+            yield from repeat(value, end - start)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.to_array()[index]
+        return self.best_at(index)
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.to_array()
+        return array if dtype is None else array.astype(dtype)
+
+    def __getstate__(self):
+        return {'evals': self._evals[:self._size].copy(),
+                'values': self._values[:self._size].copy(),
+                'length': self._length}
+
+    def __setstate__(self, state):
+        self._evals = state['evals']
+        self._values = state['values']
+        self._size = len(self._evals)
+        self._length = state['length']
+
+    def __repr__(self):
+        return f"ConvergenceTrace(avaliacoes={self._length}, pontos_de_mudanca={self._size})"
+
+
+def _step_sample(change_evals, values, evals):
+    # Valor de uma curva em degraus (pontos de mudança) nas avaliações `evals`
+    return values[np.searchsorted(change_evals, evals, side='right') - 1]
+
+
+class ConvergenceAggregator:
+    """
+    Agregação online das curvas de convergência de várias execuções.
+
+    Cada curva é incorporada com `add` assim que a execução termina e pode ser
+    descartada em seguida. Média, variância (Welford), mínimo e máximo são
+    exatos: como as curvas são em degraus, as estatísticas também são, e
+    ficam guardadas apenas na união dos pontos de mudança, então podem ser
+    consultadas em qualquer resolução. Quantis (mediana etc.) vêm de um
+    histograma em escala logarítmica por avaliação de `quantile_evals`, com
+    memória fixa (len(quantile_evals) x n_bins) qualquer que seja o número de
+    execuções.
+
+    Parameters
+    ----------
+    quantile_evals : array, optional
+        Avaliações (base 0) onde os quantis são estimados. Padrão: 1000
+        pontos igualmente espaçados ao longo da primeira curva recebida.
+    n_bins : int
+        Bins do histograma; com o intervalo padrão o erro relativo dos
+        quantis fica abaixo de ~4%.
+    value_range : tuple
+        Intervalo de t = sign(v) * log10(1 + |v| / 1e-12) coberto pelos bins
+        (o padrão cobre |v| de 1e-12 a 1e18).
+    """
+
+    _EPS = 1e-12
+
+    def __init__(self, quantile_evals=None, n_bins=4000, value_range=(-30.0, 30.0)):
+        self.quantile_evals = None if quantile_evals is None else np.asarray(quantile_evals, dtype=np.int64)
+        self.n_bins = n_bins
+        self.value_range = value_range
+        self.count = 0
+        self.length = 0
+        self._evals = np.empty(0, dtype=np.int64)
+        self._mean = self._m2 = self._min = self._max = np.empty(0)
+        self._histogram = None
+
+    def _to_log(self, values):
+        return np.sign(values) * np.log10(1 + np.abs(values) / self._EPS)
+
+    def _from_log(self, t):
+        return np.sign(t) * self._EPS * (10 ** np.abs(t) - 1)
+
+    def add(self, trace):
+        """Incorpora uma execução (ConvergenceTrace ou sequência com um valor por avaliação)."""
+        if not isinstance(trace, ConvergenceTrace):
+            values = trace
+            trace = ConvergenceTrace()
+            trace.extend(values)
+        if len(trace) == 0:
+            return
+        trace_evals, _ = trace.change_points
+        evals = np.union1d(self._evals, trace_evals)
+        x = trace.sample(evals)
+        self.count += 1
+        if self.count == 1:
+            mean, m2, minimum, maximum = x.copy(), np.zeros(len(x)), x.copy(), x.copy()
+        else:
+            old_mean = _step_sample(self._evals, self._mean, evals)
+            delta = x - old_mean
+            mean = old_mean + delta / self.count
+            m2 = _step_sample(self._evals, self._m2, evals) + delta * (x - mean)
+            minimum = np.minimum(_step_sample(self._evals, self._min, evals), x)
+            maximum = np.maximum(_step_sample(self._evals, self._max, evals), x)
+        self._evals, self._mean, self._m2, self._min, self._max = evals, mean, m2, minimum, maximum
+        self.length = max(self.length, len(trace))
+
+        if self.quantile_evals is None:
+            self.quantile_evals = np.unique(np.linspace(0, len(trace) - 1, 1000).astype(np.int64))
+        if self._histogram is None:
+            self._histogram = np.zeros((len(self.quantile_evals), self.n_bins), dtype=np.int32)
+        low, high = self.value_range
+        position = (self._to_log(trace.sample(self.quantile_evals)) - low) / (high - low) * self.n_bins
+        bins = np.clip(np.nan_to_num(position).astype(np.int64), 0, self.n_bins - 1)
+        self._histogram[np.arange(len(bins)), bins] += 1
+
+    def _evals_or_all(self, evals):
+        return np.arange(self.length) if evals is None else np.asarray(evals)
+
+    def mean(self, evals=None):
+        return _step_sample(self._evals, self._mean, self._evals_or_all(evals))
+
+    def variance(self, evals=None, ddof=0):
+        return _step_sample(self._evals, self._m2, self._evals_or_all(evals)) / max(self.count - ddof, 1)
+
+    def std(self, evals=None, ddof=0):
+        return np.sqrt(self.variance(evals, ddof))
+
+    def min(self, evals=None):
+        return _step_sample(self._evals, self._min, self._evals_or_all(evals))
+
+    def max(self, evals=None):
+        return _step_sample(self._evals, self._max, self._evals_or_all(evals))
+
+    def quantile(self, q, evals=None):
+        """
+        Quantil q (0 a 1) estimado pelo histograma. Sem `evals` retorna os
+        valores em `quantile_evals`; com `evals`, usa o ponto de
+        `quantile_evals` mais próximo à esquerda de cada avaliação.
+        """
+        cumulative = np.cumsum(self._histogram, axis=1)
+        target = q * self.count
+        index = np.argmax(cumulative >= max(target, 1e-12), axis=1)
+        rows = np.arange(len(index))
+        before = np.where(index > 0, cumulative[rows, np.maximum(index - 1, 0)], 0)
+        fraction = np.clip((target - before) / np.maximum(self._histogram[rows, index], 1), 0, 1)
+        low, high = self.value_range
+        values = self._from_log(low + (index + fraction) * (high - low) / self.n_bins)
+        if evals is None:
+            return values
+        return _step_sample(self.quantile_evals, values, np.asarray(evals))
+
+    def median(self, evals=None):
+        return self.quantile(0.5, evals)
+
+    def __getstate__(self):
+        return {'count': self.count, 'length': self.length, 'evals': self._evals, 'mean': self._mean,
+                'm2': self._m2, 'min': self._min, 'max': self._max, 'quantile_evals': self.quantile_evals,
+                'histogram': self._histogram, 'n_bins': self.n_bins, 'value_range': np.asarray(self.value_range)}
+
+    def __setstate__(self, state):
+        self.count, self.length = int(state['count']), int(state['length'])
+        self._evals, self._mean, self._m2 = state['evals'], state['mean'], state['m2']
+        self._min, self._max = state['min'], state['max']
+        self.quantile_evals, self._histogram = state['quantile_evals'], state['histogram']
+        self.n_bins, self.value_range = int(state['n_bins']), tuple(state['value_range'])
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"ConvergenceAggregator(execucoes={self.count}, avaliacoes={self.length}, pontos_de_mudanca={len(self._evals)})"
@@ -2,18 +2,21 @@
 import numpy as np
 from powell_cdeepso import c_deepso_powell_global_best_com_kmeans, c_deepso, c_deepso_powell_global_best_paralelo
 from deap import base, creator, tools, algorithms
-from functools import partial
+from functools import partial, lru_cache
 from functions import shifted_rosenbrock, schwefel_1_2, griewank, shifted_ackley, elliptic_function
-from cec2013lsgo.cec2013 import Benchmark
 
 def deap_func(particle):
   return elliptic_function(particle)
 
-bench = Benchmark()
+# O Benchmark é criado no primeiro uso, e não ao importar o módulo, para que
+# processos que só importam este arquivo não paguem a inicialização
+@lru_cache(maxsize=None)
+def obter_bench():
+    from cec2013lsgo.cec2013 import Benchmark
+    return Benchmark()
 
-fun_fitness = bench.get_function(2)
 def rastrigin_shifted(sol):
-    return fun_fitness(sol)
+    return obter_bench().get_function(2)(sol)
 
 def function_ambigua(sol):
     fun_fitness = rastrigin_shifted
@@ -30,7 +33,7 @@ def evaluate_weights(weights, function, dimension, swarmSize, lowerBound, upperB
     type_val = types[int(round(type_idx * 2))]
 
     best_fitness, _, _, _, _, _, _, _, _, _ = c_deepso_powell_global_best_paralelo(function, dimension, swarmSize, lowerBound, upperBound, max_fun_evals=max_fun_evals, W_i=W_i, W_a=W_a, W_c=W_c, T_com=T_com, T_mut=T_mut, type=type_val)
-    bench.next_run()
+    obter_bench().next_run()
     return best_fitness,
 
 def custom_crossover(ind1, ind2, alpha=0.5):
@@ -0,0 +1,92 @@
+import numpy as np
+
+
+class DispersionMonitor:
+    """
+    Dispersão do enxame como nas variantes _com_kmeans: distância média de
+    cada partícula ao centro do seu cluster em um agrupamento 2-means.
+
+    Reproduz `KMeans(n_clusters=2, n_init=10)` sem o custo fixo do sklearn
+    por chamada: `n_init` inicializações (semeadura k-means++) são levadas
+    até a convergência de Lloyd e fica a de menor inércia. Os centros da
+    chamada anterior entram como uma das inicializações; sozinhos eles não
+    bastam, porque o enxame encolhe entre verificações e o Lloyd a partir
+    deles fica preso em agrupamentos piores (dispersão superestimada). As
+    distâncias saem de um produto (N, D) x (D, 2), sem laço em Python por
+    partícula.
+
+    Parameters
+    ----------
+    n_init : int
+        Número de inicializações por chamada (como `n_init` do KMeans).
+    max_iter : int
+        Máximo de iterações de Lloyd por inicialização.
+    rng : numpy.random.Generator, opcional
+        Usado para a semeadura k-means++.
+    """
+
+    def __init__(self, n_init=10, max_iter=100, rng=None):
+        self.n_init = n_init
+        self.max_iter = max_iter
+        self.rng = np.random.default_rng(rng)
+        self.centers = None
+        self.labels = None
+
+    @staticmethod
+    def _squared_distances(positions, squared_norms, centers):
+        # ||x - c||² = ||x||² - 2 x·c + ||c||²
+        distances = positions @ centers.T
+        distances *= -2
+        distances += squared_norms[:, np.newaxis]
+        distances += np.einsum('ij,ij->i', centers, centers)
+        return np.maximum(distances, 0, out=distances)
+
+    def _seed(self, positions, squared_norms):
+        # k-means++: primeiro centro uniforme, segundo sorteado com peso na distância² ao primeiro
+        first = positions[self.rng.integers(len(positions))]
+        weights = self._squared_distances(positions, squared_norms, first[np.newaxis])[:, 0]
+        total = weights.sum()
+        second = positions[self.rng.choice(len(positions), p=weights / total)] if total > 0 else first
+        return np.stack([first, second])
+
+    def _lloyd(self, positions, squared_norms, centers):
+        labels = None
+        for _ in range(self.max_iter):
+            distances = self._squared_distances(positions, squared_norms, centers)
+            new_labels = np.argmin(distances, axis=1)
+            if labels is not None and np.array_equal(new_labels, labels):
+                break
+            labels = new_labels
+            for cluster in range(2):
+                members = labels == cluster
+                if np.any(members):
+                    centers[cluster] = positions[members].mean(axis=0)
+                else:
+                    # Cluster vazio: recomeça no ponto mais distante do seu centro atual
+                    centers[cluster] = positions[np.argmax(distances[np.arange(len(positions)), labels])]
+        distances = self._squared_distances(positions, squared_norms, centers)
+        labels = np.argmin(distances, axis=1)
+        closest = distances[np.arange(len(positions)), labels]
+        return centers, labels, closest
+
+    def __call__(self, positions):
+        positions = np.asarray(positions, dtype=np.float64)
+        squared_norms = np.einsum('ij,ij->i', positions, positions)
+
+        starts = [self._seed(positions, squared_norms) for _ in range(self.n_init)]
+        if self.centers is not None and self.centers.shape[1] == positions.shape[1]:
+            starts[-1] = self.centers.copy()
+
+        best_inertia = np.inf
+        for centers in starts:
+            centers, labels, closest = self._lloyd(positions, squared_norms, centers)
+            inertia = closest.sum()
+            if inertia < best_inertia:
+                best_inertia = inertia
+                self.centers, self.labels, best_closest = centers, labels, closest
+
+        return float(np.mean(np.sqrt(best_closest)))
+
+    def reset(self):
+        self.centers = None
+        self.labels = None
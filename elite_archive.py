@@ -0,0 +1,133 @@
+import heapq
+import numpy as np
+
+
+class EliteArchive:
+    """
+    Memória de capacidade fixa com as melhores posições já avaliadas (os
+    "10% melhores" das estratégias 'pb' e 'sgpb').
+
+    As posições ficam em uma matriz (capacity, D) pré-alocada e um heap de
+    máximo com (-fitness, slot) aponta o pior elemento guardado, que é o
+    substituído quando chega um ponto melhor. Pontos repetidos (mesmo hash
+    dos bytes da posição) não entram duas vezes.
+
+    Parameters
+    ----------
+    capacity : int
+        Quantidade máxima de posições guardadas.
+    dimension : int
+        Dimensão das posições.
+    """
+
+    def __init__(self, capacity, dimension):
+        self.capacity = capacity
+        self.positions = np.empty((capacity, dimension))
+        self.fitness = np.full(capacity, np.inf)
+        self.size = 0
+        self._heap = []
+        self._hashes = [None] * capacity
+        self._hash_set = set()
+
+    def __len__(self):
+        return self.size
+
+    @property
+    def worst_fitness(self):
+        """Fitness que um ponto precisa superar para entrar (inf enquanto houver vaga)."""
+        if self.size < self.capacity:
+            return np.inf
+        return -self._heap[0][0]
+
+    @staticmethod
+    def _hash(position):
+        return hash(np.ascontiguousarray(position).tobytes())
+
+    def _store(self, slot, fitness, position, key):
+        self._hash_set.discard(self._hashes[slot])
+        self.positions[slot] = position
+        self.fitness[slot] = fitness
+        self._hashes[slot] = key
+        self._hash_set.add(key)
+
+    def add(self, fitness, position):
+        """Insere um único ponto em O(D + log k). Devolve True se ele entrou."""
+        if not fitness < self.worst_fitness:
+            return False
+        key = self._hash(position)
+        if key in self._hash_set:
+            return False
+        if self.size < self.capacity:
+            slot = self.size
+            self.size += 1
+            self._store(slot, fitness, position, key)
+            heapq.heappush(self._heap, (-fitness, slot))
+        else:
+            slot = self._heap[0][1]
+            self._store(slot, fitness, position, key)
+            heapq.heapreplace(self._heap, (-fitness, slot))
+        return True
+
+    def merge(self, fitness, positions):
+        """
+        Funde um lote (N,) / (N, D) de pontos avaliados. Só os melhores que o
+        pior guardado são considerados (filtro vetorizado); entre eles e o
+        arquivo ficam os `capacity` melhores, escolhidos por argpartition, e o
+        heap é refeito em O(k). Devolve quantos pontos do lote entraram.
+        """
+        fitness = np.asarray(fitness, dtype=np.float64)
+        candidates = np.flatnonzero(fitness < self.worst_fitness)
+        if len(candidates) == 0:
+            return 0
+
+        # Descarta repetidos do arquivo e do próprio lote
+        unique, keys = [], []
+        batch_keys = set()
+        for index in candidates:
+            key = self._hash(positions[index])
+            if key in self._hash_set or key in batch_keys:
+                continue
+            batch_keys.add(key)
+            unique.append(index)
+            keys.append(key)
+        if not unique:
+            return 0
+        unique = np.asarray(unique)
+        new_fitness = fitness[unique]
+
+        # Os k melhores entre o arquivo e os novos: novos ocupam as vagas
+        # livres e depois os slots dos que saíram
+        merged_fitness = np.concatenate([self.fitness[:self.size], new_fitness])
+        new_size = min(self.capacity, len(merged_fitness))
+        keep = np.argpartition(merged_fitness, new_size - 1)[:new_size] if len(merged_fitness) > new_size \
+            else np.arange(new_size)
+        kept_new = keep[keep >= self.size] - self.size
+        evicted_slots = np.setdiff1d(np.arange(self.size), keep[keep < self.size])
+        target_slots = np.concatenate([evicted_slots, np.arange(self.size, new_size)])
+
+        for slot, index in zip(target_slots.tolist(), kept_new.tolist()):
+            self._store(slot, new_fitness[index], positions[unique[index]], keys[index])
+        self.size = new_size
+        self._heap = [(-value, slot) for slot, value in enumerate(self.fitness[:self.size].tolist())]
+        heapq.heapify(self._heap)
+        return len(kept_new)
+
+    def sample_indices(self, rng, n):
+        """`n` slots sorteados uniformemente entre os ocupados."""
+        return rng.integers(0, self.size, size=n)
+
+    def sample(self, rng, n=None):
+        """
+        Posições sorteadas do arquivo: uma (D,) se `n` for None, senão uma
+        matriz (n, D). A posição única é uma visão da matriz interna.
+        """
+        if n is None:
+            return self.positions[rng.integers(self.size)]
+        return self.positions[self.sample_indices(rng, n)]
+
+    def state_dict(self):
+        return {'positions': self.positions[:self.size].copy(), 'fitness': self.fitness[:self.size].copy()}
+
+    def load_state_dict(self, state):
+        self.__init__(self.capacity, self.positions.shape[1])
+        self.merge(state['fitness'], state['positions'])
@@ -0,0 +1,123 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+
+
+class EvaluationCache:
+    """
+    Memória LRU de avaliações do objetivo, indexada pelo hash dos bytes
+    float64 do ponto.
+
+    Evita reavaliar pontos que o algoritmo já pontuou, como o x devolvido
+    pelo Powell (avaliado dentro da última busca linear) ou partículas presas
+    nos limites, que ficam iguais entre iterações.
+
+    Parameters
+    ----------
+    function : callable
+        Objetivo; recebe um ponto (D,) ou uma matriz (N, D).
+    max_size : int
+        Quantidade máxima de pontos guardados; o menos usado sai primeiro.
+    count_hits : bool
+        Política de orçamento. Com True (padrão) um acerto ainda conta como
+        avaliação de função e só a chamada ao objetivo é economizada, então as
+        curvas de convergência continuam comparáveis. Com False apenas pontos
+        novos consomem o orçamento.
+    """
+
+    def __init__(self, function, max_size=100_000, count_hits=True):
+        self.function = function
+        self.max_size = max_size
+        self.count_hits = count_hits
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+
+    @staticmethod
+    def key(x):
+        data = np.ascontiguousarray(x, dtype=np.float64).tobytes()
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def get(self, x):
+        """Valor guardado para `x`, ou None, atualizando os contadores."""
+        return self._lookup(self.key(x))
+
+    def put(self, x, value):
+        self._store(self.key(x), value)
+
+    def _lookup(self, key):
+        value = self._values.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._values.move_to_end(key)
+        return value
+
+    def _store(self, key, value):
+        self._values[key] = value
+        self._values.move_to_end(key)
+        if len(self._values) > self.max_size:
+            self._values.popitem(last=False)
+
+    def evaluate_batch(self, points, budget=None, values=None):
+        """
+        Avalia as linhas de `points` consultando a memória; os pontos novos
+        são avaliados em uma única chamada ao objetivo.
+
+        `budget` limita quantas avaliações podem ser contabilizadas (segundo
+        `count_hits`): as linhas além do orçamento são descartadas. `values`
+        permite informar valores já calculados (ex.: pelo objetivo incremental).
+
+        Retorna (valores, contabilizados), em que `contabilizados` é uma máscara
+        booleana das linhas que consomem o orçamento.
+        """
+        points = np.asarray(points, dtype=np.float64)
+        keys = [self.key(p) for p in points]
+        cached = [self._values.get(k) for k in keys]
+        hit = np.array([v is not None for v in cached], dtype=bool)
+        counted = np.ones(len(points), dtype=bool) if self.count_hits else ~hit
+
+        n = len(points)
+        if budget is not None:
+            n = min(n, budget) if self.count_hits else int(np.searchsorted(np.cumsum(counted), budget, side='right'))
+        hit, counted, keys, cached = hit[:n], counted[:n], keys[:n], cached[:n]
+
+        results = np.empty(n)
+        if np.any(hit):
+            results[hit] = [v for v, h in zip(cached, hit) if h]
+            for k, h in zip(keys, hit):
+                if h:
+                    self._values.move_to_end(k)
+        miss = ~hit
+        if np.any(miss):
+            if values is None:
+                results[miss] = self.function(points[:n][miss])
+            else:
+                results[miss] = np.asarray(values)[:n][miss]
+            for k, value in zip([k for k, m in zip(keys, miss) if m], results[miss].tolist()):
+                self._store(k, value)
+        self.hits += int(hit.sum())
+        self.misses += int(miss.sum())
+        return results, counted
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 2:
+            return self.evaluate_batch(x)[0]
+        value = self.get(x)
+        if value is None:
+            value = self.function(x)
+            self.put(x, value)
+        return value
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._values),
+                'hit_rate': self.hits / total if total else 0.0}
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f"EvaluationCache(acertos={self.hits}, falhas={self.misses}, tamanho={len(self._values)})"
@@ -0,0 +1,77 @@
+import sys
+import os
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pandas as pd
+from scipy_functions import _line_for_search, _minimize_scalar_bounded
+from cec2013lsgo.cec2013 import Benchmark
+
+# Compara o custo por busca linear (avaliações de função) entre a seção áurea
+# pura e o modo Brent (com interpolação parabólica) nas funções do CEC2013 LSGO.
+# As duas variantes percorrem as mesmas direções coordenadas a partir do mesmo
+# ponto inicial, como na primeira varredura do Powell.
+
+METODOS = ['golden', 'brent']
+BUSCAS_POR_FUNCAO = 50
+TOLERANCIA = 1e-4
+SEMENTE = 42
+
+
+def compara_funcao(bench, function_id, rng):
+    info = bench.get_info(function_id)
+    dimension = info['dimension']
+    lower_bound, upper_bound = info['lower'], info['upper']
+    fun_fitness = bench.get_function(function_id)
+
+    lower_bound_array = np.full(dimension, lower_bound)
+    upper_bound_array = np.full(dimension, upper_bound)
+    x0 = rng.uniform(lower_bound, upper_bound, dimension)
+    coordenadas = rng.choice(dimension, size=BUSCAS_POR_FUNCAO, replace=False)
+
+    linhas = []
+    for metodo in METODOS:
+        x = x0.copy()
+        avaliacoes = []
+        inicio = time.perf_counter()
+        for i in coordenadas:
+            direction = np.zeros(dimension)
+            direction[i] = 1.0
+
+            def f1d(alpha):
+                return fun_fitness(x + alpha * direction)
+
+            bound = _line_for_search(x, direction, lower_bound_array, upper_bound_array)
+            res = _minimize_scalar_bounded(f1d, bound, None, None, xatol=TOLERANCIA, method=metodo)
+            avaliacoes.append(res.nfev)
+            x = x + res.x * direction
+        tempo = time.perf_counter() - inicio
+
+        linhas.append({
+            'Funcao': f'f{function_id}',
+            'Metodo': metodo,
+            'Aval_Media_Por_Busca': np.mean(avaliacoes),
+            'Aval_Max_Por_Busca': np.max(avaliacoes),
+            'Fitness_Inicial': fun_fitness(x0),
+            'Fitness_Final': fun_fitness(x),
+            'Tempo_s': tempo,
+        })
+    return linhas
+
+
+def main():
+    bench = Benchmark()
+    rng = np.random.default_rng(SEMENTE)
+    resultados = []
+    for function_id in range(1, 16):
+        resultados.extend(compara_funcao(bench, function_id, rng))
+
+    df = pd.DataFrame(resultados)
+    print(df.to_string(index=False))
+    df.to_csv('comparacao_busca_linear_golden_brent.csv', index=False)
+
+
+if __name__ == "__main__":
+    main()
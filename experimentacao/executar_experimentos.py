@@ -0,0 +1,445 @@
+import sys
+import os
+import gc
+import argparse
+import traceback
+import itertools
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+from tqdm import tqdm
+from powell_cdeepso import c_deepso, c_deepso_vetorizado, c_deepso_powell_global_best_paralelo, c_deepso_powell_global_best_paralelo_powell_varias_vezes, \
+    c_deepso_powell_global_best_paralelo_multi
+from cec2013 import Benchmark as BenchmarkVetorizado
+from result_store import ResultStore, config_hash
+from convergence_trace import ConvergenceAggregator
+from checkpoint import remove_checkpoint
+from powell_schedule import FixedWindows
+from instrumentation import PhaseProfiler, merge_summaries
+
+# Executor único dos experimentos do CEC2013 LSGO. Substitui as cópias de
+# experimentacao/fN_*/experimento_cec_2013_paralelo_v3.py: cada execução
+# (função, algoritmo, configuração, semente) vira um job, e todos os jobs são
+# distribuídos em um único ProcessPoolExecutor do tamanho da máquina. Um
+# processo livre pega o próximo job da fila, seja de qual função for. Cada
+# execução é gravada no ResultStore (result_store.py) assim que termina; as
+# tabelas e gráficos leem de lá.
+#
+# Uso:
+#   py experimentacao/executar_experimentos.py                   # f1-f15, 25 execuções
+#   py experimentacao/executar_experimentos.py --funcoes f4 f12 --execucoes 5 --processos 8
+#   py experimentacao/executar_experimentos.py --backend vetorizado  # funções em lote de cec2013.py
+
+# Parâmetros ajustados de cada função (os mesmos dos scripts antigos)
+FUNCOES = {
+    'f1': {'func_name': 'f1_shifted_elliptic', 'function_id': 1, 'algoritmo': 'pcdeepso', 'type': 'pb',
+           'wi': 0.4368630866211771, 'wa': 0.7690867852140901, 'wc': 0.8088438134663797, 'tcom': 0.9, 'tmut': 0.8},
+    'f2': {'func_name': 'f2_rastrigin_shifted', 'function_id': 2, 'algoritmo': 'pcdeepso_varias_vezes', 'type': 'pb',
+           'wi': 0.7322971688739066, 'wa': 0.6330031488665199, 'wc': 0.6860463501882008, 'tcom': 0.08770720967616713, 'tmut': 0.1},
+    'f3': {'func_name': 'f3_ackley_shifted', 'function_id': 3, 'algoritmo': 'pcdeepso', 'type': 'pb',
+           'wi': 0.5134421262618705, 'wa': 0.6697432209120159, 'wc': 0.2052748212508989, 'tcom': 0.6959287765030406, 'tmut': 0.3683112445711794},
+    'f4': {'func_name': 'f4_shifted_rotated_elliptic', 'function_id': 4, 'algoritmo': 'pcdeepso', 'type': 'pb',
+           'wi': 0.4368630866211771, 'wa': 0.7690867852140901, 'wc': 0.8088438134663797, 'tcom': 0.9, 'tmut': 0.8},
+    'f5': {'func_name': 'f5_shifted_rotated_rastrigin', 'function_id': 5, 'algoritmo': 'pcdeepso', 'type': 'pb',
+           'wi': 0.5222947486984788, 'wa': 0.7696602940023987, 'wc': 0.5645242118929356, 'tcom': 0.7974737271677088, 'tmut': 0.8265299136203416},
+    'f6': {'func_name': 'f6_shifted_rotated_ackley', 'function_id': 6, 'algoritmo': 'pcdeepso', 'type': 'pb',
+           'wi': 0.5134421262618705, 'wa': 0.6697432209120159, 'wc': 0.2052748212508989, 'tcom': 0.6959287765030406, 'tmut': 0.3683112445711794},
+    'f7': {'func_name': 'f7_schwefel_shifted', 'function_id': 7, 'algoritmo': 'pcdeepso', 'type': 'pb',
+           'wi': 0.5027513463314259, 'wa': 0.4545571384949152, 'wc': 0.09256640183471483, 'tcom': 0.5824297073660111, 'tmut': 0.3389945529796813},
+    'f8': {'func_name': 'f8_shifted_rotated_elliptic', 'function_id': 8, 'algoritmo': 'pcdeepso', 'type': 'pb',
+           'wi': 0.4368630866211771, 'wa': 0.7690867852140901, 'wc': 0.8088438134663797, 'tcom': 0.9, 'tmut': 0.8},
+    'f9': {'func_name': 'f9_shifted_rotated_rastrigin', 'function_id': 9, 'algoritmo': 'pcdeepso', 'type': 'pb',
+           'wi': 0.5222947486984788, 'wa': 0.7696602940023987, 'wc': 0.5645242118929356, 'tcom': 0.7974737271677088, 'tmut': 0.8265299136203416},
+    'f10': {'func_name': 'f10_shifted_rotated_ackley', 'function_id': 10, 'algoritmo': 'pcdeepso', 'type': 'pb',
+            'wi': 0.5134421262618705, 'wa': 0.6697432209120159, 'wc': 0.2052748212508989, 'tcom': 0.6959287765030406, 'tmut': 0.3683112445711794},
+    'f11': {'func_name': 'f11_schwefel_shifted', 'function_id': 11, 'algoritmo': 'pcdeepso', 'type': 'pb',
+            'wi': 0.5027513463314259, 'wa': 0.4545571384949152, 'wc': 0.09256640183471483, 'tcom': 0.5824297073660111, 'tmut': 0.3389945529796813},
+    'f12': {'func_name': 'f12_rosenbrock_shifted', 'function_id': 12, 'algoritmo': 'pcdeepso_varias_vezes', 'type': 'sgpb',
+            'wi': 0.4019092098808389, 'wa': 0.3791940368874607, 'wc': 0.7539312405916303, 'tcom': 0.5819630448962767, 'tmut': 0.3},
+    'f13': {'func_name': 'f13_schwefel_overlapping', 'function_id': 13, 'algoritmo': 'pcdeepso', 'type': 'pb',
+            'wi': 0.5027513463314259, 'wa': 0.4545571384949152, 'wc': 0.09256640183471483, 'tcom': 0.5824297073660111, 'tmut': 0.3389945529796813},
+    'f14': {'func_name': 'f14_schwefel_overlapping', 'function_id': 14, 'algoritmo': 'pcdeepso', 'type': 'pb',
+            'wi': 0.5027513463314259, 'wa': 0.4545571384949152, 'wc': 0.09256640183471483, 'tcom': 0.5824297073660111, 'tmut': 0.3389945529796813},
+    'f15': {'func_name': 'f15_schwefel_shifted', 'function_id': 15, 'algoritmo': 'pcdeepso', 'type': 'pb',
+            'wi': 0.7601374184595595, 'wa': 0.8084690823927974, 'wc': 0.2824122187779847, 'tcom': 0.3615837327210485, 'tmut': 0.053761197887066764},
+}
+
+# Nome do algoritmo -> (função, rótulo usado nas tabelas e gráficos)
+ALGORITMOS = {
+    'pcdeepso': (c_deepso_powell_global_best_paralelo, 'pcdeepso'),
+    'pcdeepso_varias_vezes': (c_deepso_powell_global_best_paralelo_powell_varias_vezes, 'pcdeepso'),
+    'cdeepso': (c_deepso, 'cdeepso'),
+    'cdeepso_vetorizado': (c_deepso_vetorizado, 'cdeepso'),
+}
+
+# Variantes sem Powell, que devolvem a tupla curta de c_deepso
+ALGORITMOS_SEM_POWELL = {'cdeepso', 'cdeepso_vetorizado'}
+
+# Variantes que gravam checkpoints e retomam uma execução interrompida
+ALGORITMOS_CHECKPOINT = {'pcdeepso'}
+
+# Variantes que aceitam `profiler` (tempo e avaliações por fase, com --perfil)
+ALGORITMOS_PERFIL = {'pcdeepso'}
+
+# Avaliações entre checkpoints
+CHECKPOINT_EVALS = 100_000
+
+# Variantes que podem rodar várias sementes como um único tensor (R, N, D) (opção --lote)
+ALGORITMOS_LOTE = {
+    'pcdeepso': c_deepso_powell_global_best_paralelo_multi,
+}
+
+# Configuração comum a todas as funções; cada configuração nomeada sobrescreve estes valores
+CONFIGURACAO_PADRAO = {
+    'swarm_size': 500,
+    'percent_powell_start_moment': 0.5,
+    'percent_powell_func_evals': 0.1,
+    'max_v': 1.01,
+    'max_fun_evals': 3_000_000,
+    'max_iter': None,
+    # 'cec2013': janelas fixas em 60k/360k/1,8M avaliações; 'proporcional': as
+    # mesmas janelas como frações de max_fun_evals (para outros orçamentos)
+    'agendamento_powell': 'cec2013',
+    # 'cec2013lsgo': pacote de referência, um ponto por chamada (como os scripts
+    # antigos); 'vetorizado': as funções em lote de cec2013.py. No vetorizado a
+    # f13/f14 tem 905 variáveis em vez das 1000 de get_info do pacote
+    'backend': 'cec2013lsgo',
+}
+
+# Objetivos já montados neste processo, para não reler os arquivos de dados a cada job
+_objetivos = {}
+
+
+class _ObjetivoReferencia:
+    """Função do pacote cec2013lsgo que também aceita um enxame (N, D), avaliado ponto a ponto."""
+
+    def __init__(self, function_id):
+        from cec2013lsgo.cec2013 import Benchmark
+
+        benchmark = Benchmark()
+        self.function = benchmark.get_function(function_id)
+        self.info = benchmark.get_info(function_id)
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        if x.ndim == 2:
+            return np.array([self.function(np.ascontiguousarray(ponto)) for ponto in x])
+        return self.function(x)
+
+    def get_info(self):
+        return dict(self.info)
+
+
+def obter_objetivo(function_id, backend='cec2013lsgo'):
+    if (backend, function_id) not in _objetivos:
+        if backend == 'cec2013lsgo':
+            _objetivos[backend, function_id] = _ObjetivoReferencia(function_id)
+        else:
+            _objetivos[backend, function_id] = BenchmarkVetorizado().get_function(function_id)
+    return _objetivos[backend, function_id]
+
+
+def gerar_jobs(funcoes=None, algoritmos=None, configuracoes=None, execucoes=25, entropia=0):
+    """
+    Matriz de jobs (função x algoritmo x configuração x semente).
+
+    `algoritmos` None usa o algoritmo padrão de cada função. `configuracoes` é
+    um dicionário {nome: parâmetros que sobrescrevem os padrões}. As sementes
+    ficam no laço externo, então as funções avançam juntas na fila.
+
+    A execução `seed` recebe o filho `seed` de SeedSequence(entropia), o mesmo
+    de `SeedSequence(entropia).spawn(execucoes)[seed]`: os fluxos são
+    independentes entre execuções e iguais entre funções, algoritmos e
+    configurações (números aleatórios comuns).
+    """
+    funcoes = list(FUNCOES) if funcoes is None else funcoes
+    configuracoes = {'padrao': {}} if configuracoes is None else configuracoes
+    jobs = []
+    for seed, funcao, nome_configuracao in itertools.product(range(execucoes), funcoes, configuracoes):
+        for algoritmo in (algoritmos or [FUNCOES[funcao]['algoritmo']]):
+            jobs.append({'funcao': funcao, 'algoritmo': algoritmo, 'configuracao': nome_configuracao,
+                         'parametros': {**CONFIGURACAO_PADRAO, **FUNCOES[funcao], **configuracoes[nome_configuracao]},
+                         'seed': seed, 'entropia': entropia,
+                         'seed_sequence': np.random.SeedSequence(entropia, spawn_key=(seed,))})
+    return jobs
+
+
+def run_id(job):
+    # O hash dos parâmetros separa execuções de uma configuração que mudou de valores sem mudar de nome
+    parametros = job['parametros']
+    return f"{parametros['func_name']}_{job['algoritmo']}_{job['configuracao']}_{config_hash(parametros)}_{job['seed']}"
+
+
+def montar_registro(job, info, resultado):
+    parametros = job['parametros']
+    return {'run_id': run_id(job), 'func_name': parametros['func_name'], 'function_id': parametros['function_id'],
+            'dimension': info['dimension'], 'algoritmo': ALGORITMOS[job['algoritmo']][1],
+            'variante': job['algoritmo'], 'configuracao': job['configuracao'],
+            'config_hash': config_hash(parametros), 'seed': job['seed'], 'entropia': job['entropia'],
+            'parametros': parametros, **resultado}
+
+
+def caminho_checkpoint(job, pasta_resultados):
+    return os.path.join(pasta_resultados, 'checkpoints', f"{run_id(job)}.npz")
+
+
+def executar_job(job, pasta_resultados):
+    """
+    Executa uma única execução (roda em um processo do pool) e grava a curva
+    no ResultStore. As variantes de ALGORITMOS_CHECKPOINT gravam checkpoints
+    em <pasta_resultados>/checkpoints e retomam deles; o checkpoint é apagado
+    quando a execução é gravada.
+    """
+    parametros = job['parametros']
+    func_name = parametros['func_name']
+    id_execucao = job['seed']
+    g_best_list = None
+    try:
+        function = obter_objetivo(parametros['function_id'], parametros['backend'])
+        info = function.get_info()
+        algoritmo = ALGORITMOS[job['algoritmo']][0]
+        opcoes = dict(max_iter=parametros['max_iter'], max_fun_evals=parametros['max_fun_evals'],
+                      type=parametros['type'], W_i=parametros['wi'], W_a=parametros['wa'], W_c=parametros['wc'],
+                      T_mut=parametros['tmut'], T_com=parametros['tcom'], max_v=parametros['max_v'],
+                      rng=np.random.default_rng(job['seed_sequence']))
+        resultado = {'best_fitness': None, 'function_evals': None,
+                     'g_best_fitness_before_powell': None, 'g_best_fitness_after_powell': None}
+        # Marcos registrados pelo motor; sem eles (variantes sem Powell) saem da curva
+        marcos = None
+        if job['algoritmo'] in ALGORITMOS_SEM_POWELL:
+            best_fitness, g_best, g_best_list, _, _, function_evals = algoritmo(
+                function, info['dimension'], parametros['swarm_size'], info['lower'], info['upper'], **opcoes)
+        else:
+            if job['algoritmo'] == 'pcdeepso' and parametros.get('agendamento_powell') == 'proporcional':
+                opcoes['powell_schedule'] = FixedWindows.proportional(parametros['max_fun_evals'],
+                                                                      parametros['percent_powell_func_evals'])
+            if job['algoritmo'] in ALGORITMOS_CHECKPOINT:
+                opcoes.update(checkpoint_path=caminho_checkpoint(job, pasta_resultados), checkpoint_every=CHECKPOINT_EVALS)
+            profiler = None
+            if job.get('perfil') and job['algoritmo'] in ALGORITMOS_PERFIL:
+                profiler = opcoes['profiler'] = PhaseProfiler()
+            best_fitness, g_best, g_best_list, _, _, function_evals, g_best_fitness_120k_evals, g_best_fitness_600k_evals, g_best_fitness_before_powell, g_best_fitness_after_powell = algoritmo(
+                function, info['dimension'], parametros['swarm_size'], info['lower'], info['upper'], id_execucao,
+                percent_powell_start_moment=parametros['percent_powell_start_moment'],
+                percent_powell_func_evals=parametros['percent_powell_func_evals'], **opcoes)
+            marcos = {120_000: g_best_fitness_120k_evals, 600_000: g_best_fitness_600k_evals}
+            resultado.update(g_best_fitness_before_powell=g_best_fitness_before_powell,
+                             g_best_fitness_after_powell=g_best_fitness_after_powell)
+            if profiler is not None:
+                resultado['perfil'] = profiler.summary()
+        resultado.update(best_fitness=float(best_fitness), function_evals=int(function_evals))
+        record = ResultStore(pasta_resultados).write_run(montar_registro(job, info, resultado), g_best_list, g_best,
+                                                         milestone_values=marcos)
+        remove_checkpoint(caminho_checkpoint(job, pasta_resultados))
+        return record
+    except Exception as e:
+        # Loga o erro e a stack trace em um arquivo
+        with open("error_log_experimento.txt", "a") as log_file:
+            log_file.write(f"Erro durante a execução do experimento {func_name} (semente {job['seed']}): {str(e)}\n")
+            traceback.print_exc(file=log_file)
+            log_file.write("\n")
+        raise e
+    finally:
+        del g_best_list
+        gc.collect()
+
+
+def executar_lote(jobs, pasta_resultados):
+    """
+    Executa várias sementes do mesmo grupo (função, algoritmo, configuração)
+    de uma vez com a variante em tensor de ALGORITMOS_LOTE. Cada semente
+    alimenta o gerador da sua execução. Retorna um registro por job.
+    """
+    parametros = jobs[0]['parametros']
+    try:
+        function = obter_objetivo(parametros['function_id'], parametros['backend'])
+        info = function.get_info()
+        opcoes = {}
+        if parametros.get('agendamento_powell') == 'proporcional':
+            # Copiado para cada execução do lote
+            opcoes['powell_schedule'] = FixedWindows.proportional(parametros['max_fun_evals'],
+                                                                  parametros['percent_powell_func_evals'])
+        resultados = ALGORITMOS_LOTE[jobs[0]['algoritmo']](
+            function, info['dimension'], parametros['swarm_size'], info['lower'], info['upper'], len(jobs),
+            seeds=[job['seed_sequence'] for job in jobs], percent_powell_func_evals=parametros['percent_powell_func_evals'],
+            max_iter=parametros['max_iter'], max_fun_evals=parametros['max_fun_evals'], type=parametros['type'],
+            W_i=parametros['wi'], W_a=parametros['wa'], W_c=parametros['wc'], T_mut=parametros['tmut'],
+            T_com=parametros['tcom'], max_v=parametros['max_v'], **opcoes)
+        store = ResultStore(pasta_resultados)
+        records = []
+        for job, (best_fitness, g_best, g_best_list, _, _, function_evals, g_best_fitness_120k_evals, g_best_fitness_600k_evals,
+                  g_best_fitness_before_powell, g_best_fitness_after_powell) in zip(jobs, resultados):
+            resultado = {'best_fitness': float(best_fitness), 'function_evals': int(function_evals),
+                         'g_best_fitness_before_powell': g_best_fitness_before_powell,
+                         'g_best_fitness_after_powell': g_best_fitness_after_powell}
+            marcos = {120_000: g_best_fitness_120k_evals, 600_000: g_best_fitness_600k_evals}
+            records.append(store.write_run(montar_registro(job, info, resultado), g_best_list, g_best,
+                                           milestone_values=marcos))
+        return records
+    except Exception as e:
+        with open("error_log_experimento.txt", "a") as log_file:
+            log_file.write(f"Erro durante o lote {parametros['func_name']} (sementes {[job['seed'] for job in jobs]}): {str(e)}\n")
+            traceback.print_exc(file=log_file)
+            log_file.write("\n")
+        raise e
+    finally:
+        gc.collect()
+
+
+def agrupar_em_lotes(jobs, lote):
+    """Junta até `lote` sementes de cada grupo das variantes de ALGORITMOS_LOTE; os demais jobs ficam sozinhos."""
+    grupos = {}
+    for job in jobs:
+        chave = (job['funcao'], job['algoritmo'], job['configuracao']) if job['algoritmo'] in ALGORITMOS_LOTE else id(job)
+        grupos.setdefault(chave, []).append(job)
+    tarefas = []
+    for chave, grupo in grupos.items():
+        tamanho = lote if isinstance(chave, tuple) else 1
+        tarefas.extend(grupo[i:i + tamanho] for i in range(0, len(grupo), tamanho))
+    return tarefas
+
+
+def gravar_perfis(store, pasta_resultados):
+    """
+    Soma os perfis por fase das execuções gravadas com --perfil em cada grupo
+    (função, algoritmo, configuração) e grava <pasta_resultados>/perfil_fases.json.
+    """
+    grupos = {}
+    for record in store.records():
+        if record.get('perfil'):
+            chave = f"{record['func_name']}/{record['algoritmo']}/{record['configuracao']}"
+            grupos.setdefault(chave, []).append(record['perfil'])
+    if not grupos:
+        return None
+    perfis = {chave: merge_summaries(resumos) for chave, resumos in grupos.items()}
+    caminho = os.path.join(pasta_resultados, 'perfil_fases.json')
+    with open(caminho, 'w') as arquivo:
+        json.dump(perfis, arquivo, indent=2)
+    return caminho
+
+
+def executar_jobs(jobs, processos=None, pasta_resultados='resultados', lote=1, perfil=False):
+    """
+    Executa todos os jobs em um único pool com `processos` workers (padrão:
+    todos os núcleos) e registra cada execução no índice do ResultStore
+    assim que ela termina. A curva de cada execução é incorporada na hora ao
+    ConvergenceAggregator do seu grupo, gravado quando o grupo termina, então
+    o processo principal nunca guarda mais de uma curva por vez.
+    Com `lote` > 1, até `lote` sementes do mesmo grupo rodam juntas em um
+    único processo (executar_lote), em vez de um processo por execução.
+
+    Jobs já gravados no índice são pulados, então rodar de novo o mesmo
+    comando depois de uma interrupção executa só o que faltou (retomando dos
+    checkpoints, quando houver). Um job que falha é registrado e não
+    interrompe os outros.
+    Com `perfil` as variantes de ALGORITMOS_PERFIL registram tempo e
+    avaliações por fase em cada execução, somados em perfil_fases.json.
+    Retorna o resumo por marco das funções executadas.
+    """
+    processos = processos or os.cpu_count()
+    store = ResultStore(pasta_resultados)
+    # Só conta como concluída a execução gravada com os mesmos parâmetros (mesmo config_hash)
+    concluidos = {(record['run_id'], record.get('config_hash')) for record in store.records()}
+    todos_jobs, jobs = jobs, [job for job in jobs if (run_id(job), config_hash(job['parametros'])) not in concluidos]
+    for job in jobs:
+        job['perfil'] = perfil
+    pendentes, hashes = {}, {}
+    for job in jobs:
+        # A variante entra na chave: cdeepso e cdeepso_vetorizado (ou pcdeepso e
+        # pcdeepso_varias_vezes) têm o mesmo rótulo, mas agregados separados
+        chave = (job['parametros']['func_name'], ALGORITMOS[job['algoritmo']][1], job['configuracao'], job['algoritmo'])
+        pendentes[chave] = pendentes.get(chave, 0) + 1
+        hashes.setdefault(chave, set()).add(config_hash(job['parametros']))
+    agregadores = {chave: ConvergenceAggregator() for chave in pendentes}
+    # Grupos retomados: o agregado também inclui as execuções já gravadas com os mesmos parâmetros
+    for record in store.records():
+        chave = (record['func_name'], record['algoritmo'], record['configuracao'], record['variante'])
+        if chave in agregadores and record.get('config_hash') in hashes[chave]:
+            agregadores[chave].add(store.load_trace(record))
+
+    def concluir(chave):
+        # Um grupo termina quando todos os seus jobs voltaram, com sucesso ou não
+        pendentes[chave] -= 1
+        if pendentes[chave] == 0:
+            agregador = agregadores.pop(chave)
+            if agregador.count > 0:
+                store.save_aggregate(agregador, *chave)
+
+    falhas = 0
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        futures = {executor.submit(executar_lote, tarefa, pasta_resultados) if len(tarefa) > 1
+                   else executor.submit(executar_job, tarefa[0], pasta_resultados): tarefa
+                   for tarefa in agrupar_em_lotes(jobs, lote)}
+        with tqdm(total=len(jobs), position=0, desc="Executando em paralelo...", unit="exec") as pbar:
+            for fut in as_completed(futures):
+                try:
+                    records = fut.result()
+                except Exception as e:
+                    # Um job que falhou não interrompe os demais; a stack trace
+                    # fica em error_log_experimento.txt (gravada pelo worker)
+                    tarefa = futures[fut]
+                    falhas += len(tarefa)
+                    tqdm.write(f"Falha em {[run_id(job) for job in tarefa]}: {e!r}")
+                    for job in tarefa:
+                        concluir((job['parametros']['func_name'], ALGORITMOS[job['algoritmo']][1],
+                                  job['configuracao'], job['algoritmo']))
+                    pbar.update(len(tarefa))
+                    continue
+                for record in (records if isinstance(records, list) else [records]):
+                    store.append(record)
+                    chave = (record['func_name'], record['algoritmo'], record['configuracao'], record['variante'])
+                    agregadores[chave].add(store.load_trace(record))
+                    concluir(chave)
+                    pbar.update(1)
+    if falhas:
+        print(f"{falhas} execuções falharam; rode o mesmo comando de novo para refazê-las")
+
+    if perfil:
+        gravar_perfis(store, pasta_resultados)
+
+    summary = store.summary()
+    func_names = {job['parametros']['func_name'] for job in todos_jobs}
+    return summary[summary['func_name'].isin(func_names)] if not summary.empty else summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Executa os experimentos do CEC2013 LSGO em um único pool de processos.")
+    parser.add_argument('--funcoes', nargs='+', default=list(FUNCOES), choices=list(FUNCOES))
+    parser.add_argument('--algoritmos', nargs='+', default=None, choices=list(ALGORITMOS),
+                        help="padrão: o algoritmo ajustado de cada função")
+    parser.add_argument('--execucoes', type=int, default=25)
+    parser.add_argument('--processos', type=int, default=None, help="padrão: número de núcleos")
+    parser.add_argument('--max-fun-evals', type=int, default=None)
+    parser.add_argument('--agendamento-powell', choices=['cec2013', 'proporcional'], default=None,
+                        help="quando o Powell começa no pcdeepso (padrão: cec2013)")
+    parser.add_argument('--backend', choices=['cec2013lsgo', 'vetorizado'], default=None,
+                        help="implementação das funções (padrão: cec2013lsgo, o pacote de referência)")
+    parser.add_argument('--resultados', default='resultados', help="pasta do ResultStore")
+    parser.add_argument('--semente', type=int, default=0,
+                        help="entropia da SeedSequence da qual as sementes de cada execução são derivadas")
+    parser.add_argument('--lote', type=int, default=1,
+                        help="sementes do mesmo grupo executadas juntas como um tensor (R, N, D) em um processo")
+    parser.add_argument('--perfil', action='store_true',
+                        help="mede tempo e avaliações por fase do pcdeepso e grava perfil_fases.json")
+    args = parser.parse_args()
+
+    configuracoes = None
+    sobrescritas = {}
+    if args.max_fun_evals is not None:
+        sobrescritas['max_fun_evals'] = args.max_fun_evals
+    if args.agendamento_powell is not None:
+        sobrescritas['agendamento_powell'] = args.agendamento_powell
+    if args.backend is not None:
+        sobrescritas['backend'] = args.backend
+    if sobrescritas:
+        configuracoes = {'padrao': sobrescritas}
+    summary = executar_jobs(gerar_jobs(args.funcoes, args.algoritmos, configuracoes, args.execucoes, args.semente),
+                            args.processos, args.resultados, args.lote, args.perfil)
+    print(summary.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
-import pandas as pd
-import matplotlib.pyplot as plt
+import sys
 import os
+import matplotlib.pyplot as plt
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from result_store import ResultStore
 
 plt.rcParams.update({
     'font.size': 14,  # Tamanho geral do texto
@@ -15,7 +19,9 @@ plt.rcParams.update({
 output_dir = "output"
 os.makedirs(output_dir, exist_ok=True)
 
-# Lista de funções e caminhos para os arquivos
+store = ResultStore('resultados')
+
+# Lista de funções
 functions = [
     "f1_shifted_elliptic_1000",
     "f2_rastrigin_shifted_1000",
@@ -36,17 +42,15 @@ functions = [
 
 # Iterar sobre as funções para gerar os gráficos
 for func in functions:
-    file_path_pcdeepso = f"experimento_{func}_dimensoes_pcdeepso_convergencia.csv"
-    file_path_cdeepso = f"experimento_{func}_dimensoes_cdeepso_convergencia.csv"
+    # No ResultStore o nome da função não tem o sufixo com a dimensão
+    func_name = func.rsplit('_', 1)[0]
     
     try:
-        # Carregar os arquivos CSV
-        data_pcdeepso = pd.read_csv(file_path_pcdeepso)
-        data_cdeepso = pd.read_csv(file_path_cdeepso)
-
-        # Extrair as colunas de convergência média
-        convergencia_media_pcdeepso = data_pcdeepso['Convergencia_Media']
-        convergencia_media_cdeepso = data_cdeepso['Convergencia_Media']
+        # Curvas agregadas das execuções de cada algoritmo (média exata, mediana estimada)
+        agregado_pcdeepso = store.aggregate(func_name=func_name, algoritmo='pcdeepso')
+        agregado_cdeepso = store.aggregate(func_name=func_name, algoritmo='cdeepso')
+        convergencia_media_pcdeepso = agregado_pcdeepso.mean()
+        convergencia_media_cdeepso = agregado_cdeepso.mean()
 
         # Definir os marcos e seus rótulos
         milestones = [int(1.2e5) - 1, int(3.6e5) - 1, int(6e5) - 1, int(1.8e6) - 1, int(3e6) - 1]  # Índices ajustados para Python
@@ -56,6 +60,8 @@ for func in functions:
         plt.figure(figsize=(10, 6))
         plt.plot(convergencia_media_pcdeepso, color='blue', label='C-DEEPSO-Powell')  # Plotar a curva para PC-DEEPSO
         plt.plot(convergencia_media_cdeepso, color='red', label='C-DEEPSO')  # Plotar a curva para C-DEEPSO
+        plt.plot(agregado_pcdeepso.quantile_evals, agregado_pcdeepso.median(), color='blue', linestyle='--', linewidth=0.8, label='C-DEEPSO-Powell (mediana)')
+        plt.plot(agregado_cdeepso.quantile_evals, agregado_cdeepso.median(), color='red', linestyle='--', linewidth=0.8, label='C-DEEPSO (mediana)')
 
         # Adicionar os marcos no eixo X
         plt.xticks(milestones, milestone_labels)
@@ -75,7 +81,7 @@ for func in functions:
         plt.close()
         print(f"Gráfico salvo: {output_file}")
 
-    except FileNotFoundError as e:
-        print(f"Erro: Arquivo não encontrado para a função {func}. {e}")
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Erro: Execuções não encontradas para a função {func}. {e}")
     except Exception as e:
         print(f"Erro ao processar a função {func}. {e}")
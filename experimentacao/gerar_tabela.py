@@ -1,9 +1,13 @@
 import pandas as pd
 import numpy as np
+import sys
 import os
-from glob import glob
 import re
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from result_store import ResultStore
+
 
 def toLatex(global_df, filename_latex):
     """
@@ -49,54 +53,33 @@ def toLatex(global_df, filename_latex):
 
 
 
-def extract_statistics_from_excel(file_path):
+def extract_statistics_from_store(summary, func_name):
     """
-    Extrair os dados das três planilhas específicas para simular milestones.
+    Extrair as estatísticas dos três marcos de avaliação a partir do resumo do ResultStore.
     """
-    df_stats = pd.read_excel(file_path, sheet_name='Estatisticas')
-    df_stats_120k = pd.read_excel(file_path, sheet_name='Estatisticas_120k')
-    df_stats_600k = pd.read_excel(file_path, sheet_name='Estatisticas_600k')
-
-    # Organizar os dados para os três marcos de avaliação
-    data = {
-        '3e6': {
-            'Best': df_stats['Minimo'].values[0],
-            'Median': df_stats['Mediana'].values[0],
-            'Worst': df_stats['Maximo'].values[0],
-            'Mean': df_stats['Media'].values[0],
-            'Std': df_stats['Desvio_Padrao'].values[0],
-        },
-        '1.2e5': {
-            'Best': df_stats_120k['Minimo'].values[0],
-            'Median': df_stats_120k['Mediana'].values[0],
-            'Worst': df_stats_120k['Maximo'].values[0],
-            'Mean': df_stats_120k['Media'].values[0],
-            'Std': df_stats_120k['Desvio_Padrao'].values[0],
-        },
-        '6e5': {
-            'Best': df_stats_600k['Minimo'].values[0],
-            'Median': df_stats_600k['Mediana'].values[0],
-            'Worst': df_stats_600k['Maximo'].values[0],
-            'Mean': df_stats_600k['Media'].values[0],
-            'Std': df_stats_600k['Desvio_Padrao'].values[0],
+    data = {}
+    for milestone, chave in [(3_000_000, '3e6'), (120_000, '1.2e5'), (600_000, '6e5')]:
+        row = summary[(summary['func_name'] == func_name) & (summary['Milestone'] == milestone)].iloc[0]
+        data[chave] = {
+            'Best': row['Minimo'],
+            'Median': row['Mediana'],
+            'Worst': row['Maximo'],
+            'Mean': row['Media'],
+            'Std': row['Desvio_Padrao'],
         }
-    }
-    
-    # Adicionar um print para verificar o que está sendo extraído
-    # print(f"Extraído de {file_path}: {data}")
     return data
 
 
 def main():
-    folder_path = './'  # Colocar o caminho para a pasta com os arquivos .xlsx
-    excel_files = glob(os.path.join(folder_path, "*.xlsx"))
+    store = ResultStore('resultados')  # Colocar o caminho para a pasta do ResultStore
+    summary = store.summary(algoritmo='pcdeepso')
     
     # Dicionário para armazenar os resultados de cada função
     results = {}
 
-    for excel_file in excel_files:
-        function_name = os.path.basename(excel_file).split('_')[1]
-        stats = extract_statistics_from_excel(excel_file)
+    for func_name in summary['func_name'].unique():
+        function_name = func_name.split('_')[0]
+        stats = extract_statistics_from_store(summary, func_name)
 
         # Armazenar as estatísticas separadamente para cada milestone (120k, 600k, 3M)
         if 'F{}'.format(function_name) not in results:
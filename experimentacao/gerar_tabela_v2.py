@@ -1,26 +1,36 @@
-import pandas as pd
-from glob import glob
+import sys
 import os
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from result_store import ResultStore
+
 
 
 # Helper function to format numbers in scientific notation with E
 def format_scientific(value):
     return "{:.2E}".format(value)
 
-# Function to extract statistics from a DataFrame
-def get_statistics_from_df(df):
+# Function to extract the statistics of one function at one milestone from the ResultStore summary.
+# Returns None (and reports it) when the summary has no runs for that function/variant/milestone.
+def get_statistics(summary, func_name, milestone, variante, configuracao='padrao'):
+    rows = summary[(summary['func_name'] == func_name) & (summary['Milestone'] == milestone)
+                   & (summary['variante'] == variante) & (summary['configuracao'] == configuracao)]
+    if rows.empty:
+        print(f"Error: no runs of {variante} ({configuracao}) for {func_name} reaching {milestone} evaluations.")
+        return None
+    row = rows.iloc[0]
     stats = {
-        "Best": df.loc[0, 'Minimo'],
-        "Median": df.loc[0, 'Mediana'],
-        "Worst": df.loc[0, 'Maximo'],
-        "Mean": df.loc[0, 'Media'],
-        "Std": df.loc[0, 'Desvio_Padrao']
+        "Best": row['Minimo'],
+        "Median": row['Mediana'],
+        "Worst": row['Maximo'],
+        "Mean": row['Media'],
+        "Std": row['Desvio_Padrao']
     }
     return stats
 
 # Function to generate the LaTeX table with final formatting
-def generate_latex_table_final_fixed(files):
+def generate_latex_table_final_fixed(files, summary, variante):
     with open("results_table_final_fixed.tex", "w") as f:
         # Writing the beginning of the LaTeX table
         f.write("\\begin{table*}[!htb]\n")
@@ -37,41 +47,19 @@ def generate_latex_table_final_fixed(files):
             f.write("\\hline\n")
             
             # For each evaluation threshold
-            for eval_threshold, sheet_name in zip(
+            for eval_threshold, milestone in zip(
                 ["$1.2 \\times 10^5$", "$6.0 \\times 10^5$", "$3.0 \\times 10^6$"], 
-                ["Estatisticas_120k", "Estatisticas_600k", "Estatisticas"]
+                [120_000, 600_000, 3_000_000]
             ):
+                stats_by_file = [get_statistics(summary, file, milestone, variante) for file in functions]
                 # Write the evaluation threshold in the first column with vertical alignment
-                f.write(f"\\multirow{{5}}{{*}}[0pt]{{\\centering {eval_threshold}}} & Best")
-                for file in functions:
-                    file_path = file
-                    stats = get_statistics_from_df(pd.read_excel(file_path, sheet_name=sheet_name))
-                    f.write(f" & {format_scientific(stats['Best'])}")
-                f.write(" \\\\ \n")
-                
-                f.write(f" & Median")
-                for file in functions:
-                    stats = get_statistics_from_df(pd.read_excel(file, sheet_name=sheet_name))
-                    f.write(f" & {format_scientific(stats['Median'])}")
-                f.write(" \\\\ \n")
-                
-                f.write(f" & Worst")
-                for file in functions:
-                    stats = get_statistics_from_df(pd.read_excel(file, sheet_name=sheet_name))
-                    f.write(f" & {format_scientific(stats['Worst'])}")
-                f.write(" \\\\ \n")
-                
-                f.write(f" & Mean")
-                for file in functions:
-                    stats = get_statistics_from_df(pd.read_excel(file, sheet_name=sheet_name))
-                    f.write(f" & {format_scientific(stats['Mean'])}")
-                f.write(" \\\\ \n")
-                
-                f.write(f" & Std")
-                for file in functions:
-                    stats = get_statistics_from_df(pd.read_excel(file, sheet_name=sheet_name))
-                    f.write(f" & {format_scientific(stats['Std'])}")
-                f.write(" \\\\ \n")
+                f.write(f"\\multirow{{5}}{{*}}[0pt]{{\\centering {eval_threshold}}}")
+                for stat in ["Best", "Median", "Worst", "Mean", "Std"]:
+                    f.write(f" & {stat}")
+                    for stats in stats_by_file:
+                        # Missing data is left as a dash in the table
+                        f.write(f" & {'--' if stats is None else format_scientific(stats[stat])}")
+                    f.write(" \\\\ \n")
                 f.write("\\hline\n")  # Single line separating blocks
         
         # Finishing the table without extra lines
@@ -80,23 +68,25 @@ def generate_latex_table_final_fixed(files):
 
 # Example usage
 files = [
-    'experimento_f1_shifted_elliptic_1000_dimensoes_pcdeepso.xlsx',  # f1
-    'experimento_f2_rastrigin_shifted_1000_dimensoes_pcdeepso.xlsx',  # f2
-    'experimento_f3_ackley_shifted_1000_dimensoes_pcdeepso.xlsx',     # f3
-    'experimento_f4_shifted_rotated_elliptic_1000_dimensoes_pcdeepso.xlsx',  # f4
-    'experimento_f5_shifted_rotated_rastrigin_1000_dimensoes_pcdeepso.xlsx', # f5
-    'experimento_f6_shifted_rotated_ackley_1000_dimensoes_pcdeepso.xlsx',    # f6
-    'experimento_f7_schwefel_shifted_1000_dimensoes_pcdeepso.xlsx',          # f7
-    'experimento_f8_shifted_rotated_elliptic_1000_dimensoes_pcdeepso.xlsx',  # f8
-    'experimento_f9_shifted_rotated_rastrigin_1000_dimensoes_pcdeepso.xlsx', # f9
-    'experimento_f10_shifted_rotated_ackley_1000_dimensoes_pcdeepso.xlsx',   # f10
-    'experimento_f11_schwefel_shifted_1000_dimensoes_pcdeepso.xlsx',         # f11
-    'experimento_f12_rosenbrock_shifted_1000_dimensoes_pcdeepso.xlsx',       # f12
-    'experimento_f13_schwefel_overlapping_905_dimensoes_pcdeepso.xlsx',      # f13
-    'experimento_f14_schwefel_overlapping_905_dimensoes_pcdeepso.xlsx',      # f14
-    'experimento_f15_schwefel_shifted_1000_dimensoes_pcdeepso.xlsx'          # f15
+    'f1_shifted_elliptic',
+    'f2_rastrigin_shifted',
+    'f3_ackley_shifted',
+    'f4_shifted_rotated_elliptic',
+    'f5_shifted_rotated_rastrigin',
+    'f6_shifted_rotated_ackley',
+    'f7_schwefel_shifted',
+    'f8_shifted_rotated_elliptic',
+    'f9_shifted_rotated_rastrigin',
+    'f10_shifted_rotated_ackley',
+    'f11_schwefel_shifted',
+    'f12_rosenbrock_shifted',
+    'f13_schwefel_overlapping',
+    'f14_schwefel_overlapping',
+    'f15_schwefel_shifted'
 ]
-folder_path = './'
-excel_files = glob(os.path.join(folder_path, "*.xlsx"))
+# Variant (key of ALGORITMOS in executar_experimentos.py) reported in the table
+variante = 'pcdeepso'
+store = ResultStore('resultados')
+summary = store.summary(algoritmo='pcdeepso')
 # Generating the final LaTeX table
-generate_latex_table_final_fixed(files)
+generate_latex_table_final_fixed(files, summary, variante)
@@ -0,0 +1,328 @@
+import sys
+import os
+import json
+import time
+import timeit
+import inspect
+import argparse
+import platform
+import subprocess
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(RAIZ)
+
+import numpy as np
+import functions
+from utils import generatePopulation, generateCommunicationMask, update_swarm_in_place
+from partner_selection import partner_indices, top_k_indices, top_partner_indices
+from elite_archive import EliteArchive
+from evaluation_cache import EvaluationCache
+from instrumentation import PhaseProfiler
+from scipy_functions import _line_for_search
+from powell_method import line_search
+from powell_schedule import FixedWindows
+from powell_cdeepso import c_deepso, c_deepso_powell_global_best_paralelo
+
+# Suíte de desempenho: microbenchmarks das peças do PC-DEEPSO e execuções
+# curtas de ponta a ponta com semente fixa. O resultado é um JSON que pode ser
+# comparado entre dois checkouts para provar (ou descartar) uma otimização.
+#
+# Uso:
+#   py experimentacao/performa_teste.py --saida base.json            # no checkout de referência
+#   py experimentacao/performa_teste.py --saida novo.json            # no checkout alterado
+#   py experimentacao/performa_teste.py --comparar base.json novo.json
+#   py experimentacao/performa_teste.py --rapido --filtro objetivo   # só parte da suíte, tamanhos menores
+#   py experimentacao/performa_teste.py --so-importacao              # só o tempo de importação dos módulos
+
+DIMENSOES = [30, 100, 1000]
+TAMANHOS_ENXAME = [30, 500]
+DIMENSOES_RAPIDO = [30, 100]
+TAMANHOS_ENXAME_RAPIDO = [30]
+REPETICOES = 5
+SEMENTE = 42
+LIMITES = (-100.0, 100.0)
+
+# Tempo de importação em um interpretador novo (o que cada worker de um pool
+# spawn paga) e quais dependências pesadas cada módulo acaba carregando
+MODULOS_IMPORTACAO = ['numpy', 'powell_cdeepso', 'ask_tell', 'cec2013', 'result_store']
+MODULOS_PESADOS = ['scipy', 'sklearn', 'pandas', 'pympler', 'tqdm', 'matplotlib', 'deap']
+
+# Execuções de ponta a ponta: (nome, algoritmo, função de functions.py, D, N, orçamento)
+EXECUCOES_MACRO = [
+    ('cdeepso_rastrigin', 'cdeepso', 'cec_rastrigin', 100, 30, 20_000),
+    ('cdeepso_elliptic', 'cdeepso', 'cec_elliptic', 100, 30, 20_000),
+    ('pcdeepso_rastrigin', 'pcdeepso', 'cec_rastrigin', 1000, 500, 200_000),
+    ('pcdeepso_elliptic', 'pcdeepso', 'cec_elliptic', 1000, 500, 200_000),
+    ('pcdeepso_schwefel', 'pcdeepso', 'cec_schwefel', 1000, 500, 200_000),
+]
+
+
+def objetivos():
+    """Funções objetivo de functions.py: as públicas com um único argumento, sem as transformações."""
+    encontrados = {}
+    for nome, funcao in inspect.getmembers(functions, inspect.isfunction):
+        if nome.startswith('_') or nome.startswith('transform_') or funcao.__module__ != functions.__name__:
+            continue
+        obrigatorios = [p for p in inspect.signature(funcao).parameters.values() if p.default is inspect.Parameter.empty]
+        if len(obrigatorios) == 1:
+            encontrados[nome] = funcao
+    return encontrados
+
+
+def deslocado(funcao, dimension, rng):
+    """Objetivo com ótimo deslocado para um ponto aleatório, como nas funções do CEC."""
+    shift = rng.uniform(LIMITES[0] * 0.8, LIMITES[1] * 0.8, dimension)
+    return lambda x: funcao(np.asarray(x) - shift)
+
+
+def medir(funcao, repeticoes=REPETICOES):
+    """Tempo por chamada (mediana e mínimo de `repeticoes` rodadas), com o número de laços do timeit.autorange."""
+    timer = timeit.Timer(funcao)
+    lacos, _ = timer.autorange()
+    tempos = np.array(timer.repeat(repeat=repeticoes, number=lacos)) / lacos
+    return {'mediana_s': float(np.median(tempos)), 'min_s': float(np.min(tempos)), 'lacos': lacos}
+
+
+def micro_atualizacao_enxame(rng, dimension, swarm_size):
+    swarm = generatePopulation(dimension, swarm_size, *LIMITES, rng)
+    velocity = np.zeros_like(swarm)
+    X_st = generatePopulation(dimension, swarm_size, *LIMITES, rng)
+    g_best = swarm[0].copy()
+    C = generateCommunicationMask(dimension, 0.58, rng)
+    work = np.empty_like(swarm)
+
+    def fora_do_lugar():
+        velocity_new = np.clip(0.4 * velocity + 0.37 * (X_st - swarm) + 0.75 * C * (g_best - swarm), -1.01, 1.01)
+        return np.clip(swarm + velocity_new, *LIMITES)
+
+    def no_lugar():
+        update_swarm_in_place(swarm, velocity, X_st, g_best, C, 0.4, 0.37, 0.75, 1.01, *LIMITES, work)
+
+    return {'atualizacao_enxame': fora_do_lugar, 'atualizacao_enxame_in_place': no_lugar}
+
+
+def micro_selecao_parceiros(rng, dimension, swarm_size):
+    swarm = generatePopulation(dimension, swarm_size, *LIMITES, rng)
+    fitness = rng.random(swarm_size)
+    num_top = max(1, swarm_size // 10)
+    archive = EliteArchive(num_top, dimension)
+    archive.merge(fitness, swarm)
+
+    def parceiros_sg():
+        return swarm[partner_indices(rng, swarm_size)]
+
+    def parceiros_pb():
+        top_indices = top_k_indices(fitness, num_top)
+        return swarm[top_indices][top_partner_indices(rng, top_indices, swarm_size)]
+
+    def arquivo_elite():
+        archive.merge(rng.random(swarm_size), swarm)
+        return archive.sample(rng, swarm_size)
+
+    return {'parceiros_sg': parceiros_sg, 'parceiros_pb': parceiros_pb, 'arquivo_elite': arquivo_elite}
+
+
+def medir_avaliacao_populacao(dimension, swarm_size, cache=False, repeticoes=REPETICOES):
+    """
+    Tempo por chamada do evaluate_population do próprio motor (com truncamento
+    no fim do orçamento, registro dos marcos e atualização do g_best), medido
+    pela fase 'avaliacao_populacao' do PhaseProfiler em execuções curtas sem
+    Powell. `mediana_s` é a mediana, entre as execuções, do tempo médio por
+    chamada; `min_s` é o menor desses tempos médios.
+    """
+    tempos = []
+    chamadas = 0
+    for _ in range(repeticoes):
+        rng = np.random.default_rng(SEMENTE)
+        funcao = deslocado(functions.cec_rastrigin, dimension, rng)
+        profiler = PhaseProfiler()
+        # 10 gerações e meia: o último lote é truncado pelo orçamento
+        c_deepso_powell_global_best_paralelo(
+            funcao, dimension, swarm_size, *LIMITES, max_fun_evals=swarm_size * 10 + swarm_size // 2, rng=rng,
+            powell_schedule=FixedWindows([]), profiler=profiler,
+            cache=EvaluationCache(funcao) if cache else None)
+        fase = profiler.summary()['phases']['avaliacao_populacao']
+        tempos.append(fase['seconds'] / fase['calls'])
+        chamadas = fase['calls']
+    return {'mediana_s': float(np.median(tempos)), 'min_s': float(np.min(tempos)), 'lacos': chamadas}
+
+
+def micro_busca_linear(rng, dimension, swarm_size):
+    funcao = deslocado(functions.cec_elliptic, dimension, rng)
+    x = rng.uniform(*LIMITES, dimension)
+    bounds = np.array([np.full(dimension, LIMITES[0]), np.full(dimension, LIMITES[1])])
+    direction = np.zeros(dimension)
+    direction[rng.integers(dimension)] = 1.0
+    diagonal = rng.normal(0, 1, dimension)
+
+    return {
+        'line_search': lambda: line_search(funcao, x, direction, bounds, None, None),
+        '_line_for_search': lambda: _line_for_search(x, diagonal, bounds[0], bounds[1]),
+    }
+
+
+def micro_objetivos(rng, dimension, swarm_size):
+    swarm = generatePopulation(dimension, swarm_size, *LIMITES, rng)
+    return {f'objetivo_{nome}': (lambda funcao=funcao: funcao(swarm)) for nome, funcao in objetivos().items()}
+
+
+MICROBENCHMARKS = [micro_atualizacao_enxame, micro_selecao_parceiros, micro_busca_linear, micro_objetivos]
+
+# Medições do evaluate_population do motor: (nome, com EvaluationCache)
+AVALIACAO_POPULACAO = [('evaluate_population', False), ('evaluate_population_cache', True)]
+
+
+def executar_micro(dimensoes, tamanhos, filtro=None):
+    resultados = []
+    for dimension in dimensoes:
+        for swarm_size in tamanhos:
+            for gerador in MICROBENCHMARKS:
+                casos = gerador(np.random.default_rng(SEMENTE), dimension, swarm_size)
+                for nome, funcao in casos.items():
+                    if filtro and filtro not in nome:
+                        continue
+                    medicao = medir(funcao)
+                    resultados.append({'nome': nome, 'dimension': dimension, 'swarm_size': swarm_size, **medicao})
+                    print(f"{nome:<40} D={dimension:<5} N={swarm_size:<4} {medicao['mediana_s'] * 1e3:10.4f} ms")
+            for nome, cache in AVALIACAO_POPULACAO:
+                if filtro and filtro not in nome:
+                    continue
+                medicao = medir_avaliacao_populacao(dimension, swarm_size, cache)
+                resultados.append({'nome': nome, 'dimension': dimension, 'swarm_size': swarm_size, **medicao})
+                print(f"{nome:<40} D={dimension:<5} N={swarm_size:<4} {medicao['mediana_s'] * 1e3:10.4f} ms")
+    return resultados
+
+
+def medir_importacao(modulo, repeticoes=REPETICOES):
+    codigo = (f"import sys, time, json; sys.path.insert(0, {RAIZ!r}); inicio = time.perf_counter(); import {modulo}; "
+              f"tempo = time.perf_counter() - inicio; "
+              f"print(json.dumps({{'tempo': tempo, 'pesados': [m for m in {MODULOS_PESADOS!r} if m in sys.modules]}}))")
+    tempos = []
+    for _ in range(repeticoes):
+        saida = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, check=True)
+        medicao = json.loads(saida.stdout.strip().splitlines()[-1])
+        tempos.append(medicao['tempo'])
+    return {'modulo': modulo, 'mediana_s': float(np.median(tempos)), 'min_s': float(np.min(tempos)),
+            'pesados': medicao['pesados']}
+
+
+def executar_importacao(filtro=None):
+    resultados = []
+    for modulo in MODULOS_IMPORTACAO:
+        if filtro and filtro not in f'importacao_{modulo}':
+            continue
+        medicao = medir_importacao(modulo)
+        resultados.append(medicao)
+        print(f"import {modulo:<33} {medicao['mediana_s'] * 1e3:10.1f} ms  pesados: {', '.join(medicao['pesados']) or '-'}")
+    return resultados
+
+
+def executar_macro(filtro=None, escala=1.0):
+    resultados = []
+    for nome, algoritmo, nome_funcao, dimension, swarm_size, orcamento in EXECUCOES_MACRO:
+        if filtro and filtro not in nome:
+            continue
+        orcamento = int(orcamento * escala)
+        rng = np.random.default_rng(SEMENTE)
+        funcao = deslocado(getattr(functions, nome_funcao), dimension, rng)
+        inicio = time.perf_counter()
+        if algoritmo == 'cdeepso':
+            best_fitness, _, _, _, _, function_evals = c_deepso(
+                funcao, dimension, swarm_size, *LIMITES, max_fun_evals=orcamento, rng=rng)
+        else:
+            best_fitness, _, _, _, _, function_evals, *_ = c_deepso_powell_global_best_paralelo(
+                funcao, dimension, swarm_size, *LIMITES, max_fun_evals=orcamento, rng=rng,
+                powell_schedule=FixedWindows.proportional(orcamento))
+        tempo = time.perf_counter() - inicio
+        resultados.append({'nome': nome, 'algoritmo': algoritmo, 'funcao': nome_funcao, 'dimension': dimension,
+                           'swarm_size': swarm_size, 'orcamento': orcamento, 'tempo_s': tempo,
+                           'function_evals': int(function_evals), 'evals_por_s': function_evals / tempo,
+                           'best_fitness': float(best_fitness)})
+        print(f"{nome:<40} {tempo:10.2f} s {function_evals / tempo:12.0f} evals/s  best={float(best_fitness):.6e}")
+    return resultados
+
+
+def metadados():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {'data': time.strftime('%Y-%m-%dT%H:%M:%S'), 'commit': commit, 'python': platform.python_version(),
+            'numpy': np.__version__, 'plataforma': platform.platform(), 'processador': platform.processor(),
+            'semente': SEMENTE}
+
+
+def comparar(caminho_base, caminho_novo):
+    """Razão novo/base do tempo de cada medição presente nos dois arquivos (< 1: ficou mais rápido)."""
+    with open(caminho_base) as arquivo:
+        base = json.load(arquivo)
+    with open(caminho_novo) as arquivo:
+        novo = json.load(arquivo)
+
+    def chave_micro(r):
+        return (r['nome'], r['dimension'], r['swarm_size'])
+
+    base_micro = {chave_micro(r): r for r in base.get('micro', [])}
+    print(f"{'microbenchmark':<40} {'D':>5} {'N':>4} {'base ms':>10} {'novo ms':>10} {'razão':>7}")
+    for r in novo.get('micro', []):
+        b = base_micro.get(chave_micro(r))
+        if b is None:
+            continue
+        print(f"{r['nome']:<40} {r['dimension']:>5} {r['swarm_size']:>4} {b['mediana_s'] * 1e3:10.4f} "
+              f"{r['mediana_s'] * 1e3:10.4f} {r['mediana_s'] / b['mediana_s']:7.3f}")
+
+    base_importacao = {r['modulo']: r for r in base.get('importacao', [])}
+    print(f"\n{'importação':<40} {'base ms':>10} {'novo ms':>10} {'razão':>7}")
+    for r in novo.get('importacao', []):
+        b = base_importacao.get(r['modulo'])
+        if b is None:
+            continue
+        print(f"{r['modulo']:<40} {b['mediana_s'] * 1e3:10.1f} {r['mediana_s'] * 1e3:10.1f} "
+              f"{r['mediana_s'] / b['mediana_s']:7.3f}")
+
+    base_macro = {r['nome']: r for r in base.get('macro', [])}
+    print(f"\n{'execução':<40} {'base s':>10} {'novo s':>10} {'razão':>7}  best (base -> novo)")
+    for r in novo.get('macro', []):
+        b = base_macro.get(r['nome'])
+        if b is None:
+            continue
+        print(f"{r['nome']:<40} {b['tempo_s']:10.2f} {r['tempo_s']:10.2f} {r['tempo_s'] / b['tempo_s']:7.3f}  "
+              f"{b['best_fitness']:.6e} -> {r['best_fitness']:.6e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks e execuções de ponta a ponta do PC-DEEPSO.")
+    parser.add_argument('--saida', default='performance.json', help="arquivo JSON com os resultados")
+    parser.add_argument('--filtro', default=None, help="roda só as medições cujo nome contém este texto")
+    parser.add_argument('--rapido', action='store_true', help="dimensões, enxames e orçamentos menores")
+    parser.add_argument('--sem-micro', action='store_true')
+    parser.add_argument('--sem-macro', action='store_true')
+    parser.add_argument('--sem-importacao', action='store_true')
+    parser.add_argument('--so-importacao', action='store_true', help="mede apenas o tempo de importação")
+    parser.add_argument('--comparar', nargs=2, metavar=('BASE', 'NOVO'), help="compara dois JSON gravados e sai")
+    args = parser.parse_args()
+
+    if args.comparar:
+        comparar(*args.comparar)
+        return
+
+    resultado = {'meta': metadados(), 'importacao': [], 'micro': [], 'macro': []}
+    if not args.sem_importacao:
+        resultado['importacao'] = executar_importacao(args.filtro)
+    if args.so_importacao:
+        args.sem_micro = args.sem_macro = True
+    if not args.sem_micro:
+        dimensoes = DIMENSOES_RAPIDO if args.rapido else DIMENSOES
+        tamanhos = TAMANHOS_ENXAME_RAPIDO if args.rapido else TAMANHOS_ENXAME
+        resultado['micro'] = executar_micro(dimensoes, tamanhos, args.filtro)
+    if not args.sem_macro:
+        resultado['macro'] = executar_macro(args.filtro, escala=0.1 if args.rapido else 1.0)
+
+    with open(args.saida, 'w') as arquivo:
+        json.dump(resultado, arquivo, indent=2)
+    print(f"\nResultados gravados em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,12 @@
+import sys
 import os
-import pandas as pd
 import numpy as np
 from scipy.stats import ttest_ind
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from result_store import ResultStore
+
 # List of functions with dimensions
 function_names = [
     "f1_shifted_elliptic_1000",
@@ -22,7 +26,7 @@ function_names = [
     "f15_schwefel_shifted_1000"
 ]
 
-# Algorithms and their corresponding suffixes in filenames
+# Algorithms and their corresponding labels in the ResultStore
 alg_suffixes = {
     'C-DEEPSO': 'cdeepso',
     'C-DEEPSO-Powell': 'pcdeepso'
@@ -31,8 +35,8 @@ alg_suffixes = {
 # Alpha value for the t-test
 alpha = 0.05
 
-# Directory containing the data files
-data_dir = '.'
+# ResultStore with the runs of both algorithms
+store = ResultStore('resultados')
 
 # Store results for the LaTeX table
 results = []
@@ -40,25 +44,16 @@ results = []
 for func_name in function_names:
     data = {}
     for alg_name, alg_suffix in alg_suffixes.items():
-        # Construct the filename
-        filename = f"experimento_{func_name}_dimensoes_{alg_suffix}.xlsx"
-        filepath = os.path.join(data_dir, filename)
-        try:
-            # Read the Excel file
-            df = pd.read_excel(filepath, sheet_name='Dados')
-            # Extract the 'best_fitness' column
-            best_fitness_values = df['best_fitness'].values
-            if len(best_fitness_values) != 25:
-                print(f"Warning: Expected 25 best_fitness values in {filepath}, got {len(best_fitness_values)}")
-            data[alg_name] = best_fitness_values
-        except FileNotFoundError:
-            print(f"Error: File {filepath} not found.")
-            data[alg_name] = []
-            continue
-        except Exception as e:
-            print(f"Error reading {filepath}: {e}")
+        # Runs of this function/algorithm (func_name in the store has no dimension suffix)
+        store_func_name = func_name.rsplit('_', 1)[0]
+        best_fitness_values = store.best_fitness(func_name=store_func_name, algoritmo=alg_suffix)
+        if len(best_fitness_values) == 0:
+            print(f"Error: no runs of {alg_name} for {store_func_name} in {store.path}.")
             data[alg_name] = []
             continue
+        if len(best_fitness_values) != 25:
+            print(f"Warning: Expected 25 best_fitness values for {store_func_name} ({alg_name}), got {len(best_fitness_values)}")
+        data[alg_name] = best_fitness_values
     # Check if we have data for both algorithms
     if len(data.get('C-DEEPSO', [])) == 0 or len(data.get('C-DEEPSO-Powell', [])) == 0:
         print(f"Skipping function {func_name} due to missing data.")
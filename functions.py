@@ -1,46 +1,53 @@
 import numpy as np
+from functools import lru_cache
+
+# Todas as funções aceitam um ponto (D,) ou a matriz do enxame (N, D), com um
+# ponto por linha, e retornam um escalar ou um array com N valores. Assim o
+# enxame inteiro é avaliado em uma chamada, sem np.apply_along_axis.
+
+@lru_cache(maxsize=None)
+def _elliptic_weights(D):
+    # Com D == 1, i / (D - 1) não é definido: o único termo tem peso 10**0
+    weights = 10 ** (6 * (np.arange(D) / max(D - 1, 1)))
+    weights.flags.writeable = False
+    return weights
+
+@lru_cache(maxsize=None)
+def _griewank_divisors(D):
+    divisors = np.sqrt(np.arange(1, D + 1))
+    divisors.flags.writeable = False
+    return divisors
 
 def schwefel_1_2(x):
-    D = len(x)
-    total_sum = 0
-    for i in range(D):
-        inner_sum = sum(x[:i+1])  # Somatório de x_j para j=1 até i
-        total_sum += inner_sum ** 2
-    return total_sum
+    x = np.asarray(x, dtype=float)
+    # Somatório de x_j para j=1 até i, para todo i de uma vez
+    return np.sum(np.cumsum(x, axis=-1) ** 2, axis=-1)
 
 def shifted_rosenbrock(z):
-    D = len(z)
-    total = 0
-    for i in range(D - 1):
-        total += 100 * (z[i]**2 - z[i+1])**2 + (z[i] - 1)**2
-    return total
+    z = np.asarray(z, dtype=float)
+    return np.sum(100 * (z[..., :-1]**2 - z[..., 1:])**2 + (z[..., :-1] - 1)**2, axis=-1)
 
 def schwefel(particle):
-    dimension = len(particle)
-    return 418.9829 * dimension - np.sum(particle * np.sin(np.sqrt(np.abs(particle))))
+    particle = np.asarray(particle, dtype=float)
+    dimension = particle.shape[-1]
+    return 418.9829 * dimension - np.sum(particle * np.sin(np.sqrt(np.abs(particle))), axis=-1)
 
 def griewank(xx):
-    d = len(xx)
-    sum_term = 0
-    prod_term = 1
-    
-    for ii in range(d):
-        xi = xx[ii]
-        sum_term += xi**2 / 4000
-        prod_term *= np.cos(xi / np.sqrt(ii + 1))
-    
-    y = sum_term - prod_term + 1
-    return y
+    xx = np.asarray(xx, dtype=float)
+    d = xx.shape[-1]
+    sum_term = np.sum(xx**2, axis=-1) / 4000
+    prod_term = np.prod(np.cos(xx / _griewank_divisors(d)), axis=-1)
+    return sum_term - prod_term + 1
 
 def shifted_rastrigin(z):
-    D = len(z)
-    sum_term = np.sum(z**2 - 10 * np.cos(2 * np.pi * z) + 10)
-    return sum_term
+    z = np.asarray(z, dtype=float)
+    return np.sum(z**2 - 10 * np.cos(2 * np.pi * z) + 10, axis=-1)
 
 def shifted_ackley(z):
-    D = len(z)
-    sum_sq_term = np.sum(z**2) / D
-    cos_term = np.sum(np.cos(2 * np.pi * z)) / D
+    z = np.asarray(z, dtype=float)
+    D = z.shape[-1]
+    sum_sq_term = np.sum(z**2, axis=-1) / D
+    cos_term = np.sum(np.cos(2 * np.pi * z), axis=-1) / D
     
     term1 = -20 * np.exp(-0.2 * np.sqrt(sum_sq_term))
     term2 = -np.exp(cos_term)
@@ -48,9 +55,60 @@ def shifted_ackley(z):
     return term1 + term2 + 20 + np.e
 
 def elliptic_function(x):
-    D = len(x)  # Dimensão do vetor x
-    result = 0
-    for i in range(D):
-        result += 10**(6 * (i / (D - 1))) * (x[i]**2)
-    return result
+    x = np.asarray(x, dtype=float)
+    return np.sum(_elliptic_weights(x.shape[-1]) * x**2, axis=-1)
+
+# Transformações do CEC2013 LSGO (aplicadas elemento a elemento no último eixo).
+# `position` e `dimension` permitem aplicar a transformação a coordenadas isoladas,
+# como na avaliação incremental; por padrão são as posições 0..D-1 do próprio vetor.
+
+def transform_osz(z):
+    z = np.asarray(z, dtype=float)
+    with np.errstate(divide='ignore'):
+        x_hat = np.where(z != 0, np.log(np.abs(z)), 0.0)
+    c1 = np.where(z > 0, 10.0, 5.5)
+    c2 = np.where(z > 0, 7.9, 3.1)
+    return np.sign(z) * np.exp(x_hat + 0.049 * (np.sin(c1 * x_hat) + np.sin(c2 * x_hat)))
+
+def transform_asy(z, beta, position=None, dimension=None):
+    z = np.asarray(z, dtype=float)
+    if position is None:
+        dimension = z.shape[-1]
+        position = np.arange(dimension)
+    positive = np.maximum(z, 0)
+    exponent = 1 + beta * position / (dimension - 1) * np.sqrt(positive)
+    return np.where(z > 0, positive ** exponent, z)
+
+def transform_lambda(z, alpha, position=None, dimension=None):
+    z = np.asarray(z, dtype=float)
+    if position is None:
+        dimension = z.shape[-1]
+        position = np.arange(dimension)
+    return z * alpha ** (0.5 * position / (dimension - 1))
+
+
+# Funções base do CEC2013 LSGO, já com as transformações internas, avaliadas no
+# último eixo (aceitam um vetor (D,) ou uma matriz (N, D)). São aplicadas a cada
+# subcomponente rotacionado das funções f4-f15.
+
+def sphere(z):
+    return np.sum(np.asarray(z, dtype=float) ** 2, axis=-1)
+
+def cec_elliptic(z):
+    z = transform_osz(z)
+    return np.sum(_elliptic_weights(z.shape[-1]) * z ** 2, axis=-1)
+
+def cec_rastrigin(z):
+    z = transform_lambda(transform_asy(transform_osz(z), 0.2), 10)
+    return np.sum(z ** 2 - 10 * np.cos(2 * np.pi * z) + 10, axis=-1)
+
+def cec_ackley(z):
+    z = transform_lambda(transform_asy(transform_osz(z), 0.2), 10)
+    D = z.shape[-1]
+    term1 = -20 * np.exp(-0.2 * np.sqrt(np.sum(z ** 2, axis=-1) / D))
+    term2 = -np.exp(np.sum(np.cos(2 * np.pi * z), axis=-1) / D)
+    return term1 + term2 + 20 + np.e
 
+def cec_schwefel(z):
+    z = transform_asy(transform_osz(z), 0.2)
+    return np.sum(np.cumsum(z, axis=-1) ** 2, axis=-1)
@@ -1,12 +1,11 @@
-import pandas as pd
 import matplotlib.pyplot as plt
+from result_store import ResultStore
 
-# Carregar o arquivo CSV
-file_path = "experimento_f1_shifted_elliptic_1000_dimensoes_pcdeepso_convergencia.csv"
-data = pd.read_csv(file_path)
+# Carregar as execuções do ResultStore
+store = ResultStore('resultados')
 
-# Extrair a coluna de convergência média
-convergencia_media = data['Convergencia_Media']
+# Convergência média das execuções
+convergencia_media = store.mean_curve(func_name='f1_shifted_elliptic', algoritmo='pcdeepso')
 
 # Definir os marcos e seus rótulos
 milestones = [1.2e5, 6e5, 3e6]
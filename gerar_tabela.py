@@ -1,8 +1,7 @@
 import pandas as pd
 import numpy as np
-import os
-from glob import glob
 import re
+from result_store import ResultStore
 
 
 def toLatex(global_df, filename_latex):
@@ -43,41 +42,29 @@ def toLatex(global_df, filename_latex):
     df_latex.to_latex(filename_latex,  multirow=True, multicolumn=False, escape=False)
     return
 
-def extract_statistics_from_excel(file_path):
-    # Carregar as planilhas do arquivo Excel e pegar as estatísticas
-    df_stats = pd.read_excel(file_path, sheet_name='Estatisticas')
-    df_stats_120k = pd.read_excel(file_path, sheet_name='Estatisticas_120k')
-    df_stats_600k = pd.read_excel(file_path, sheet_name='Estatisticas_600k')
+def extract_statistics_from_store(summary, func_name):
+    # Estatísticas por marco de uma função, lidas do resumo do ResultStore
+    def stats(milestone):
+        row = summary[(summary['func_name'] == func_name) & (summary['Milestone'] == milestone)].iloc[0]
+        return row['Minimo'], row['Mediana'], row['Maximo'], row['Media'], row['Desvio_Padrao']
 
-    # Retornar as estatísticas extraídas
-    return {
-        'Best': df_stats['Minimo'].values[0],
-        'Median': df_stats['Mediana'].values[0],
-        'Worst': df_stats['Maximo'].values[0],
-        'Mean': df_stats['Media'].values[0],
-        'Std': df_stats['Desvio_Padrao'].values[0],
-        'Best_120k': df_stats_120k['Minimo'].values[0],
-        'Median_120k': df_stats_120k['Mediana'].values[0],
-        'Worst_120k': df_stats_120k['Maximo'].values[0],
-        'Mean_120k': df_stats_120k['Media'].values[0],
-        'Std_120k': df_stats_120k['Desvio_Padrao'].values[0],
-        'Best_600k': df_stats_600k['Minimo'].values[0],
-        'Median_600k': df_stats_600k['Mediana'].values[0],
-        'Worst_600k': df_stats_600k['Maximo'].values[0],
-        'Mean_600k': df_stats_600k['Media'].values[0],
-        'Std_600k': df_stats_600k['Desvio_Padrao'].values[0],
-    }
+    data = {}
+    for milestone, sufixo in [(3_000_000, ''), (120_000, '_120k'), (600_000, '_600k')]:
+        best, median, worst, mean, std = stats(milestone)
+        data.update({f'Best{sufixo}': best, f'Median{sufixo}': median, f'Worst{sufixo}': worst,
+                     f'Mean{sufixo}': mean, f'Std{sufixo}': std})
+    return data
 
 def main():
-    folder_path = './'  # Colocar o caminho para a pasta com os arquivos .xlsx
-    excel_files = glob(os.path.join(folder_path, "*.xlsx"))
+    store = ResultStore('resultados')  # Colocar o caminho para a pasta do ResultStore
+    summary = store.summary(algoritmo='pcdeepso')
     
     # Dicionário para armazenar os resultados de cada função
     results = {}
 
-    for excel_file in excel_files:
-        function_name = os.path.basename(excel_file).split('_')[1]
-        stats = extract_statistics_from_excel(excel_file)
+    for func_name in summary['func_name'].unique():
+        function_name = func_name.split('_')[0]
+        stats = extract_statistics_from_store(summary, func_name)
         results[function_name] = stats
 
     # Criar um DataFrame do pandas para organizar os resultados
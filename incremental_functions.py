@@ -0,0 +1,321 @@
+import numpy as np
+from functions import transform_osz, transform_asy, transform_lambda, _elliptic_weights
+
+# Objetivos com avaliação incremental para o Powell.
+#
+# Enquanto as direções do Powell são os eixos canônicos, cada passo da busca
+# linear muda uma única coordenada do ponto. Os objetos abaixo guardam o estado
+# do último ponto aceito e respondem o valor após mover a coordenada `i` em
+# O(1) (funções separáveis) em vez de reavaliar as D coordenadas.
+#
+# Protocolo:
+#   reset(x)          -> f(x), redefine o estado a partir do ponto x
+#   probe(i, delta)   -> f(x + delta * e_i) sem alterar o estado
+#                        (delta pode ser um array de passos)
+#   update(i, delta)  -> aplica o passo ao estado e retorna o novo valor
+#   __call__(x)       -> avaliação completa, sem estado (aceita matriz (N, D))
+
+
+class IncrementalObjective:
+    def reset(self, x):
+        raise NotImplementedError
+
+    def probe(self, i, delta):
+        raise NotImplementedError
+
+    def update(self, i, delta):
+        raise NotImplementedError
+
+    def __call__(self, x):
+        raise NotImplementedError
+
+
+class SeparableIncremental(IncrementalObjective):
+    """
+    f(x) = soma de termos(z_i, i), com z = x - shift. As subclasses
+    implementam `_terms(z, positions)` de forma vetorizada.
+    """
+
+    def __init__(self, dimension, shift=None):
+        self.dimension = dimension
+        self.shift = np.zeros(dimension) if shift is None else np.asarray(shift, dtype=float)
+        self.positions = np.arange(dimension)
+
+    def _terms(self, z, positions):
+        raise NotImplementedError
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        return self._terms(x - self.shift, self.positions).sum(axis=-1)
+
+    def reset(self, x):
+        self.x = np.array(x, dtype=float)
+        self.term_values = self._terms(self.x - self.shift, self.positions)
+        self.value = self.term_values.sum()
+        return self.value
+
+    def probe(self, i, delta):
+        new_terms = self._terms(self.x[i] + delta - self.shift[i], i)
+        return self.value - self.term_values[i] + new_terms
+
+    def update(self, i, delta):
+        self.x[i] += delta
+        new_term = self._terms(self.x[i] - self.shift[i], i)
+        self.value += new_term - self.term_values[i]
+        self.term_values[i] = new_term
+        return self.value
+
+
+class EllipticIncremental(SeparableIncremental):
+    """
+    Elíptica (functions.elliptic_function). Com cec=True aplica T_osz,
+    como a f1 (Shifted Elliptic) do CEC2013 LSGO.
+    """
+
+    def __init__(self, dimension, shift=None, cec=False):
+        super().__init__(dimension, shift)
+        self.cec = cec
+        self.weights = _elliptic_weights(dimension)
+
+    def _terms(self, z, positions):
+        if self.cec:
+            z = transform_osz(z)
+        return self.weights[positions] * z ** 2
+
+
+class RastriginIncremental(SeparableIncremental):
+    """
+    Rastrigin (functions.shifted_rastrigin). Com cec=True aplica T_osz,
+    T_asy^0.2 e Lambda^10, como a f2 (Shifted Rastrigin) do CEC2013 LSGO.
+    """
+
+    def __init__(self, dimension, shift=None, cec=False):
+        super().__init__(dimension, shift)
+        self.cec = cec
+
+    def _terms(self, z, positions):
+        if self.cec:
+            z = transform_lambda(transform_asy(transform_osz(z), 0.2, positions, self.dimension),
+                                 10, positions, self.dimension)
+        return z ** 2 - 10 * np.cos(2 * np.pi * z) + 10
+
+
+class SchwefelIncremental(SeparableIncremental):
+    """Schwefel 2.26 (functions.schwefel)."""
+
+    def _terms(self, z, positions):
+        return 418.9829 - z * np.sin(np.sqrt(np.abs(z)))
+
+
+class AckleyIncremental(IncrementalObjective):
+    """
+    Ackley (functions.shifted_ackley). Mantém as somas de z^2 e de cos(2*pi*z),
+    então cada passo custa O(1). Com cec=True aplica T_osz, T_asy^0.2 e
+    Lambda^10, como a f3 (Shifted Ackley) do CEC2013 LSGO.
+    """
+
+    def __init__(self, dimension, shift=None, cec=False):
+        self.dimension = dimension
+        self.shift = np.zeros(dimension) if shift is None else np.asarray(shift, dtype=float)
+        self.positions = np.arange(dimension)
+        self.cec = cec
+
+    def _transform(self, z, positions):
+        if self.cec:
+            z = transform_lambda(transform_asy(transform_osz(z), 0.2, positions, self.dimension),
+                                 10, positions, self.dimension)
+        return z
+
+    def _value(self, sum_sq, sum_cos):
+        term1 = -20 * np.exp(-0.2 * np.sqrt(sum_sq / self.dimension))
+        term2 = -np.exp(sum_cos / self.dimension)
+        return term1 + term2 + 20 + np.e
+
+    def __call__(self, x):
+        z = self._transform(np.asarray(x, dtype=float) - self.shift, self.positions)
+        return self._value(np.sum(z ** 2, axis=-1), np.sum(np.cos(2 * np.pi * z), axis=-1))
+
+    def reset(self, x):
+        self.x = np.array(x, dtype=float)
+        z = self._transform(self.x - self.shift, self.positions)
+        self.sq = z ** 2
+        self.cos = np.cos(2 * np.pi * z)
+        self.sum_sq, self.sum_cos = self.sq.sum(), self.cos.sum()
+        self.value = self._value(self.sum_sq, self.sum_cos)
+        return self.value
+
+    def probe(self, i, delta):
+        z = self._transform(self.x[i] + delta - self.shift[i], i)
+        return self._value(self.sum_sq - self.sq[i] + z ** 2,
+                           self.sum_cos - self.cos[i] + np.cos(2 * np.pi * z))
+
+    def update(self, i, delta):
+        self.x[i] += delta
+        z = self._transform(self.x[i] - self.shift[i], i)
+        sq, cos = z ** 2, np.cos(2 * np.pi * z)
+        self.sum_sq += sq - self.sq[i]
+        self.sum_cos += cos - self.cos[i]
+        self.sq[i], self.cos[i] = sq, cos
+        self.value = self._value(self.sum_sq, self.sum_cos)
+        return self.value
+
+
+class RosenbrockIncremental(IncrementalObjective):
+    """
+    Rosenbrock (functions.shifted_rosenbrock) em z = x - shift. A coordenada
+    i só aparece nos termos i-1 e i, então cada passo custa O(1). Com
+    shift = xopt é a f12 do CEC2013 LSGO, cujo ótimo fica em xopt + 1.
+    """
+
+    def __init__(self, dimension, shift=None):
+        self.dimension = dimension
+        self.shift = np.zeros(dimension) if shift is None else np.asarray(shift, dtype=float)
+
+    @staticmethod
+    def _pair_terms(a, b):
+        return 100 * (a ** 2 - b) ** 2 + (a - 1) ** 2
+
+    def __call__(self, x):
+        z = np.asarray(x, dtype=float) - self.shift
+        return self._pair_terms(z[..., :-1], z[..., 1:]).sum(axis=-1)
+
+    def reset(self, x):
+        self.z = np.asarray(x, dtype=float) - self.shift
+        self.term_values = self._pair_terms(self.z[:-1], self.z[1:])
+        self.value = self.term_values.sum()
+        return self.value
+
+    def probe(self, i, delta):
+        zi = self.z[i] + delta
+        value = self.value
+        if i > 0:
+            value = value - self.term_values[i - 1] + self._pair_terms(self.z[i - 1], zi)
+        if i < self.dimension - 1:
+            value = value - self.term_values[i] + self._pair_terms(zi, self.z[i + 1])
+        return value
+
+    def update(self, i, delta):
+        self.z[i] += delta
+        if i > 0:
+            new_term = self._pair_terms(self.z[i - 1], self.z[i])
+            self.value += new_term - self.term_values[i - 1]
+            self.term_values[i - 1] = new_term
+        if i < self.dimension - 1:
+            new_term = self._pair_terms(self.z[i], self.z[i + 1])
+            self.value += new_term - self.term_values[i]
+            self.term_values[i] = new_term
+        return self.value
+
+
+class SphereIncremental(SeparableIncremental):
+    """Esfera, usada na parte separável da f7 do CEC2013 LSGO."""
+
+    def _terms(self, z, positions):
+        return z ** 2
+
+
+class RotatedGroupIncremental(IncrementalObjective):
+    """
+    Objetivo formado por subcomponentes rotacionados, como as f4-f11, f13 e
+    f14 do CEC2013 LSGO:
+
+        f(x) = soma_g weights[g] * base(R_g (x[groups[g]] - shifts[g]))
+               + separable(x[separable_indices])
+
+    O vetor rotacionado z_g = R_g (x_g - o_g) de cada subcomponente fica em
+    cache. Um passo x + delta * e_i muda z_g apenas por delta * R_g[:, col],
+    então cada avaliação da busca linear custa O(m) por subcomponente que
+    contém a coordenada i, em vez de O(m^2) por subcomponente.
+
+    Parameters
+    ----------
+    dimension : int
+        Dimensão do ponto x.
+    groups : list of np.array
+        Índices de x que formam cada subcomponente (podem se sobrepor).
+    shifts : list of np.array
+        Deslocamento de cada subcomponente, alinhado com `groups`.
+    rotations : list of np.array or None
+        Matriz de rotação (m, m) de cada subcomponente; None para não rotacionar.
+    weights : array
+        Peso de cada subcomponente.
+    base : callable
+        Função base aplicada no último eixo de z (ex.: functions.cec_elliptic).
+    separable_indices : np.array, optional
+        Índices de x que formam a parte separável, sem rotação.
+    separable : IncrementalObjective, optional
+        Objetivo incremental aplicado a x[separable_indices].
+    """
+
+    def __init__(self, dimension, groups, shifts, rotations, weights, base,
+                 separable_indices=None, separable=None):
+        self.dimension = dimension
+        self.groups = [np.asarray(g) for g in groups]
+        self.shifts = [np.asarray(s, dtype=float) for s in shifts]
+        self.rotations = list(rotations)
+        self.weights = np.asarray(weights, dtype=float)
+        self.base = base
+        self.separable = separable
+        self.separable_indices = None if separable is None else np.asarray(separable_indices)
+
+        # Para cada coordenada: lista de (subcomponente, coluna) onde ela aparece
+        self.memberships = [[] for _ in range(dimension)]
+        for g, indices in enumerate(self.groups):
+            for col, i in enumerate(indices):
+                self.memberships[i].append((g, col))
+        self.separable_position = np.full(dimension, -1)
+        if self.separable is not None:
+            self.separable_position[self.separable_indices] = np.arange(len(self.separable_indices))
+
+    def _rotate(self, g, y):
+        R = self.rotations[g]
+        return y if R is None else y @ R.T
+
+    def _column(self, g, col):
+        R = self.rotations[g]
+        if R is None:
+            column = np.zeros(len(self.groups[g]))
+            column[col] = 1.0
+            return column
+        return R[:, col]
+
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        total = 0.0
+        for g, indices in enumerate(self.groups):
+            total = total + self.weights[g] * self.base(self._rotate(g, x[..., indices] - self.shifts[g]))
+        if self.separable is not None:
+            total = total + self.separable(x[..., self.separable_indices])
+        return total
+
+    def reset(self, x):
+        self.x = np.array(x, dtype=float)
+        self.z = [self._rotate(g, self.x[indices] - self.shifts[g]) for g, indices in enumerate(self.groups)]
+        self.group_values = np.array([self.base(z) for z in self.z])
+        self.separable_value = 0.0
+        if self.separable is not None:
+            self.separable_value = self.separable.reset(self.x[self.separable_indices])
+        self.value = self.weights @ self.group_values + self.separable_value
+        return self.value
+
+    def probe(self, i, delta):
+        delta = np.asarray(delta, dtype=float)
+        value = self.value
+        for g, col in self.memberships[i]:
+            z = self.z[g] + delta[..., np.newaxis] * self._column(g, col)
+            value = value + self.weights[g] * (self.base(z) - self.group_values[g])
+        position = self.separable_position[i]
+        if position >= 0:
+            value = value + self.separable.probe(position, delta) - self.separable_value
+        return value
+
+    def update(self, i, delta):
+        self.x[i] += delta
+        for g, col in self.memberships[i]:
+            self.z[g] += delta * self._column(g, col)
+            self.group_values[g] = self.base(self.z[g])
+        position = self.separable_position[i]
+        if position >= 0:
+            self.separable_value = self.separable.update(position, delta)
+        self.value = self.weights @ self.group_values + self.separable_value
+        return self.value
@@ -0,0 +1,100 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+
+class PhaseProfiler:
+    """
+    Tempo de relógio e avaliações gastos em cada fase de uma execução.
+
+    O motor envolve cada trecho em `with profiler.phase(nome):` e soma
+    contadores com `profiler.count(nome)`. Fases podem ser aninhadas (ex.:
+    'powell_busca_linear' dentro de 'powell'); cada uma guarda o tempo
+    inclusivo. O custo é um par de `time.perf_counter()` por fase, então os
+    cronômetros ficam em volta de blocos inteiros (a população, uma busca
+    linear), nunca de uma única avaliação.
+
+    Parameters
+    ----------
+    eval_counter : callable, opcional
+        Devolve a contagem de avaliações da execução; com ele cada fase
+        registra quantas avaliações consumiu. Os motores preenchem com o
+        próprio contador quando ele não é informado.
+    """
+
+    def __init__(self, eval_counter=None):
+        self.eval_counter = eval_counter
+        self.reset()
+
+    def reset(self):
+        self.seconds = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.evals = defaultdict(int)
+        self.counters = defaultdict(int)
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name):
+        counter = self.eval_counter
+        evals_before = counter() if counter is not None else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+            self.calls[name] += 1
+            if counter is not None:
+                self.evals[name] += counter() - evals_before
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def summary(self):
+        """Resumo serializável em JSON: tempo total, fases e contadores."""
+        return {'total_seconds': time.perf_counter() - self._start,
+                'phases': {name: _phase_summary(self.seconds[name], self.calls[name], self.evals[name])
+                           for name in self.seconds},
+                'counters': dict(self.counters)}
+
+
+class _NullProfiler:
+    """Substituto sem custo usado quando a instrumentação está desligada."""
+
+    eval_counter = None
+    _context = nullcontext()
+
+    def phase(self, name):
+        return self._context
+
+    def count(self, name, n=1):
+        pass
+
+
+NULL_PROFILER = _NullProfiler()
+
+
+def _phase_summary(seconds, calls, evals):
+    return {'seconds': seconds, 'calls': calls, 'evals': evals,
+            'evals_per_second': evals / seconds if seconds > 0 else None}
+
+
+def merge_summaries(summaries):
+    """Soma os resumos de várias execuções (ex.: as sementes de um grupo)."""
+    total_seconds = 0.0
+    seconds, calls, evals = defaultdict(float), defaultdict(int), defaultdict(int)
+    counters = defaultdict(int)
+    runs = 0
+    for summary in summaries:
+        runs += 1
+        total_seconds += summary['total_seconds']
+        for name, phase in summary['phases'].items():
+            seconds[name] += phase['seconds']
+            calls[name] += phase['calls']
+            evals[name] += phase['evals']
+        for name, value in summary['counters'].items():
+            counters[name] += value
+    return {'runs': runs, 'total_seconds': total_seconds,
+            'phases': {name: dict(_phase_summary(seconds[name], calls[name], evals[name]),
+                                  share=seconds[name] / total_seconds if total_seconds > 0 else None)
+                       for name in seconds},
+            'counters': dict(counters)}
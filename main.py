@@ -13,11 +13,9 @@ from functions import shifted_rosenbrock, schwefel_1_2, schwefel, griewank, shif
 #     return fun_fitness(sol)
 
 def function_ambigua(sol):
-    fun_fitness = rosen
-    if sol.ndim == 2:
-        return np.apply_along_axis(fun_fitness, 1, sol)
-    elif sol.ndim == 1:
-        return fun_fitness(sol)
+    # shifted_rosenbrock é a mesma Rosenbrock do scipy, mas aceita tanto uma
+    # partícula (D,) quanto o enxame inteiro (N, D) em uma única chamada
+    return shifted_rosenbrock(sol)
 
 def experimentacao(function, dimension, swarm_size, lower_bound, upper_bound, wi, wa, wc, tcom, tmut, max_v, max_fun_evals, max_iter, percent_powell_start_moment, percent_powell_func_evals):
     results_PCDEEPSO = []
@@ -0,0 +1,83 @@
+import numpy as np
+
+
+def top_k_indices(fitness, k):
+    """
+    Índices dos `k` menores valores de `fitness` ao longo do último eixo, sem
+    ordem entre eles. Usa `np.argpartition` (O(N)) em vez de ordenar tudo.
+    """
+    fitness = np.asarray(fitness)
+    n = fitness.shape[-1]
+    if k >= n:
+        return np.broadcast_to(np.arange(n), fitness.shape).copy()
+    return np.argpartition(fitness, k - 1, axis=-1)[..., :k]
+
+
+def distinct_partner_indices(rng, n, count, shape=()):
+    """
+    `count` parceiros distintos por partícula, nenhum deles a própria.
+
+    Cada parceiro é a partícula deslocada de um offset em [1, n): os offsets
+    são sorteados sem reposição em uma passada (cada novo offset é tirado de
+    um intervalo menor e pula os já escolhidos), então o tempo é limitado e
+    não há laço de rejeição.
+
+    Parameters
+    ----------
+    rng : numpy.random.Generator
+        Fonte de aleatoriedade.
+    n : int
+        Tamanho do enxame.
+    count : int
+        Parceiros por partícula (menor que n).
+    shape : tuple, opcional
+        Eixos iniciais extras (ex.: (R,) para R execuções em lote).
+
+    Returns
+    -------
+    numpy.ndarray
+        Matriz (count, *shape, n) de índices; a linha j traz o j-ésimo
+        parceiro de cada partícula.
+    """
+    if count >= n:
+        raise ValueError(f"não há {count} parceiros distintos em um enxame de {n} partículas")
+    size = tuple(shape) + (n,)
+    offsets = np.empty((count,) + size, dtype=np.intp)
+    for j in range(count):
+        offset = rng.integers(1, n - j, size=size)
+        for chosen in np.sort(offsets[:j], axis=0):
+            offset += offset >= chosen
+        offsets[j] = offset
+    return (offsets + np.arange(n)) % n
+
+
+def partner_indices(rng, n, shape=()):
+    """Um parceiro por partícula, uniforme entre as outras n - 1 (matriz (*shape, n))."""
+    if n < 2:
+        return np.zeros(tuple(shape) + (n,), dtype=np.intp)
+    return distinct_partner_indices(rng, n, 1, shape)[0]
+
+
+def top_partner_indices(rng, top_indices, n):
+    """
+    Para cada uma das `n` partículas, uma posição em `top_indices` (último
+    eixo com os k melhores) cujo índice não é a própria partícula.
+
+    Partículas fora do top-k sorteiam entre as k posições; as que estão nele
+    sorteiam entre k - 1 e pulam a própria posição. Com k == 1 a melhor
+    partícula só pode escolher a si mesma.
+    """
+    top_indices = np.asarray(top_indices)
+    k = top_indices.shape[-1]
+    batch_shape = top_indices.shape[:-1]
+    if k == 1:
+        return np.zeros(batch_shape + (n,), dtype=np.intp)
+
+    # Posição de cada partícula dentro do top-k (-1: fora dele)
+    own_position = np.full(batch_shape + (n,), -1, dtype=np.intp)
+    np.put_along_axis(own_position, top_indices, np.broadcast_to(np.arange(k), top_indices.shape), axis=-1)
+    in_top = own_position >= 0
+
+    positions = rng.integers(0, k - in_top)
+    positions += in_top & (positions >= own_position)
+    return positions
@@ -1,16 +1,22 @@
 import numpy as np
-import bisect
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from random import choice
-from sklearn.cluster import KMeans
-from utils import generatePopulation, generateMultiplicationMatrix
-from powell_method import powell
+from dispersion import DispersionMonitor
+from elite_archive import EliteArchive
+from partner_selection import top_k_indices, partner_indices, distinct_partner_indices, top_partner_indices
+from utils import generatePopulation, generateCommunicationMask, update_swarm_in_place
+from powell_method import powell, powell_steps, MaxFunEvalsReached as PowellMaxFunEvalsReached
+from convergence_trace import ConvergenceTrace
+from instrumentation import NULL_PROFILER
+from checkpoint import save_checkpoint, load_checkpoint
+from powell_schedule import FixedWindows, MilestoneRecorder
 import gc
+import copy
 from tqdm import tqdm
-import tracemalloc
-from pympler import tracker
 import traceback
 
+# Gerações seguidas sem avaliações novas (com EvaluationCache(count_hits=False)
+# e o enxame preso em pontos já avaliados) depois das quais a execução termina
+MAX_STALLED_GENERATIONS = 100
+
 def c_deepso_powell_global_best_com_limite(function, dimension, swarmSize, lowerBound, upperBound,
              max_iter=100,
              W_i=0.4019092098808389,
@@ -24,9 +30,11 @@ def c_deepso_powell_global_best_com_limite(function, dimension, swarmSize, lower
              searchRadius=0.5962189101390463,
              localSearchStartIter=99,
              localSearchEndIter=99,
-             F=0.5):
+             F=0.5,
+             rng=None):
+    rng = np.random.default_rng(rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
     p_best = swarm.copy()
     p_best_fitness = np.array([function(p) for p in p_best])
@@ -46,16 +54,21 @@ def c_deepso_powell_global_best_com_limite(function, dimension, swarmSize, lower
     g_best_fitness = evaluate_function(g_best)
     prev_g_best_fitness = g_best_fitness
 
-    # Inicializa a lista ordenada para as 10% melhores partículas
+    # Inicializa o arquivo das 10% melhores partículas
     num_top_particles = max(1, swarmSize // 10)
-    sorted_smb_particles = sorted((p_best_fitness[i], p_best[i].copy()) for i in range(num_top_particles))
+    elite_archive = EliteArchive(num_top_particles, dimension)
+    elite_archive.merge(p_best_fitness[:num_top_particles], p_best[:num_top_particles])
 
     while k < max_iter:
+        mutations = rng.normal(0, 1, size=(swarmSize, 4))
+        communication_masks = generateCommunicationMask(dimension, T_com, rng, size=swarmSize)
+        partners = partner_indices(rng, swarmSize)
+        r1_r2 = distinct_partner_indices(rng, swarmSize, 2)
         for i in range(swarmSize):
             # Mutação dos pesos
-            W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+            W_i = np.clip(W_i + (T_mut * mutations[i, 0]), 0, 1)
+            W_a = np.clip(W_a + (T_mut * mutations[i, 1]), 0, 1)
+            W_c = np.clip(W_c + (T_mut * mutations[i, 2]), 0, 1)
 
             # Atualiza Particle Best e Global Best
             particle = swarm[i]
@@ -68,28 +81,23 @@ def c_deepso_powell_global_best_com_limite(function, dimension, swarmSize, lower
                     g_best = particle.copy()
                     g_best_fitness = fitness
 
-            # Atualiza lista com as 10% melhores partículas utilizando busca binária
-            if fitness < sorted_smb_particles[-1][0]:
-                sorted_smb_particles.pop()  # Remove o pior (último) elemento
-                indice = bisect.bisect_left(sorted_smb_particles, fitness, key=lambda i: i[0])
-                sorted_smb_particles.insert(indice, (fitness, particle.copy()))
+            # Atualiza o arquivo das 10% melhores partículas
+            elite_archive.add(fitness, particle)
 
-            # Gera Matriz de Comunicação
-            C = generateMultiplicationMatrix(dimension, T_com)
+            # Vetor de comunicação (máscara 0/1 da diagonal de C)
+            C = communication_masks[i]
 
             # Extrai Xr conforme o tipo selecionado
             Xr = np.zeros((dimension))
 
-            r = np.random.randint(0, swarmSize)
-            while r == i:
-                r = np.random.randint(0, swarmSize)
+            r = partners[i]
 
             if type == 'sg':  # Extraído aleatoriamente da população atual
                 Xr = swarm[r].copy()
             elif type == 'pb':  # Extraído aleatoriamente dentre os 10% melhores salvos
-                Xr = choice([p for _, p in sorted_smb_particles])
+                Xr = elite_archive.sample(rng)
             elif type == 'sgpb':  # Média entre Sg e Pb
-                pb = choice([p for _, p in sorted_smb_particles])
+                pb = elite_archive.sample(rng)
                 Xr = ((swarm[r] + pb) / 2).copy()
             else:
                 return "Tipo inválido. Aceitos: sg, pb e sgpb."
@@ -99,16 +107,12 @@ def c_deepso_powell_global_best_com_limite(function, dimension, swarmSize, lower
 
             # Realiza possível mutação do global best
             selected_global_best = g_best
-            mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+            mutated_global_best = np.clip(g_best * (1 + T_mut * mutations[i, 3]), lowerBound, upperBound)
             if evaluate_function(mutated_global_best) < g_best_fitness:
                 selected_global_best = mutated_global_best
 
             # Implementa a estratégia current-to-best para o Xst
-            r1, r2 = np.random.randint(0, swarmSize), np.random.randint(0, swarmSize)
-            while r1 == i:
-                r1 = np.random.randint(0, swarmSize)
-            while r2 == i or r2 == r1:
-                r2 = np.random.randint(0, swarmSize)
+            r1, r2 = r1_r2[:, i]
 
             X_best = g_best.copy()
             X_r1 = swarm[r1].copy()
@@ -119,7 +123,7 @@ def c_deepso_powell_global_best_com_limite(function, dimension, swarmSize, lower
             # Calcula vetor de velocidade da partícula
             inertia = W_i * velocity[i]
             cognitive = W_a * (X_st - particle)
-            social = W_c * (C @ (selected_global_best - particle))
+            social = W_c * (C * (selected_global_best - particle))
 
             velocity[i] = np.clip(inertia + cognitive + social, -max_v, max_v)
 
@@ -164,9 +168,12 @@ def c_deepso_powell_global_best_com_kmeans(function, dimension, swarmSize, lower
              T_com=0.5819630448962767,
              T_mut=0.1,
              type='sgpb',
-             F=0.5):
+             F=0.5,
+             rng=None):
+    rng = np.random.default_rng(rng)
+    dispersion_monitor = DispersionMonitor(rng=rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
     p_best = swarm.copy()
     p_best_fitness = np.array([function(p) for p in p_best])
@@ -190,16 +197,21 @@ def c_deepso_powell_global_best_com_kmeans(function, dimension, swarmSize, lower
 
     g_best_fitness = evaluate_function(g_best)
 
-    # Inicializa a lista ordenada para as 10% melhores partículas
+    # Inicializa o arquivo das 10% melhores partículas
     num_top_particles = max(1, swarmSize // 10)
-    sorted_smb_particles = sorted((p_best_fitness[i], p_best[i].copy()) for i in range(num_top_particles))
+    elite_archive = EliteArchive(num_top_particles, dimension)
+    elite_archive.merge(p_best_fitness[:num_top_particles], p_best[:num_top_particles])
 
     while True:
+        mutations = rng.normal(0, 1, size=(swarmSize, 4))
+        communication_masks = generateCommunicationMask(dimension, T_com, rng, size=swarmSize)
+        partners = partner_indices(rng, swarmSize)
+        r1_r2 = distinct_partner_indices(rng, swarmSize, 2)
         for i in range(swarmSize):
             # Mutação dos pesos
-            W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+            W_i = np.clip(W_i + (T_mut * mutations[i, 0]), 0, 1)
+            W_a = np.clip(W_a + (T_mut * mutations[i, 1]), 0, 1)
+            W_c = np.clip(W_c + (T_mut * mutations[i, 2]), 0, 1)
 
             # Atualiza Particle Best e Global Best
             particle = swarm[i]
@@ -212,28 +224,23 @@ def c_deepso_powell_global_best_com_kmeans(function, dimension, swarmSize, lower
                     g_best = particle.copy()
                     g_best_fitness = fitness
 
-            # Atualiza lista com as 10% melhores partículas utilizando busca binária
-            if fitness < sorted_smb_particles[-1][0]:
-                sorted_smb_particles.pop()  # Remove o pior (último) elemento
-                indice = bisect.bisect_left(sorted_smb_particles, fitness, key=lambda i: i[0])
-                sorted_smb_particles.insert(indice, (fitness, particle.copy()))
+            # Atualiza o arquivo das 10% melhores partículas
+            elite_archive.add(fitness, particle)
 
-            # Gera Matriz de Comunicação
-            C = generateMultiplicationMatrix(dimension, T_com)
+            # Vetor de comunicação (máscara 0/1 da diagonal de C)
+            C = communication_masks[i]
 
             # Extrai Xr conforme o tipo selecionado
             Xr = np.zeros((dimension))
 
-            r = np.random.randint(0, swarmSize)
-            while r == i:
-                r = np.random.randint(0, swarmSize)
+            r = partners[i]
 
             if type == 'sg':  # Extraído aleatoriamente da população atual
                 Xr = swarm[r].copy()
             elif type == 'pb':  # Extraído aleatoriamente dentre os 10% melhores salvos
-                Xr = choice([p for _, p in sorted_smb_particles])
+                Xr = elite_archive.sample(rng)
             elif type == 'sgpb':  # Média entre Sg e Pb
-                pb = choice([p for _, p in sorted_smb_particles])
+                pb = elite_archive.sample(rng)
                 Xr = ((swarm[r] + pb) / 2).copy()
             else:
                 return "Tipo inválido. Aceitos: sg, pb e sgpb."
@@ -243,16 +250,12 @@ def c_deepso_powell_global_best_com_kmeans(function, dimension, swarmSize, lower
 
             # Realiza possível mutação do global best
             selected_global_best = g_best
-            mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+            mutated_global_best = np.clip(g_best * (1 + T_mut * mutations[i, 3]), lowerBound, upperBound)
             if evaluate_function(mutated_global_best) < g_best_fitness:
                 selected_global_best = mutated_global_best
 
             # Implementa a estratégia current-to-best para o Xst
-            r1, r2 = np.random.randint(0, swarmSize), np.random.randint(0, swarmSize)
-            while r1 == i:
-                r1 = np.random.randint(0, swarmSize)
-            while r2 == i or r2 == r1:
-                r2 = np.random.randint(0, swarmSize)
+            r1, r2 = r1_r2[:, i]
 
             X_best = g_best.copy()
             X_r1 = swarm[r1].copy()
@@ -263,7 +266,7 @@ def c_deepso_powell_global_best_com_kmeans(function, dimension, swarmSize, lower
             # Calcula vetor de velocidade da partícula
             inertia = W_i * velocity[i]
             cognitive = W_a * (X_st - particle)
-            social = W_c * (C @ (selected_global_best - particle))
+            social = W_c * (C * (selected_global_best - particle))
 
             velocity[i] = np.clip(inertia + cognitive + social, -max_v, max_v)
 
@@ -272,15 +275,8 @@ def c_deepso_powell_global_best_com_kmeans(function, dimension, swarmSize, lower
 
         # Avalia se está na hora de mudar para o powell
         if k > 10 and k % 5 == 0:  # Pode ajustar o intervalo de verificação
-          kmeans = KMeans(n_clusters=2, n_init=10)  # Número de clusters pode ser ajustado
-          swarm_positions = np.array(swarm)
-          kmeans.fit(swarm_positions)
-          labels = kmeans.labels_
-          cluster_centers = kmeans.cluster_centers_
-
-          # Calcula a dispersão entre os clusters
-          intra_cluster_distance = np.mean([np.linalg.norm(swarm_positions[i] - cluster_centers[labels[i]])
-                                            for i in range(swarmSize)])
+          # Calcula a dispersão entre os clusters (2-means incremental, ver dispersion.py)
+          intra_cluster_distance = dispersion_monitor(swarm)
 
           # Define um limiar de dispersão que, quando atingido, entrega para o Powell
           print(f"V1 - Geração: {k} Dispersão: {intra_cluster_distance} fitness: {g_best_fitness} funcalls: {function_evals} maxiter: {max_iter}")
@@ -321,9 +317,12 @@ def c_deepso_powell_global_best_com_kmeans_v4(function, dimension, swarmSize, lo
              T_com=0.5819630448962767,
              T_mut=0.1,
              type='sgpb',
-             F=0.5):
+             F=0.5,
+             rng=None):
+    rng = np.random.default_rng(rng)
+    dispersion_monitor = DispersionMonitor(rng=rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
     p_best = swarm.copy()
     p_best_fitness = np.array([function(p) for p in p_best])
@@ -354,16 +353,21 @@ def c_deepso_powell_global_best_com_kmeans_v4(function, dimension, swarmSize, lo
 
     g_best_fitness = evaluate_function(g_best)
 
-    # Inicializa a lista ordenada para as 10% melhores partículas
+    # Inicializa o arquivo das 10% melhores partículas
     num_top_particles = max(1, swarmSize // 10)
-    sorted_smb_particles = sorted((p_best_fitness[i], p_best[i].copy()) for i in range(num_top_particles))
+    elite_archive = EliteArchive(num_top_particles, dimension)
+    elite_archive.merge(p_best_fitness[:num_top_particles], p_best[:num_top_particles])
 
     while True:
+        mutations = rng.normal(0, 1, size=(swarmSize, 4))
+        communication_masks = generateCommunicationMask(dimension, T_com, rng, size=swarmSize)
+        partners = partner_indices(rng, swarmSize)
+        r1_r2 = distinct_partner_indices(rng, swarmSize, 2)
         for i in range(swarmSize):
             # Mutação dos pesos
-            W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+            W_i = np.clip(W_i + (T_mut * mutations[i, 0]), 0, 1)
+            W_a = np.clip(W_a + (T_mut * mutations[i, 1]), 0, 1)
+            W_c = np.clip(W_c + (T_mut * mutations[i, 2]), 0, 1)
 
             # Atualiza Particle Best e Global Best
             particle = swarm[i]
@@ -376,28 +380,23 @@ def c_deepso_powell_global_best_com_kmeans_v4(function, dimension, swarmSize, lo
                     g_best = particle.copy()
                     g_best_fitness = fitness
 
-            # Atualiza lista com as 10% melhores partículas utilizando busca binária
-            if fitness < sorted_smb_particles[-1][0]:
-                sorted_smb_particles.pop()  # Remove o pior (último) elemento
-                indice = bisect.bisect_left(sorted_smb_particles, fitness, key=lambda i: i[0])
-                sorted_smb_particles.insert(indice, (fitness, particle.copy()))
+            # Atualiza o arquivo das 10% melhores partículas
+            elite_archive.add(fitness, particle)
 
-            # Gera Matriz de Comunicação
-            C = generateMultiplicationMatrix(dimension, T_com)
+            # Vetor de comunicação (máscara 0/1 da diagonal de C)
+            C = communication_masks[i]
 
             # Extrai Xr conforme o tipo selecionado
             Xr = np.zeros((dimension))
 
-            r = np.random.randint(0, swarmSize)
-            while r == i:
-                r = np.random.randint(0, swarmSize)
+            r = partners[i]
 
             if type == 'sg':  # Extraído aleatoriamente da população atual
                 Xr = swarm[r].copy()
             elif type == 'pb':  # Extraído aleatoriamente dentre os 10% melhores salvos
-                Xr = choice([p for _, p in sorted_smb_particles])
+                Xr = elite_archive.sample(rng)
             elif type == 'sgpb':  # Média entre Sg e Pb
-                pb = choice([p for _, p in sorted_smb_particles])
+                pb = elite_archive.sample(rng)
                 Xr = ((swarm[r] + pb) / 2).copy()
             else:
                 return "Tipo inválido. Aceitos: sg, pb e sgpb."
@@ -407,16 +406,12 @@ def c_deepso_powell_global_best_com_kmeans_v4(function, dimension, swarmSize, lo
 
             # Realiza possível mutação do global best
             selected_global_best = g_best
-            mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+            mutated_global_best = np.clip(g_best * (1 + T_mut * mutations[i, 3]), lowerBound, upperBound)
             if evaluate_function(mutated_global_best) < g_best_fitness:
                 selected_global_best = mutated_global_best
 
             # Implementa a estratégia current-to-best para o Xst
-            r1, r2 = np.random.randint(0, swarmSize), np.random.randint(0, swarmSize)
-            while r1 == i:
-                r1 = np.random.randint(0, swarmSize)
-            while r2 == i or r2 == r1:
-                r2 = np.random.randint(0, swarmSize)
+            r1, r2 = r1_r2[:, i]
 
             X_best = g_best.copy()
             X_r1 = swarm[r1].copy()
@@ -427,7 +422,7 @@ def c_deepso_powell_global_best_com_kmeans_v4(function, dimension, swarmSize, lo
             # Calcula vetor de velocidade da partícula
             inertia = W_i * velocity[i]
             cognitive = W_a * (X_st - particle)
-            social = W_c * (C @ (selected_global_best - particle))
+            social = W_c * (C * (selected_global_best - particle))
 
             velocity[i] = np.clip(inertia + cognitive + social, -max_v, max_v)
 
@@ -436,15 +431,8 @@ def c_deepso_powell_global_best_com_kmeans_v4(function, dimension, swarmSize, lo
 
         # Avalia se está na hora de mudar para o powell
         if k > 10 and k % 5 == 0:
-          kmeans = KMeans(n_clusters=2, n_init=10)
-          swarm_positions = np.array(swarm)
-          kmeans.fit(swarm_positions)
-          labels = kmeans.labels_
-          cluster_centers = kmeans.cluster_centers_
-
-          
-          intra_cluster_distance = np.mean([np.linalg.norm(swarm_positions[i] - cluster_centers[labels[i]])
-                                            for i in range(swarmSize)])
+          # Calcula a dispersão entre os clusters (2-means incremental, ver dispersion.py)
+          intra_cluster_distance = dispersion_monitor(swarm)
         # bnd = ftol * (np.abs(f_old) + np.abs(f_ret)) + 1e-20
         # if 2.0 * (f_old - f_ret) <= bnd:
         #     break
@@ -496,9 +484,12 @@ def c_deepso_powell_global_best_com_kmeans_v3(function, dimension, swarmSize, lo
              T_mut=0.1,
              type='sgpb',
              F=0.5,
-             diff_window=3):
+             diff_window=3,
+             rng=None):
+    rng = np.random.default_rng(rng)
+    dispersion_monitor = DispersionMonitor(rng=rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
     p_best = swarm.copy()
     p_best_fitness = np.array([function(p) for p in p_best])
@@ -524,16 +515,21 @@ def c_deepso_powell_global_best_com_kmeans_v3(function, dimension, swarmSize, lo
 
     g_best_fitness = evaluate_function(g_best)
 
-    # Inicializa a lista ordenada para as 10% melhores partículas
+    # Inicializa o arquivo das 10% melhores partículas
     num_top_particles = max(1, swarmSize // 10)
-    sorted_smb_particles = sorted((p_best_fitness[i], p_best[i].copy()) for i in range(num_top_particles))
+    elite_archive = EliteArchive(num_top_particles, dimension)
+    elite_archive.merge(p_best_fitness[:num_top_particles], p_best[:num_top_particles])
 
     while True:
+        mutations = rng.normal(0, 1, size=(swarmSize, 4))
+        communication_masks = generateCommunicationMask(dimension, T_com, rng, size=swarmSize)
+        partners = partner_indices(rng, swarmSize)
+        r1_r2 = distinct_partner_indices(rng, swarmSize, 2)
         for i in range(swarmSize):
             # Mutação dos pesos
-            W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+            W_i = np.clip(W_i + (T_mut * mutations[i, 0]), 0, 1)
+            W_a = np.clip(W_a + (T_mut * mutations[i, 1]), 0, 1)
+            W_c = np.clip(W_c + (T_mut * mutations[i, 2]), 0, 1)
 
             # Atualiza Particle Best e Global Best
             particle = swarm[i]
@@ -546,28 +542,23 @@ def c_deepso_powell_global_best_com_kmeans_v3(function, dimension, swarmSize, lo
                     g_best = particle.copy()
                     g_best_fitness = fitness
 
-            # Atualiza lista com as 10% melhores partículas utilizando busca binária
-            if fitness < sorted_smb_particles[-1][0]:
-                sorted_smb_particles.pop()  # Remove o pior (último) elemento
-                indice = bisect.bisect_left(sorted_smb_particles, fitness, key=lambda i: i[0])
-                sorted_smb_particles.insert(indice, (fitness, particle.copy()))
+            # Atualiza o arquivo das 10% melhores partículas
+            elite_archive.add(fitness, particle)
 
-            # Gera Matriz de Comunicação
-            C = generateMultiplicationMatrix(dimension, T_com)
+            # Vetor de comunicação (máscara 0/1 da diagonal de C)
+            C = communication_masks[i]
 
             # Extrai Xr conforme o tipo selecionado
             Xr = np.zeros((dimension))
 
-            r = np.random.randint(0, swarmSize)
-            while r == i:
-                r = np.random.randint(0, swarmSize)
+            r = partners[i]
 
             if type == 'sg':  # Extraído aleatoriamente da população atual
                 Xr = swarm[r].copy()
             elif type == 'pb':  # Extraído aleatoriamente dentre os 10% melhores salvos
-                Xr = choice([p for _, p in sorted_smb_particles])
+                Xr = elite_archive.sample(rng)
             elif type == 'sgpb':  # Média entre Sg e Pb
-                pb = choice([p for _, p in sorted_smb_particles])
+                pb = elite_archive.sample(rng)
                 Xr = ((swarm[r] + pb) / 2).copy()
             else:
                 return "Tipo inválido. Aceitos: sg, pb e sgpb."
@@ -577,16 +568,12 @@ def c_deepso_powell_global_best_com_kmeans_v3(function, dimension, swarmSize, lo
 
             # Realiza possível mutação do global best
             selected_global_best = g_best
-            mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+            mutated_global_best = np.clip(g_best * (1 + T_mut * mutations[i, 3]), lowerBound, upperBound)
             if evaluate_function(mutated_global_best) < g_best_fitness:
                 selected_global_best = mutated_global_best
 
             # Implementa a estratégia current-to-best para o Xst
-            r1, r2 = np.random.randint(0, swarmSize), np.random.randint(0, swarmSize)
-            while r1 == i:
-                r1 = np.random.randint(0, swarmSize)
-            while r2 == i or r2 == r1:
-                r2 = np.random.randint(0, swarmSize)
+            r1, r2 = r1_r2[:, i]
 
             X_best = g_best.copy()
             X_r1 = swarm[r1].copy()
@@ -597,7 +584,7 @@ def c_deepso_powell_global_best_com_kmeans_v3(function, dimension, swarmSize, lo
             # Calcula vetor de velocidade da partícula
             inertia = W_i * velocity[i]
             cognitive = W_a * (X_st - particle)
-            social = W_c * (C @ (selected_global_best - particle))
+            social = W_c * (C * (selected_global_best - particle))
 
             velocity[i] = np.clip(inertia + cognitive + social, -max_v, max_v)
 
@@ -606,15 +593,8 @@ def c_deepso_powell_global_best_com_kmeans_v3(function, dimension, swarmSize, lo
 
         # Avalia se está na hora de mudar para o powell
         if k > 10 and k % 5 == 0:  # Pode ajustar o intervalo de verificação
-          kmeans = KMeans(n_clusters=2, n_init=10)  # Número de clusters pode ser ajustado
-          swarm_positions = np.array(swarm)
-          kmeans.fit(swarm_positions)
-          labels = kmeans.labels_
-          cluster_centers = kmeans.cluster_centers_
-
-          # Calcula a dispersão entre os clusters
-          intra_cluster_distance = np.mean([np.linalg.norm(swarm_positions[i] - cluster_centers[labels[i]])
-                                            for i in range(swarmSize)])
+          # Calcula a dispersão entre os clusters (2-means incremental, ver dispersion.py)
+          intra_cluster_distance = dispersion_monitor(swarm)
 
           dispersions.append(intra_cluster_distance)
 
@@ -666,9 +646,12 @@ def c_deepso_powell_global_best_com_kmeans_v2(function, dimension, swarmSize, lo
              T_com=0.5819630448962767,
              T_mut=0.1,
              type='sgpb',
-             F=0.5):
+             F=0.5,
+             rng=None):
+    rng = np.random.default_rng(rng)
+    dispersion_monitor = DispersionMonitor(rng=rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
     p_best = swarm.copy()
     p_best_fitness = np.array([function(p) for p in p_best])
@@ -693,16 +676,21 @@ def c_deepso_powell_global_best_com_kmeans_v2(function, dimension, swarmSize, lo
 
     g_best_fitness = evaluate_function(g_best)
 
-    # Inicializa a lista ordenada para as 10% melhores partículas
+    # Inicializa o arquivo das 10% melhores partículas
     num_top_particles = max(1, swarmSize // 10)
-    sorted_smb_particles = sorted((p_best_fitness[i], p_best[i].copy()) for i in range(num_top_particles))
+    elite_archive = EliteArchive(num_top_particles, dimension)
+    elite_archive.merge(p_best_fitness[:num_top_particles], p_best[:num_top_particles])
 
     while True:
+        mutations = rng.normal(0, 1, size=(swarmSize, 4))
+        communication_masks = generateCommunicationMask(dimension, T_com, rng, size=swarmSize)
+        partners = partner_indices(rng, swarmSize)
+        r1_r2 = distinct_partner_indices(rng, swarmSize, 2)
         for i in range(swarmSize):
             # Mutação dos pesos
-            W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-            W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+            W_i = np.clip(W_i + (T_mut * mutations[i, 0]), 0, 1)
+            W_a = np.clip(W_a + (T_mut * mutations[i, 1]), 0, 1)
+            W_c = np.clip(W_c + (T_mut * mutations[i, 2]), 0, 1)
 
             # Atualiza Particle Best e Global Best
             particle = swarm[i]
@@ -715,28 +703,23 @@ def c_deepso_powell_global_best_com_kmeans_v2(function, dimension, swarmSize, lo
                     g_best = particle.copy()
                     g_best_fitness = fitness
 
-            # Atualiza lista com as 10% melhores partículas utilizando busca binária
-            if fitness < sorted_smb_particles[-1][0]:
-                sorted_smb_particles.pop()  # Remove o pior (último) elemento
-                indice = bisect.bisect_left(sorted_smb_particles, fitness, key=lambda i: i[0])
-                sorted_smb_particles.insert(indice, (fitness, particle.copy()))
+            # Atualiza o arquivo das 10% melhores partículas
+            elite_archive.add(fitness, particle)
 
-            # Gera Matriz de Comunicação
-            C = generateMultiplicationMatrix(dimension, T_com)
+            # Vetor de comunicação (máscara 0/1 da diagonal de C)
+            C = communication_masks[i]
 
             # Extrai Xr conforme o tipo selecionado
             Xr = np.zeros((dimension))
 
-            r = np.random.randint(0, swarmSize)
-            while r == i:
-                r = np.random.randint(0, swarmSize)
+            r = partners[i]
 
             if type == 'sg':  # Extraído aleatoriamente da população atual
                 Xr = swarm[r].copy()
             elif type == 'pb':  # Extraído aleatoriamente dentre os 10% melhores salvos
-                Xr = choice([p for _, p in sorted_smb_particles])
+                Xr = elite_archive.sample(rng)
             elif type == 'sgpb':  # Média entre Sg e Pb
-                pb = choice([p for _, p in sorted_smb_particles])
+                pb = elite_archive.sample(rng)
                 Xr = ((swarm[r] + pb) / 2).copy()
             else:
                 return "Tipo inválido. Aceitos: sg, pb e sgpb."
@@ -746,16 +729,12 @@ def c_deepso_powell_global_best_com_kmeans_v2(function, dimension, swarmSize, lo
 
             # Realiza possível mutação do global best
             selected_global_best = g_best
-            mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+            mutated_global_best = np.clip(g_best * (1 + T_mut * mutations[i, 3]), lowerBound, upperBound)
             if evaluate_function(mutated_global_best) < g_best_fitness:
                 selected_global_best = mutated_global_best
 
             # Implementa a estratégia current-to-best para o Xst
-            r1, r2 = np.random.randint(0, swarmSize), np.random.randint(0, swarmSize)
-            while r1 == i:
-                r1 = np.random.randint(0, swarmSize)
-            while r2 == i or r2 == r1:
-                r2 = np.random.randint(0, swarmSize)
+            r1, r2 = r1_r2[:, i]
 
             X_best = g_best.copy()
             X_r1 = swarm[r1].copy()
@@ -766,7 +745,7 @@ def c_deepso_powell_global_best_com_kmeans_v2(function, dimension, swarmSize, lo
             # Calcula vetor de velocidade da partícula
             inertia = W_i * velocity[i]
             cognitive = W_a * (X_st - particle)
-            social = W_c * (C @ (selected_global_best - particle))
+            social = W_c * (C * (selected_global_best - particle))
 
             velocity[i] = np.clip(inertia + cognitive + social, -max_v, max_v)
 
@@ -781,13 +760,7 @@ def c_deepso_powell_global_best_com_kmeans_v2(function, dimension, swarmSize, lo
 
             normalized_swarm_positions = (swarm_positions - current_lower_bound) / (current_upper_bound - current_lower_bound)
 
-            kmeans = KMeans(n_clusters=2, n_init=10)
-            kmeans.fit(normalized_swarm_positions)
-            labels = kmeans.labels_
-            cluster_centers = kmeans.cluster_centers_
-
-            intra_cluster_distance = np.mean([np.linalg.norm(normalized_swarm_positions[i] - cluster_centers[labels[i]]) 
-                                  for i in range(swarmSize)])
+            intra_cluster_distance = dispersion_monitor(normalized_swarm_positions)
             
             proximity_threshold = 0.15 * D_max
 
@@ -826,9 +799,11 @@ def c_deepso(function, dimension, swarmSize, lowerBound, upperBound,
              T_com=0.5819630448962767,
              T_mut=0.1,
              type='sgpb',
-             F=0.5):
+             F=0.5,
+             rng=None):
+    rng = np.random.default_rng(rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
     p_best = swarm.copy()
     p_best_fitness = np.array([function(p) for p in p_best])
@@ -857,17 +832,22 @@ def c_deepso(function, dimension, swarmSize, lowerBound, upperBound,
             raise MaxFunEvalsReached
         return result
 
-    # Inicializa a lista ordenada para as 10% melhores partículas
+    # Inicializa o arquivo das 10% melhores partículas
     num_top_particles = max(1, swarmSize // 10)
-    sorted_smb_particles = sorted((p_best_fitness[i], p_best[i].copy()) for i in range(num_top_particles))
+    elite_archive = EliteArchive(num_top_particles, dimension)
+    elite_archive.merge(p_best_fitness[:num_top_particles], p_best[:num_top_particles])
 
     while True:
         try:
+            mutations = rng.normal(0, 1, size=(swarmSize, 4))
+            communication_masks = generateCommunicationMask(dimension, T_com, rng, size=swarmSize)
+            partners = partner_indices(rng, swarmSize)
+            r1_r2 = distinct_partner_indices(rng, swarmSize, 2)
             for i in range(swarmSize):
                 # Mutação dos pesos
-                W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+                W_i = np.clip(W_i + (T_mut * mutations[i, 0]), 0, 1)
+                W_a = np.clip(W_a + (T_mut * mutations[i, 1]), 0, 1)
+                W_c = np.clip(W_c + (T_mut * mutations[i, 2]), 0, 1)
 
                 # Atualiza Particle Best e Global Best
                 particle = swarm[i]
@@ -881,28 +861,23 @@ def c_deepso(function, dimension, swarmSize, lowerBound, upperBound,
                         g_best_fitness = fitness
                         g_best_fitness_list[-1] = g_best_fitness
 
-                # Atualiza lista com as 10% melhores partículas utilizando busca binária
-                if fitness < sorted_smb_particles[-1][0]:
-                    sorted_smb_particles.pop()  # Remove o pior (último) elemento
-                    indice = bisect.bisect_left(sorted_smb_particles, fitness, key=lambda i: i[0])
-                    sorted_smb_particles.insert(indice, (fitness, particle.copy()))
+                # Atualiza o arquivo das 10% melhores partículas
+                elite_archive.add(fitness, particle)
 
-                # Gera Matriz de Comunicação
-                C = generateMultiplicationMatrix(dimension, T_com)
+                # Vetor de comunicação (máscara 0/1 da diagonal de C)
+                C = communication_masks[i]
 
                 # Extrai Xr conforme o tipo selecionado
                 Xr = np.zeros((dimension))
 
-                r = np.random.randint(0, swarmSize)
-                while r == i:
-                    r = np.random.randint(0, swarmSize)
+                r = partners[i]
 
                 if type == 'sg':  # Extraído aleatoriamente da população atual
                     Xr = swarm[r].copy()
                 elif type == 'pb':  # Extraído aleatoriamente dentre os 10% melhores salvos
-                    Xr = choice([p for _, p in sorted_smb_particles])
+                    Xr = elite_archive.sample(rng)
                 elif type == 'sgpb':  # Média entre Sg e Pb
-                    pb = choice([p for _, p in sorted_smb_particles])
+                    pb = elite_archive.sample(rng)
                     Xr = ((swarm[r] + pb) / 2).copy()
                 else:
                     return "Tipo inválido. Aceitos: sg, pb e sgpb."
@@ -912,16 +887,12 @@ def c_deepso(function, dimension, swarmSize, lowerBound, upperBound,
 
                 # Realiza possível mutação do global best
                 selected_global_best = g_best
-                mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+                mutated_global_best = np.clip(g_best * (1 + T_mut * mutations[i, 3]), lowerBound, upperBound)
                 if evaluate_function(mutated_global_best) < g_best_fitness:
                     selected_global_best = mutated_global_best
 
                 # Implementa a estratégia current-to-best para o Xst
-                r1, r2 = np.random.randint(0, swarmSize), np.random.randint(0, swarmSize)
-                while r1 == i:
-                    r1 = np.random.randint(0, swarmSize)
-                while r2 == i or r2 == r1:
-                    r2 = np.random.randint(0, swarmSize)
+                r1, r2 = r1_r2[:, i]
 
                 X_best = g_best.copy()
                 X_r1 = swarm[r1].copy()
@@ -932,7 +903,7 @@ def c_deepso(function, dimension, swarmSize, lowerBound, upperBound,
                 # Calcula vetor de velocidade da partícula
                 inertia = W_i * velocity[i]
                 cognitive = W_a * (X_st - particle)
-                social = W_c * (C @ (selected_global_best - particle))
+                social = W_c * (C * (selected_global_best - particle))
 
                 velocity[i] = np.clip(inertia + cognitive + social, -max_v, max_v)
 
@@ -954,6 +925,145 @@ def c_deepso(function, dimension, swarmSize, lowerBound, upperBound,
 
     return g_best_fitness, g_best, g_best_fitness_list, positions, velocities, function_evals
 
+def c_deepso_vetorizado(function, dimension, swarmSize, lowerBound, upperBound,
+             max_iter=None,
+             max_fun_evals=None,
+             W_i=0.4019092098808389,
+             W_a=0.3791940368874607,
+             W_c=0.7539312405916303,
+             max_v=1.01,
+             T_com=0.5819630448962767,
+             T_mut=0.1,
+             type='sgpb',
+             F=0.5,
+             rng=None,
+             keep_history=False):
+    """
+    C-DEEPSO geracional com os mesmos operadores de `c_deepso`: p_best por
+    partícula, memória dos 10% melhores, teste de aceitação do Xr e mutação
+    do g_best. Em vez de uma partícula por vez, cada geração avalia em três
+    lotes (N, D) o enxame, os Xr candidatos e os g_best mutados, e `function`
+    recebe a matriz inteira.
+
+    Diferenças em relação a `c_deepso`: p_best, memória e g_best são
+    atualizados entre os lotes, e não partícula a partícula, e `positions` e
+    `velocities` só recebem uma cópia do enxame e das velocidades a cada
+    geração, como em `c_deepso`, com `keep_history=True`; por padrão voltam
+    vazias (uma cópia por geração não cabe na memória em 1000-D com 3M
+    avaliações). O passeio aleatório dos pesos continua sendo um passo por
+    partícula.
+    """
+    rng = np.random.default_rng(rng)
+    k = 0
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
+    velocity = np.zeros((swarmSize, dimension))
+    p_best = swarm.copy()
+    p_best_fitness = np.asarray(function(p_best), dtype=np.float64)
+    g_best_index = np.argmin(p_best_fitness)
+    g_best = p_best[g_best_index].copy()
+    g_best_fitness = p_best_fitness[g_best_index]
+    g_best_fitness_list = ConvergenceTrace()
+    velocities = []
+    positions = []
+    function_evals = 0
+    weights = np.array([W_i, W_a, W_c])
+
+    if max_iter is None and max_fun_evals is None:
+        max_iter = 100
+    if max_fun_evals is None:
+        max_fun_evals = np.inf
+
+    # Avalia um lote respeitando o orçamento. `running` registra na curva o
+    # melhor acumulado (lote que atualiza o g_best); senão cada avaliação é
+    # registrada contra o g_best atual, como em evaluate_function de c_deepso
+    def evaluate_batch(points, running=False):
+        nonlocal function_evals
+        if max_fun_evals - function_evals < len(points):
+            points = points[:int(max_fun_evals - function_evals)]
+        results = np.asarray(function(points), dtype=np.float64)
+        function_evals += len(results)
+        if running:
+            g_best_fitness_list.extend(np.fmin.accumulate(np.append(g_best_fitness, results))[1:])
+        else:
+            g_best_fitness_list.extend(np.minimum(results, g_best_fitness))
+        return results
+
+    # Inicializa o arquivo das 10% melhores partículas
+    num_top_particles = max(1, swarmSize // 10)
+    elite_archive = EliteArchive(num_top_particles, dimension)
+    elite_archive.merge(p_best_fitness[:num_top_particles], p_best[:num_top_particles])
+
+    while True:
+        mutations = rng.normal(0, 1, size=(swarmSize, 4))
+        communication_masks = generateCommunicationMask(dimension, T_com, rng, size=swarmSize)
+
+        # Mutação dos pesos: o mesmo passeio aleatório de c_deepso, um passo por partícula
+        particle_weights = np.empty((swarmSize, 3))
+        for i in range(swarmSize):
+            weights = np.clip(weights + T_mut * mutations[i, :3], 0, 1)
+            particle_weights[i] = weights
+
+        # Atualiza Particle Best e Global Best
+        fitness = evaluate_batch(swarm, running=True)
+        n = len(fitness)
+        improved = fitness < p_best_fitness[:n]
+        p_best[:n][improved] = swarm[:n][improved]
+        p_best_fitness[:n][improved] = fitness[improved]
+        best_index = np.argmin(fitness)
+        if fitness[best_index] < g_best_fitness:
+            g_best = swarm[best_index].copy()
+            g_best_fitness = fitness[best_index]
+        if function_evals >= max_fun_evals:
+            break
+
+        # Atualiza o arquivo das 10% melhores partículas com o lote
+        elite_archive.merge(fitness, swarm)
+
+        # Extrai Xr conforme o tipo selecionado
+        if type not in ('sg', 'pb', 'sgpb'):
+            return "Tipo inválido. Aceitos: sg, pb e sgpb."
+        if type in ('sg', 'sgpb'):
+            Xr = swarm[partner_indices(rng, swarmSize)]
+        if type in ('pb', 'sgpb'):
+            pb = elite_archive.sample(rng, swarmSize)
+            Xr = pb if type == 'pb' else (Xr + pb) / 2
+
+        # Fica com Xr apenas se o fitness dele não for maior que o da partícula corrente
+        Xr_fitness = evaluate_batch(Xr)
+        if function_evals >= max_fun_evals:
+            break
+        rejected = Xr_fitness > fitness
+        Xr[rejected] = swarm[rejected]
+
+        # Realiza possível mutação do global best
+        mutated_global_best = np.clip(g_best * (1 + T_mut * mutations[:, 3:4]), lowerBound, upperBound)
+        mutated_fitness = evaluate_batch(mutated_global_best)
+        if function_evals >= max_fun_evals:
+            break
+        selected_global_best = np.where((mutated_fitness < g_best_fitness)[:, np.newaxis], mutated_global_best, g_best)
+
+        # Estratégia current-to-best para o Xst e equação de movimento nas matrizes
+        X_st = Xr + F * (g_best - Xr)
+        inertia = particle_weights[:, 0:1] * velocity
+        cognitive = particle_weights[:, 1:2] * (X_st - swarm)
+        social = particle_weights[:, 2:3] * (communication_masks * (selected_global_best - swarm))
+        velocity = np.clip(inertia + cognitive + social, -max_v, max_v)
+        swarm = np.clip(swarm + velocity, lowerBound, upperBound)
+        del Xr, X_st, inertia, cognitive, social, selected_global_best, mutated_global_best
+
+        if keep_history:
+            positions.append(swarm.copy())
+            velocities.append(velocity.copy())
+        k += 1
+
+        if max_iter is not None and max_iter == k:
+            break
+
+        if max_fun_evals <= function_evals:
+            break
+
+    return g_best_fitness, g_best, g_best_fitness_list, positions, velocities, function_evals
+
 def c_deepso_powell_global_best(function, dimension, swarmSize, lowerBound, upperBound,
              percent_powell_start_moment = 0.5,
              percent_powell_func_evals = 0.15,
@@ -966,9 +1076,11 @@ def c_deepso_powell_global_best(function, dimension, swarmSize, lowerBound, uppe
              T_com=0.5819630448962767,
              T_mut=0.1,
              type='sgpb',
-             F=0.5):
+             F=0.5,
+             rng=None):
+    rng = np.random.default_rng(rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
     p_best = swarm.copy()
     p_best_fitness = np.array([function(p) for p in p_best])
@@ -1012,17 +1124,22 @@ def c_deepso_powell_global_best(function, dimension, swarmSize, lowerBound, uppe
             raise MaxFunEvalsReached
         return result
 
-    # Inicializa a lista ordenada para as 10% melhores partículas
+    # Inicializa o arquivo das 10% melhores partículas
     num_top_particles = max(1, swarmSize // 10)
-    sorted_smb_particles = sorted((p_best_fitness[i], p_best[i].copy()) for i in range(num_top_particles))
+    elite_archive = EliteArchive(num_top_particles, dimension)
+    elite_archive.merge(p_best_fitness[:num_top_particles], p_best[:num_top_particles])
 
     while True:
         try:
+            mutations = rng.normal(0, 1, size=(swarmSize, 4))
+            communication_masks = generateCommunicationMask(dimension, T_com, rng, size=swarmSize)
+            partners = partner_indices(rng, swarmSize)
+            r1_r2 = distinct_partner_indices(rng, swarmSize, 2)
             for i in range(swarmSize):
                 # Mutação dos pesos
-                W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+                W_i = np.clip(W_i + (T_mut * mutations[i, 0]), 0, 1)
+                W_a = np.clip(W_a + (T_mut * mutations[i, 1]), 0, 1)
+                W_c = np.clip(W_c + (T_mut * mutations[i, 2]), 0, 1)
 
                 # Atualiza Particle Best e Global Best
                 particle = swarm[i]
@@ -1036,28 +1153,23 @@ def c_deepso_powell_global_best(function, dimension, swarmSize, lowerBound, uppe
                         g_best_fitness = fitness
                         g_best_fitness_list[-1] = g_best_fitness
 
-                # Atualiza lista com as 10% melhores partículas utilizando busca binária
-                if fitness < sorted_smb_particles[-1][0]:
-                    sorted_smb_particles.pop()  # Remove o pior (último) elemento
-                    indice = bisect.bisect_left(sorted_smb_particles, fitness, key=lambda i: i[0])
-                    sorted_smb_particles.insert(indice, (fitness, particle.copy()))
+                # Atualiza o arquivo das 10% melhores partículas
+                elite_archive.add(fitness, particle)
 
-                # Gera Matriz de Comunicação
-                C = generateMultiplicationMatrix(dimension, T_com)
+                # Vetor de comunicação (máscara 0/1 da diagonal de C)
+                C = communication_masks[i]
 
                 # Extrai Xr conforme o tipo selecionado
                 Xr = np.zeros((dimension))
 
-                r = np.random.randint(0, swarmSize)
-                while r == i:
-                    r = np.random.randint(0, swarmSize)
+                r = partners[i]
 
                 if type == 'sg':  # Extraído aleatoriamente da população atual
                     Xr = swarm[r].copy()
                 elif type == 'pb':  # Extraído aleatoriamente dentre os 10% melhores salvos
-                    Xr = choice([p for _, p in sorted_smb_particles])
+                    Xr = elite_archive.sample(rng)
                 elif type == 'sgpb':  # Média entre Sg e Pb
-                    pb = choice([p for _, p in sorted_smb_particles])
+                    pb = elite_archive.sample(rng)
                     Xr = ((swarm[r] + pb) / 2).copy()
                 else:
                     return "Tipo inválido. Aceitos: sg, pb e sgpb."
@@ -1067,16 +1179,12 @@ def c_deepso_powell_global_best(function, dimension, swarmSize, lowerBound, uppe
 
                 # Realiza possível mutação do global best
                 selected_global_best = g_best
-                mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+                mutated_global_best = np.clip(g_best * (1 + T_mut * mutations[i, 3]), lowerBound, upperBound)
                 if evaluate_function(mutated_global_best) < g_best_fitness:
                     selected_global_best = mutated_global_best
 
                 # Implementa a estratégia current-to-best para o Xst
-                r1, r2 = np.random.randint(0, swarmSize), np.random.randint(0, swarmSize)
-                while r1 == i:
-                    r1 = np.random.randint(0, swarmSize)
-                while r2 == i or r2 == r1:
-                    r2 = np.random.randint(0, swarmSize)
+                r1, r2 = r1_r2[:, i]
 
                 X_best = g_best.copy()
                 X_r1 = swarm[r1].copy()
@@ -1087,7 +1195,7 @@ def c_deepso_powell_global_best(function, dimension, swarmSize, lowerBound, uppe
                 # Calcula vetor de velocidade da partícula
                 inertia = W_i * velocity[i]
                 cognitive = W_a * (X_st - particle)
-                social = W_c * (C @ (selected_global_best - particle))
+                social = W_c * (C * (selected_global_best - particle))
 
                 velocity[i] = np.clip(inertia + cognitive + social, -max_v, max_v)
 
@@ -1146,9 +1254,11 @@ def c_deepso_powell_global_best_paralelo_metade(function, dimension, swarmSize,
              T_com=0.5819630448962767,
              T_mut=0.1,
              type='sgpb',
-             F=0.5):
+             F=0.5,
+             rng=None):
+    rng = np.random.default_rng(rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
     g_best_fitness_list = []
     fitness_list = []
@@ -1236,8 +1346,7 @@ def c_deepso_powell_global_best_paralelo_metade(function, dimension, swarmSize,
     num_top_particles = max(1, swarmSize // 10)
 
     def get_top_10_percent_particles(swarm, fitness_list, num_top_particles):
-        sorted_indices = np.argsort(fitness_list)
-        top_indices = sorted_indices[:num_top_particles]
+        top_indices = top_k_indices(fitness_list, num_top_particles)
         top_particles = swarm[top_indices]
         return top_particles, top_indices
     
@@ -1246,9 +1355,10 @@ def c_deepso_powell_global_best_paralelo_metade(function, dimension, swarmSize,
         while True:
             try:
                 # Mutação dos pesos
-                W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+                mutation = rng.normal(0, 1, size=4)
+                W_i = np.clip(W_i + (T_mut * mutation[0]), 0, 1)
+                W_a = np.clip(W_a + (T_mut * mutation[1]), 0, 1)
+                W_c = np.clip(W_c + (T_mut * mutation[2]), 0, 1)
 
                 # Extrai Xr conforme o tipo selecionado
                 
@@ -1258,38 +1368,20 @@ def c_deepso_powell_global_best_paralelo_metade(function, dimension, swarmSize,
                 top_particles = None
 
                 if type == 'sg':
-                    random_indices = np.random.randint(0, swarmSize, size=(swarmSize,))
-                    same_particle_mask = (random_indices == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_indices[same_particle_mask] = np.random.randint(0, swarmSize, size=np.sum(same_particle_mask))
-                        same_particle_mask = (random_indices == np.arange(swarmSize))
+                    random_indices = partner_indices(rng, swarmSize)
                     
                     Xr_matrix = swarm[random_indices]
                 elif type == 'pb':
                     top_particles, top_indices = get_top_10_percent_particles(swarm, fitness_list, num_top_particles)
-                    random_top_indices = np.random.randint(0, len(top_particles), size=(swarmSize,))
-                    same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_top_indices[same_particle_mask] = np.random.randint(0, len(top_particles), size=np.sum(same_particle_mask))
-                        same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
+                    random_top_indices = top_partner_indices(rng, top_indices, swarmSize)
                     
                     Xr_matrix = top_particles[random_top_indices]
                 elif type == 'sgpb':  
-                    random_indices = np.random.randint(0, swarmSize, size=(swarmSize,))
-                    
-                    same_particle_mask = (random_indices == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_indices[same_particle_mask] = np.random.randint(0, swarmSize, size=np.sum(same_particle_mask))
-                        same_particle_mask = (random_indices == np.arange(swarmSize))
+                    random_indices = partner_indices(rng, swarmSize)
                     
                     Xr_matrix = swarm[random_indices]
                     top_particles, top_indices = get_top_10_percent_particles(swarm, fitness_list, num_top_particles)
-                    random_top_indices = np.random.randint(0, len(top_particles), size=(swarmSize,))
-                    
-                    same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_top_indices[same_particle_mask] = np.random.randint(0, len(top_particles), size=np.sum(same_particle_mask))
-                        same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
+                    random_top_indices = top_partner_indices(rng, top_indices, swarmSize)
 
                     Xr_matrix = (Xr_matrix + top_particles[random_top_indices]) / 2
                 
@@ -1310,10 +1402,10 @@ def c_deepso_powell_global_best_paralelo_metade(function, dimension, swarmSize,
                 X_st_matrix = Xr_matrix + F * (g_best - Xr_matrix) #+ F * (Xr1_matrix - Xr2_matrix)
                 # del Xr1_matrix, Xr2_matrix
                 # Gera matriz/vetor de comunicação
-                C = np.random.choice([0, 1], size=dimension, p=[1-T_com, T_com])
+                C = rng.choice([0, 1], size=dimension, p=[1-T_com, T_com])
 
                 selected_global_best = g_best
-                mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+                mutated_global_best = np.clip(g_best * (1 + T_mut * mutation[3]), lowerBound, upperBound)
                 # if evaluate_function(mutated_global_best) < g_best_fitness:
                 selected_global_best = mutated_global_best
 
@@ -1409,11 +1501,51 @@ def c_deepso_powell_global_best_paralelo(function, dimension, swarmSize, lowerBo
              T_com=0.58,
              T_mut=0.1,
              type='sgpb',
-             F=0.8):
+             F=0.8,
+             in_place=False,
+             powell_batch_points=None,
+             line_search_method='golden',
+             incremental_function=None,
+             cache=None,
+             rng=None,
+             checkpoint_path=None,
+             checkpoint_every=100_000,
+             powell_schedule=None,
+             milestone_recorder=None,
+             persistent_elite=False,
+             profiler=None):
+    """
+    PC-DEEPSO: C-DEEPSO vetorizado com fases de Powell a partir do g_best.
+
+    Com `checkpoint_path` o estado completo (enxame, velocidades, pesos,
+    g_best, contador de avaliações, estado do gerador, curva e, durante o
+    Powell, direções e posição) é gravado a cada `checkpoint_every`
+    avaliações; se o arquivo já existir a execução é retomada dele. O
+    conteúdo de `cache` não faz parte do checkpoint.
+
+    `powell_schedule` (powell_schedule.PowellSchedule) decide quando o Powell
+    começa e por quantas avaliações roda; o padrão são as janelas do CEC2013
+    (FixedWindows.cec2013). `milestone_recorder` (MilestoneRecorder) registra o
+    melhor fitness em contagens de avaliações arbitrárias; os valores de 120k
+    e 600k continuam na tupla de retorno quando fazem parte dos marcos.
+
+    Com `persistent_elite` as estratégias 'pb' e 'sgpb' sorteiam de um
+    EliteArchive com as 10% melhores posições já avaliadas na execução
+    inteira, em vez dos 10% melhores do enxame atual.
+
+    `profiler` (instrumentation.PhaseProfiler) mede tempo e avaliações das
+    fases seleção do Xr, movimento, avaliação da população, agendamento,
+    Powell (com as buscas lineares e extrapolações de `powell`), gc, tqdm e
+    checkpoint; o resumo fica em `profiler.summary()`.
+    """
+    rng = np.random.default_rng(rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
-    g_best_fitness_list = []
+    g_best_fitness_list = ConvergenceTrace()
+    # Ainda sem g_best: a primeira avaliação da população o define
+    g_best = None
+    g_best_fitness = np.inf
     fitness_list = []
     velocities = []
     positions = []
@@ -1421,14 +1553,15 @@ def c_deepso_powell_global_best_paralelo(function, dimension, swarmSize, lowerBo
     powell_func_evals = int(max_fun_evals * percent_powell_func_evals) if max_fun_evals is not None else None
     powell_start_func_evals = int(max_fun_evals*percent_powell_start_moment) if max_fun_evals is not None else None
     powell_stop_func_evals = int(powell_start_func_evals + powell_func_evals) if max_fun_evals is not None else None
-    g_best_fitness_120k_evals = None
-    g_best_fitness_600k_evals = None
+    if powell_schedule is None:
+        powell_schedule = FixedWindows.cec2013(powell_func_evals)
+    if milestone_recorder is None:
+        milestone_recorder = MilestoneRecorder()
+    powell_max_iter = None
     g_best_fitness_before_powell = None
     g_best_fitness_after_powell = None
     previous_func_evals = 0
-    powell_primeiro_marco_evals = int(powell_func_evals * 0.04)
-    powell_segundo_marco_evals = int(powell_func_evals * 0.2)
-    powell_terceiro_marco_evals = int(powell_func_evals * 0.76)
+    population_evals = 0
 
     if max_iter is None and max_fun_evals is None:
         max_iter = 100
@@ -1436,14 +1569,32 @@ def c_deepso_powell_global_best_paralelo(function, dimension, swarmSize, lowerBo
     def get_function_evals():
         nonlocal function_evals
         return function_evals
+
+    if profiler is None:
+        profiler = NULL_PROFILER
+    elif profiler.eval_counter is None:
+        profiler.eval_counter = get_function_evals
     
-    def evaluate_function(particle):
+    # `result` permite registrar um valor já calculado (ex.: pelo objetivo incremental do Powell)
+    # Com `cache` (evaluation_cache.EvaluationCache) pontos já avaliados não chamam `function`;
+    # se cache.count_hits for False eles também não consomem o orçamento
+    def evaluate_function(particle, result=None):
         nonlocal function_evals
         nonlocal max_iter
         nonlocal g_best_fitness, g_best
         nonlocal g_best_fitness_list
-        nonlocal g_best_fitness_120k_evals, g_best_fitness_600k_evals
-        result = function(particle)
+        if cache is not None:
+            cached = cache.get(particle)
+            if cached is not None:
+                result = cached
+                if not cache.count_hits:
+                    return result
+            else:
+                if result is None:
+                    result = function(particle)
+                cache.put(particle, result)
+        if result is None:
+            result = function(particle)
         function_evals += 1
         if result < g_best_fitness:
             g_best_fitness = result
@@ -1451,10 +1602,7 @@ def c_deepso_powell_global_best_paralelo(function, dimension, swarmSize, lowerBo
             g_best_fitness_list.append(result)
         else:
             g_best_fitness_list.append(g_best_fitness)
-        if function_evals == 120_000:
-            g_best_fitness_120k_evals = g_best_fitness
-        if function_evals == 600_000:
-            g_best_fitness_600k_evals = g_best_fitness
+        milestone_recorder.record_point(function_evals, g_best_fitness)
         if function_evals >= max_fun_evals:
             if result < g_best_fitness:
                 g_best_fitness = result
@@ -1467,95 +1615,215 @@ def c_deepso_powell_global_best_paralelo(function, dimension, swarmSize, lowerBo
         nonlocal fitness_list
         nonlocal g_best_fitness
         nonlocal g_best
-        nonlocal g_best_fitness_120k_evals, g_best_fitness_600k_evals
+        nonlocal population_evals
 
         remaining_evals = max_fun_evals - function_evals
 
-        if remaining_evals < swarmSize:
+        if cache is not None:
+            fitness_list, counted = cache.evaluate_batch(swarm, remaining_evals)
+            population_evals = int(counted.sum())
+        elif remaining_evals < swarmSize:
             fitness_list = function(swarm[:remaining_evals])
-            function_evals += remaining_evals
+            population_evals = remaining_evals
         else:
             fitness_list = function(swarm)
-            function_evals += swarmSize
+            population_evals = swarmSize
+        function_evals += population_evals
 
-        if function_evals >= 120_000 and g_best_fitness_120k_evals is None:
-            g_best_fitness_120k_evals = g_best_fitness
-        if function_evals >= 600_000 and g_best_fitness_600k_evals is None:
-            g_best_fitness_600k_evals = g_best_fitness
+        milestone_recorder.record_population(function_evals, g_best_fitness)
 
         if function_evals >= max_fun_evals:
             candidate_g_best_index = np.argmin(fitness_list)
             candidate_g_best_fitness = fitness_list[candidate_g_best_index]
             if candidate_g_best_fitness < g_best_fitness:
                 g_best_fitness = candidate_g_best_fitness
-                g_best = swarm[candidate_g_best_index]
-            g_best_fitness_list.extend([g_best_fitness] * len(fitness_list))
+                g_best = swarm[candidate_g_best_index].copy()
+            g_best_fitness_list.extend_constant(g_best_fitness, population_evals)
             raise MaxFunEvalsReached
 
-    evaluate_population(swarm)
-    g_best_index = np.argmin(fitness_list)
-    g_best = swarm[g_best_index]
-    g_best_fitness = fitness_list[g_best_index]
-    g_best_fitness_list.extend([g_best_fitness] * len(fitness_list))    
+    # Avalia um lote de pontos (ex.: passos da busca linear do Powell) em uma única
+    # chamada, registrando cada ponto como uma avaliação na ordem em que aparecem
+    def evaluate_points(points, results=None):
+        nonlocal function_evals
+        nonlocal g_best_fitness, g_best
+        if cache is not None:
+            results, counted = cache.evaluate_batch(points, max_fun_evals - function_evals, results)
+            points = points[:len(results)]
+            counted_results = results[counted]
+        else:
+            points = points[:max_fun_evals - function_evals]
+            if results is None:
+                results = function(points)
+            results = np.asarray(results)[:len(points)]
+            counted_results = results
+        running_best = np.fmin.accumulate(np.append(g_best_fitness, counted_results))[1:]
+        milestone_recorder.record_points(function_evals, running_best)
+        function_evals += len(counted_results)
+        best_index = np.nanargmin(results) if not np.all(np.isnan(results)) else 0
+        if results[best_index] < g_best_fitness:
+            g_best_fitness = results[best_index]
+            g_best = points[best_index].copy()
+        g_best_fitness_list.extend(running_best)
+        if function_evals >= max_fun_evals:
+            raise MaxFunEvalsReached
+        return results
+
+    checkpoint = load_checkpoint(checkpoint_path)
+    if checkpoint is None:
+        with profiler.phase('avaliacao_populacao'):
+            evaluate_population(swarm)
+        g_best_index = np.argmin(fitness_list)
+        g_best = swarm[g_best_index].copy()
+        g_best_fitness = fitness_list[g_best_index]
+        g_best_fitness_list.extend_constant(g_best_fitness, population_evals)
 
     # Inicializa a lista ordenada para as 10% melhores partículas
     num_top_particles = max(1, swarmSize // 10)
 
     def get_top_10_percent_particles(swarm, fitness_list, num_top_particles):
-        sorted_indices = np.argsort(fitness_list)
-        top_indices = sorted_indices[:num_top_particles]
+        top_indices = top_k_indices(fitness_list, num_top_particles)
         top_particles = swarm[top_indices]
         return top_particles, top_indices
+
+    elite_archive = EliteArchive(num_top_particles, dimension) if persistent_elite else None
+    if elite_archive is not None and checkpoint is None:
+        elite_archive.merge(fitness_list, swarm)
+
+    last_checkpoint_evals = function_evals
+
+    def write_checkpoint(powell_state=None):
+        nonlocal last_checkpoint_evals
+        trace_state = g_best_fitness_list.__getstate__()
+        state = {'k': k, 'swarm': swarm, 'velocity': velocity, 'fitness_list': fitness_list,
+                 'weights': np.array([W_i, W_a, W_c]), 'g_best': g_best, 'g_best_fitness': g_best_fitness,
+                 'function_evals': function_evals, 'powell_stop_func_evals': powell_stop_func_evals,
+                 'phase_max_iter': powell_max_iter, 'milestones': milestone_recorder.state_dict(),
+                 'schedule': powell_schedule.state_dict(),
+                 'g_best_fitness_before_powell': g_best_fitness_before_powell,
+                 'g_best_fitness_after_powell': g_best_fitness_after_powell,
+                 'trace_evals': trace_state['evals'], 'trace_values': trace_state['values'],
+                 'trace_length': trace_state['length'], 'rng': rng.bit_generator.state}
+        if powell_state is not None:
+            state.update({f"powell_{key}": value for key, value in powell_state.items()})
+        if elite_archive is not None:
+            state.update({f"elite_{key}": value for key, value in elite_archive.state_dict().items()})
+        save_checkpoint(checkpoint_path, state)
+        last_checkpoint_evals = function_evals
+
+    def checkpoint_due():
+        return checkpoint_path is not None and function_evals - last_checkpoint_evals >= checkpoint_every
+
+    def on_powell_sweep(powell_state):
+        if checkpoint_due():
+            with profiler.phase('checkpoint'):
+                write_checkpoint(powell_state)
+
+    def run_powell(powell_state=None):
+        nonlocal g_best, g_best_fitness, g_best_fitness_after_powell
+        powell_options = {'line_search_method': line_search_method, 'incremental': incremental_function,
+                          'state': powell_state, 'on_sweep': on_powell_sweep, 'profiler': profiler}
+        if powell_batch_points is not None:
+            powell_options.update(batch_function=evaluate_points, batch_points=powell_batch_points)
+        result = powell(evaluate_function, g_best, (lowerBound, upperBound), powell_stop_func_evals, get_function_evals,
+                        max_iter=powell_max_iter, **powell_options)
+        candidate = result.copy()
+        candidate_fitness = evaluate_function(candidate)
+        if candidate_fitness < g_best_fitness:
+            g_best = candidate.copy()
+            g_best_fitness = candidate_fitness
+        g_best_fitness_after_powell = g_best_fitness
+
+    # Retoma do checkpoint, se houver
+    resume_powell_state = None
+    if checkpoint is not None:
+        k = checkpoint['k']
+        swarm, velocity, fitness_list = checkpoint['swarm'], checkpoint['velocity'], checkpoint['fitness_list']
+        W_i, W_a, W_c = checkpoint['weights']
+        g_best, g_best_fitness = checkpoint['g_best'], checkpoint['g_best_fitness']
+        function_evals = last_checkpoint_evals = checkpoint['function_evals']
+        powell_stop_func_evals = checkpoint.get('powell_stop_func_evals', powell_stop_func_evals)
+        powell_max_iter = checkpoint.get('phase_max_iter')
+        milestone_recorder.load_state_dict(checkpoint['milestones'])
+        powell_schedule.load_state_dict(checkpoint['schedule'])
+        g_best_fitness_before_powell = checkpoint.get('g_best_fitness_before_powell')
+        g_best_fitness_after_powell = checkpoint.get('g_best_fitness_after_powell')
+        g_best_fitness_list = ConvergenceTrace.from_change_points(checkpoint['trace_evals'], checkpoint['trace_values'],
+                                                                  checkpoint['trace_length'])
+        rng.bit_generator.state = checkpoint['rng']
+        if elite_archive is not None and 'elite_fitness' in checkpoint:
+            elite_archive.load_state_dict({'positions': checkpoint['elite_positions'],
+                                           'fitness': checkpoint['elite_fitness']})
+        if 'powell_x' in checkpoint:
+            resume_powell_state = {key[len('powell_'):]: value for key, value in checkpoint.items() if key.startswith('powell_')
+                                   and key != 'powell_stop_func_evals'}
+
+    # No modo in_place as matrizes de trabalho são alocadas uma única vez e
+    # reaproveitadas em todas as iterações, dispensando o gc.collect() por iteração
+    Xr_buffer = X_st_buffer = work_buffer = None
+    if in_place:
+        Xr_buffer = np.empty((swarmSize, dimension))
+        X_st_buffer = np.empty((swarmSize, dimension))
+        work_buffer = np.empty((swarmSize, dimension))
+
+    def gather(source, indices, out):
+        if in_place:
+            return np.take(source, indices, axis=0, out=out)
+        return source[indices]
     
     position_tqdm = (id_execucao % 5) + 1
     with tqdm(total=max_fun_evals, position=position_tqdm, desc=f"Execução {id_execucao}", unit="evals", leave=False) as pbar:
+        # Checkpoint gravado durante o Powell: termina essa fase antes de voltar ao laço
+        if resume_powell_state is not None:
+            try:
+                with profiler.phase('powell'):
+                    run_powell(resume_powell_state)
+                k += 1
+            except MaxFunEvalsReached:
+                return g_best_fitness, g_best, g_best_fitness_list, positions, velocities, function_evals, milestone_recorder.get(120_000), milestone_recorder.get(600_000), g_best_fitness_before_powell, g_best_fitness_after_powell
+        pbar.update(function_evals)
+        previous_func_evals = function_evals
+        stalled_generations = 0
         while True:
             try:
                 # Mutação dos pesos
-                W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
-
-                # Extrai Xr conforme o tipo selecionado
-                Xr_matrix = None
-                top_indices = None
-                top_particles = None
-
-                if type == 'sg':
-                    random_indices = np.random.randint(0, swarmSize, size=(swarmSize,))
-                    same_particle_mask = (random_indices == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_indices[same_particle_mask] = np.random.randint(0, swarmSize, size=np.sum(same_particle_mask))
-                        same_particle_mask = (random_indices == np.arange(swarmSize))
+                mutation = rng.normal(0, 1, size=4)
+                W_i = np.clip(W_i + (T_mut * mutation[0]), 0, 1)
+                W_a = np.clip(W_a + (T_mut * mutation[1]), 0, 1)
+                W_c = np.clip(W_c + (T_mut * mutation[2]), 0, 1)
+
+                with profiler.phase('selecao_xr'):
+                    # Extrai Xr conforme o tipo selecionado
+                    Xr_matrix = None
+                    top_indices = None
+                    top_particles = None
+
+                    if type == 'sg':
+                        random_indices = partner_indices(rng, swarmSize)
                     
-                    Xr_matrix = swarm[random_indices]
-                elif type == 'pb':
-                    top_particles, top_indices = get_top_10_percent_particles(swarm, fitness_list, num_top_particles)
-                    random_top_indices = np.random.randint(0, len(top_particles), size=(swarmSize,))
-                    same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_top_indices[same_particle_mask] = np.random.randint(0, len(top_particles), size=np.sum(same_particle_mask))
-                        same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
+                        Xr_matrix = gather(swarm, random_indices, Xr_buffer)
+                    elif type == 'pb':
+                        if elite_archive is not None:
+                            top_particles, random_top_indices = elite_archive.positions, elite_archive.sample_indices(rng, swarmSize)
+                        else:
+                            top_particles, top_indices = get_top_10_percent_particles(swarm, fitness_list, num_top_particles)
+                            random_top_indices = top_partner_indices(rng, top_indices, swarmSize)
                     
-                    Xr_matrix = top_particles[random_top_indices]
-                elif type == 'sgpb':  
-                    random_indices = np.random.randint(0, swarmSize, size=(swarmSize,))
-                    
-                    same_particle_mask = (random_indices == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_indices[same_particle_mask] = np.random.randint(0, swarmSize, size=np.sum(same_particle_mask))
-                        same_particle_mask = (random_indices == np.arange(swarmSize))
-                    
-                    Xr_matrix = swarm[random_indices]
-                    top_particles, top_indices = get_top_10_percent_particles(swarm, fitness_list, num_top_particles)
-                    random_top_indices = np.random.randint(0, len(top_particles), size=(swarmSize,))
+                        Xr_matrix = gather(top_particles, random_top_indices, Xr_buffer)
+                    elif type == 'sgpb':  
+                        random_indices = partner_indices(rng, swarmSize)
                     
-                    same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_top_indices[same_particle_mask] = np.random.randint(0, len(top_particles), size=np.sum(same_particle_mask))
-                        same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
-
-                    Xr_matrix = (Xr_matrix + top_particles[random_top_indices]) / 2
+                        Xr_matrix = gather(swarm, random_indices, Xr_buffer)
+                        if elite_archive is not None:
+                            top_particles, random_top_indices = elite_archive.positions, elite_archive.sample_indices(rng, swarmSize)
+                        else:
+                            top_particles, top_indices = get_top_10_percent_particles(swarm, fitness_list, num_top_particles)
+                            random_top_indices = top_partner_indices(rng, top_indices, swarmSize)
+
+                        if in_place:
+                            Xr_matrix += gather(top_particles, random_top_indices, work_buffer)
+                            Xr_matrix /= 2
+                        else:
+                            Xr_matrix = (Xr_matrix + top_particles[random_top_indices]) / 2
                 
                 # Pega X_r1 e X_r2
                 # random_indices_r1 = np.random.randint(0, swarmSize, size=(swarmSize,))
@@ -1570,64 +1838,73 @@ def c_deepso_powell_global_best_paralelo(function, dimension, swarmSize, lowerBo
                 # Xr1_matrix = swarm[random_indices_r1]
                 # Xr2_matrix = swarm[random_indices_r2]
                 
-                # Calcula X_st com a estratégia current-to-best-2
-                X_st_matrix = Xr_matrix + F * (g_best - Xr_matrix) #+ F * (Xr1_matrix - Xr2_matrix)
-
-                # Gera matriz/vetor de comunicação
-                C = np.random.choice([0, 1], size=dimension, p=[1-T_com, T_com])
-
-                selected_global_best = g_best
-                mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
-                # if evaluate_function(mutated_global_best) < g_best_fitness:
-                selected_global_best = mutated_global_best
-
-                # Equação de movimento nas matrizes
-                inertia = W_i * velocity
-                cognitive = W_a * (X_st_matrix - swarm)
-                social = W_c * C * (selected_global_best - swarm)
-                velocity = np.clip(inertia + cognitive + social, -max_v, max_v)
-                swarm = np.clip(swarm + velocity, lowerBound, upperBound)
+                with profiler.phase('movimento'):
+                    # Calcula X_st com a estratégia current-to-best-2
+                    if in_place:
+                        X_st_matrix = np.subtract(g_best, Xr_matrix, out=X_st_buffer)
+                        X_st_matrix *= F
+                        X_st_matrix += Xr_matrix
+                    else:
+                        X_st_matrix = Xr_matrix + F * (g_best - Xr_matrix) #+ F * (Xr1_matrix - Xr2_matrix)
+
+                    # Gera matriz/vetor de comunicação
+                    C = rng.choice([0, 1], size=dimension, p=[1-T_com, T_com])
+
+                    selected_global_best = g_best
+                    mutated_global_best = np.clip(g_best * (1 + T_mut * mutation[3]), lowerBound, upperBound)
+                    # if evaluate_function(mutated_global_best) < g_best_fitness:
+                    selected_global_best = mutated_global_best
 
-                evaluate_population(swarm)
-
-                candidate_g_best_index = np.argmin(fitness_list)
-                candidate_g_best_fitness = fitness_list[candidate_g_best_index]
-                if candidate_g_best_fitness < g_best_fitness:
-                    g_best_fitness = candidate_g_best_fitness
-                    g_best = swarm[candidate_g_best_index]
-                    g_best_index = candidate_g_best_index
-                g_best_fitness_list.extend([g_best_fitness] * len(fitness_list))
+                    # Equação de movimento nas matrizes
+                    if in_place:
+                        update_swarm_in_place(swarm, velocity, X_st_matrix, selected_global_best, C,
+                                              W_i, W_a, W_c, max_v, lowerBound, upperBound, work_buffer)
+                    else:
+                        inertia = W_i * velocity
+                        cognitive = W_a * (X_st_matrix - swarm)
+                        social = W_c * C * (selected_global_best - swarm)
+                        velocity = np.clip(inertia + cognitive + social, -max_v, max_v)
+                        swarm = np.clip(swarm + velocity, lowerBound, upperBound)
+
+                with profiler.phase('avaliacao_populacao'):
+                    evaluate_population(swarm)
+                    if elite_archive is not None:
+                        elite_archive.merge(fitness_list, swarm)
+
+                    candidate_g_best_index = np.argmin(fitness_list)
+                    candidate_g_best_fitness = fitness_list[candidate_g_best_index]
+                    if candidate_g_best_fitness < g_best_fitness:
+                        g_best_fitness = candidate_g_best_fitness
+                        g_best = swarm[candidate_g_best_index].copy()
+                        g_best_index = candidate_g_best_index
+                    g_best_fitness_list.extend_constant(g_best_fitness, population_evals)
 
                 
 
-                if function_evals >= 60_000 and function_evals <= 60_000 + powell_primeiro_marco_evals \
-                    or function_evals >= 360_000 and function_evals <= 360_000 + powell_segundo_marco_evals \
-                    or function_evals >= 1_800_000 and function_evals <= 1_800_000 + powell_terceiro_marco_evals:
+                with profiler.phase('agendamento'):
+                    powell_phase = powell_schedule(function_evals, k, g_best_fitness, swarm, fitness_list)
+                if powell_phase is not None:
                     # print(f"Comecou powell na iter {k} com {function_evals} fun evals e g_best: {g_best_fitness}")
-                    # print(f"powell_start: {powell_start_func_evals} powell_stop: {powell_stop_func_evals}")
-                    if 60000 <= function_evals <= 60000 + powell_primeiro_marco_evals:
-                        powell_stop_func_evals = function_evals + powell_primeiro_marco_evals
-                    elif 360000 <= function_evals <= 360000 + powell_segundo_marco_evals:
-                        powell_stop_func_evals = function_evals + powell_segundo_marco_evals
-                    elif 1800000 <= function_evals <= 1800000 + powell_terceiro_marco_evals:
-                        powell_stop_func_evals = function_evals + powell_terceiro_marco_evals
+                    powell_stop_func_evals = max_fun_evals if powell_phase.budget is None else function_evals + powell_phase.budget
+                    powell_max_iter = powell_phase.max_iter
                     g_best_fitness_before_powell = g_best_fitness
-                    result = powell(evaluate_function, g_best, (lowerBound, upperBound), powell_stop_func_evals, get_function_evals)
-                    candidate = result.copy()
-                    candidate_fitness = evaluate_function(candidate)
-                    if candidate_fitness < g_best_fitness:
-                        g_best = candidate.copy()
-                        g_best_fitness = candidate_fitness
-                    g_best_fitness_after_powell = g_best_fitness
+                    with profiler.phase('powell'):
+                        run_powell()
                     # print(f"Terminou com {function_evals} fun evals e g_best: {g_best_fitness}")
                     
                 k += 1
-                pbar.update(function_evals - previous_func_evals)
+                with profiler.phase('tqdm'):
+                    pbar.update(function_evals - previous_func_evals)
+                stalled_generations = stalled_generations + 1 if function_evals == previous_func_evals else 0
                 previous_func_evals = function_evals
                 # print(f'iteração: {k} - função: {function_evals}')
 
-                del C, Xr_matrix, top_particles, X_st_matrix
-                gc.collect()
+                if not in_place:
+                    # Solta as matrizes da geração (atribuição, e não del: um break depois daqui
+                    # ainda passa pela limpeza do fim da função)
+                    C = Xr_matrix = top_particles = X_st_matrix = None
+                    with profiler.phase('gc'):
+                        gc.collect()
                 # pbar.update(function_evals)
 
                 if max_iter is not None and max_iter == k:
@@ -1635,11 +1912,18 @@ def c_deepso_powell_global_best_paralelo(function, dimension, swarmSize, lowerBo
                 
                 if max_fun_evals is not None and max_fun_evals <= function_evals:
                     break
+
+                if stalled_generations >= MAX_STALLED_GENERATIONS:
+                    break
+
+                if checkpoint_due():
+                    with profiler.phase('checkpoint'):
+                        write_checkpoint()
             
             except MaxFunEvalsReached:
                 del fitness_list, velocity, swarm, Xr_matrix, C, top_particles, X_st_matrix
                 gc.collect()
-                return g_best_fitness, g_best, g_best_fitness_list, positions, velocities, function_evals, g_best_fitness_120k_evals, g_best_fitness_600k_evals, g_best_fitness_before_powell, g_best_fitness_after_powell
+                return g_best_fitness, g_best, g_best_fitness_list, positions, velocities, function_evals, milestone_recorder.get(120_000), milestone_recorder.get(600_000), g_best_fitness_before_powell, g_best_fitness_after_powell
             except Exception as e:
                 # Loga o erro e a stack trace em um arquivo
                 with open("error_log_cdeepso.txt", "a") as log_file:  # Abre o arquivo em modo de anexar
@@ -1647,9 +1931,205 @@ def c_deepso_powell_global_best_paralelo(function, dimension, swarmSize, lowerBo
                     traceback.print_exc(file=log_file)  # Salva a stack trace no arquivo
                     log_file.write("\n")
                 print(f"Erro durante a execução do C-DEEPSO: {str(e)} - Verifique o arquivo error_log_cdeepso.txt para mais detalhes.")
+                # Repetir a iteração não resolve um erro persistente; a execução
+                # pode ser retomada do último checkpoint
+                raise
     del fitness_list, velocity, swarm, Xr_matrix, C, top_particles, X_st_matrix
     gc.collect()
-    return g_best_fitness, g_best, g_best_fitness_list, positions, velocities, function_evals, g_best_fitness_120k_evals, g_best_fitness_600k_evals, g_best_fitness_before_powell, g_best_fitness_after_powell
+    return g_best_fitness, g_best, g_best_fitness_list, positions, velocities, function_evals, milestone_recorder.get(120_000), milestone_recorder.get(600_000), g_best_fitness_before_powell, g_best_fitness_after_powell
+
+def c_deepso_powell_global_best_paralelo_multi(function, dimension, swarmSize, lowerBound, upperBound, runs,
+             seeds=None,
+             percent_powell_func_evals = 0.1,
+             max_iter=None,
+             max_fun_evals=None,
+             W_i=0.40,
+             W_a=0.37,
+             W_c=0.75,
+             max_v=1.01,
+             T_com=0.58,
+             T_mut=0.1,
+             type='sgpb',
+             F=0.8,
+             line_search_method='golden',
+             powell_schedule=None,
+             milestone_recorder=None):
+    """
+    `runs` execuções independentes do PC-DEEPSO em um único processo.
+
+    Os R enxames ficam em um tensor (R, N, D): a equação de movimento, a
+    seleção dos 10% melhores e a atualização dos g_best são operações NumPy
+    sobre o lote inteiro, e as R*N partículas são avaliadas em uma única
+    chamada a `function` (que recebe uma matriz (M, D)). As fases do Powell
+    das execuções também avançam juntas, um ponto de cada execução por
+    chamada (ver powell_method.powell_steps).
+
+    Cada execução tem seu próprio gerador (`np.random.default_rng(seeds[r])`;
+    `seeds` aceita inteiros, SeedSequence ou Generators, padrão: sementes
+    0..R-1) e sua própria curva de convergência. O tensor
+    ocupa R vezes a memória de um enxame, mas os dados do objetivo são
+    carregados uma única vez, em vez de uma vez por processo.
+
+    `powell_schedule` e `milestone_recorder` funcionam como em
+    `c_deepso_powell_global_best_paralelo`, um por execução: aceitam uma
+    lista com R objetos ou um único objeto, copiado para cada execução
+    (padrão: FixedWindows.cec2013 e MilestoneRecorder()).
+
+    Retorna uma lista com, para cada execução, a mesma tupla devolvida por
+    `c_deepso_powell_global_best_paralelo`.
+    """
+    seeds = list(range(runs)) if seeds is None else list(seeds)
+    rngs = [np.random.default_rng(seed) for seed in seeds]
+    swarm = np.stack([rng.uniform(lowerBound, upperBound, size=(swarmSize, dimension)) for rng in rngs])
+    velocity = np.zeros((runs, swarmSize, dimension))
+    weights = np.tile([W_i, W_a, W_c], (runs, 1))
+    g_best_fitness_lists = [ConvergenceTrace() for _ in range(runs)]
+    fitness_list = np.full((runs, swarmSize), np.inf)
+    function_evals = np.zeros(runs, dtype=np.int64)
+    g_best = np.empty((runs, dimension))
+    g_best_fitness = np.full(runs, np.inf)
+    g_best_fitness_before_powell = [None] * runs
+    g_best_fitness_after_powell = [None] * runs
+    done = np.zeros(runs, dtype=bool)
+    run_indices = np.arange(runs)
+    particle_indices = np.arange(swarmSize)
+    powell_func_evals = int(max_fun_evals * percent_powell_func_evals)
+    if powell_schedule is None:
+        powell_schedule = FixedWindows.cec2013(powell_func_evals)
+    if milestone_recorder is None:
+        milestone_recorder = MilestoneRecorder()
+    # Agendamentos e marcos guardam estado: cada execução tem os seus
+    powell_schedules = list(powell_schedule) if isinstance(powell_schedule, (list, tuple)) \
+        else [copy.deepcopy(powell_schedule) for _ in range(runs)]
+    milestone_recorders = list(milestone_recorder) if isinstance(milestone_recorder, (list, tuple)) \
+        else [copy.deepcopy(milestone_recorder) for _ in range(runs)]
+    num_top_particles = max(1, swarmSize // 10)
+    k = 0
+
+    # Avalia as partículas de todas as execuções ainda ativas, respeitando o orçamento de cada uma
+    def evaluate_population():
+        nonlocal fitness_list
+        remaining_evals = max_fun_evals - function_evals
+        mask = (particle_indices[np.newaxis, :] < remaining_evals[:, np.newaxis]) & ~done[:, np.newaxis]
+        fitness_list = np.full((runs, swarmSize), np.inf)
+        fitness_list[mask] = function(swarm[mask])
+        population_evals = mask.sum(axis=1)
+        function_evals[:] += population_evals
+
+        for r in np.flatnonzero(population_evals):
+            milestone_recorders[r].record_population(function_evals[r], g_best_fitness[r])
+
+        candidate_g_best_index = np.argmin(fitness_list, axis=1)
+        candidate_g_best_fitness = fitness_list[run_indices, candidate_g_best_index]
+        improved = candidate_g_best_fitness < g_best_fitness
+        g_best[improved] = swarm[improved, candidate_g_best_index[improved]]
+        g_best_fitness[improved] = candidate_g_best_fitness[improved]
+        for r in np.flatnonzero(population_evals):
+            g_best_fitness_lists[r].extend_constant(g_best_fitness[r], population_evals[r])
+        done[:] |= function_evals >= max_fun_evals
+
+    # Avalia um ponto de cada execução em `indices` (passos do Powell) em uma única chamada
+    def evaluate_points(points, indices):
+        results = function(points)
+        for r, particle, result in zip(indices, points, results):
+            function_evals[r] += 1
+            if result < g_best_fitness[r]:
+                g_best_fitness[r] = result
+                g_best[r] = particle
+            g_best_fitness_lists[r].append(g_best_fitness[r])
+            milestone_recorders[r].record_point(function_evals[r], g_best_fitness[r])
+            if function_evals[r] >= max_fun_evals:
+                done[r] = True
+        return results
+
+    # `phases`: {execução: PowellPhase devolvida pelo seu agendamento}
+    def run_powell(phases):
+        generators = {}
+        points = {}
+        powell_stop_func_evals = {}
+        for r, phase in phases.items():
+            powell_stop_func_evals[r] = max_fun_evals if phase.budget is None else function_evals[r] + phase.budget
+            g_best_fitness_before_powell[r] = g_best_fitness[r]
+            generators[r] = powell_steps(g_best[r].copy(), (lowerBound, upperBound), max_iter=phase.max_iter,
+                                         line_search_method=line_search_method)
+            points[r] = next(generators[r])
+
+        # Cada execução percorre Powell -> avaliação do candidato; as que
+        # terminam antes saem do lote
+        while points:
+            active = list(points)
+            results = evaluate_points(np.array([points[r] for r in active]), active)
+            for r, result in zip(active, results):
+                if done[r]:
+                    del points[r]
+                    if r in generators:
+                        generators.pop(r).close()
+                    continue
+                if r not in generators:
+                    g_best_fitness_after_powell[r] = g_best_fitness[r]
+                    del points[r]
+                    continue
+                try:
+                    if function_evals[r] >= powell_stop_func_evals[r]:
+                        generators[r].throw(PowellMaxFunEvalsReached())
+                    points[r] = generators[r].send(result)
+                except StopIteration as stop:
+                    del generators[r]
+                    points[r] = stop.value.copy()
+
+    def gather(indices):
+        return np.take_along_axis(swarm, indices[:, :, np.newaxis], axis=1)
+
+    evaluate_population()
+
+    while not done.all():
+        # Mutação dos pesos e do g_best: 4 normais por execução
+        normals = np.stack([rng.normal(0, 1, size=4) for rng in rngs])
+        weights = np.clip(weights + T_mut * normals[:, :3], 0, 1)
+
+        # Extrai Xr conforme o tipo selecionado
+        if type in ('sg', 'sgpb'):
+            Xr_matrix = gather(np.stack([partner_indices(rng, swarmSize) for rng in rngs]))
+        if type in ('pb', 'sgpb'):
+            top_indices = top_k_indices(fitness_list, num_top_particles)
+            random_top_indices = np.stack([top_partner_indices(rng, top_indices[r], swarmSize)
+                                           for r, rng in enumerate(rngs)])
+            top_matrix = gather(np.take_along_axis(top_indices, random_top_indices, axis=1))
+            Xr_matrix = top_matrix if type == 'pb' else (Xr_matrix + top_matrix) / 2
+
+        # Calcula X_st com a estratégia current-to-best-2
+        X_st_matrix = Xr_matrix + F * (g_best[:, np.newaxis, :] - Xr_matrix)
+
+        # Vetor de comunicação de cada execução
+        C = np.stack([rng.choice([0, 1], size=dimension, p=[1-T_com, T_com]) for rng in rngs])[:, np.newaxis, :]
+        selected_global_best = np.clip(g_best * (1 + T_mut * normals[:, 3:4]), lowerBound, upperBound)[:, np.newaxis, :]
+
+        # Equação de movimento no tensor (R, N, D)
+        W = weights[:, :, np.newaxis, np.newaxis]
+        inertia = W[:, 0] * velocity
+        cognitive = W[:, 1] * (X_st_matrix - swarm)
+        social = W[:, 2] * C * (selected_global_best - swarm)
+        velocity = np.clip(inertia + cognitive + social, -max_v, max_v)
+        swarm = np.clip(swarm + velocity, lowerBound, upperBound)
+        del Xr_matrix, X_st_matrix, inertia, cognitive, social
+
+        evaluate_population()
+
+        phases = {}
+        for r in np.flatnonzero(~done):
+            phase = powell_schedules[r](function_evals[r], k, g_best_fitness[r], swarm[r], fitness_list[r])
+            if phase is not None:
+                phases[r] = phase
+        if phases:
+            run_powell(phases)
+
+        k += 1
+        if max_iter is not None and max_iter == k:
+            break
+
+    return [(g_best_fitness[r], g_best[r].copy(), g_best_fitness_lists[r], [], [], int(function_evals[r]),
+             milestone_recorders[r].get(120_000), milestone_recorders[r].get(600_000),
+             g_best_fitness_before_powell[r], g_best_fitness_after_powell[r]) for r in range(runs)]
 
 def c_deepso_powell_global_best_paralelo_powell_varias_vezes(function, dimension, swarmSize, lowerBound, upperBound, id_execucao=0,
              percent_powell_start_moment = 0.5,
@@ -1663,11 +2143,13 @@ def c_deepso_powell_global_best_paralelo_powell_varias_vezes(function, dimension
              T_com=0.5819630448962767,
              T_mut=0.1,
              type='sgpb',
-             F=0.8):
+             F=0.8,
+             rng=None):
+    rng = np.random.default_rng(rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
-    g_best_fitness_list = []
+    g_best_fitness_list = ConvergenceTrace()
     fitness_list = []
     velocities = []
     positions = []
@@ -1744,21 +2226,20 @@ def c_deepso_powell_global_best_paralelo_powell_varias_vezes(function, dimension
             if candidate_g_best_fitness < g_best_fitness:
                 g_best_fitness = candidate_g_best_fitness
                 g_best = swarm[candidate_g_best_index]
-            g_best_fitness_list.extend([g_best_fitness] * len(fitness_list))
+            g_best_fitness_list.extend_constant(g_best_fitness, len(fitness_list))
             raise MaxFunEvalsReached
 
     evaluate_population(swarm)
     g_best_index = np.argmin(fitness_list)
     g_best = swarm[g_best_index]
     g_best_fitness = fitness_list[g_best_index]
-    g_best_fitness_list.extend([g_best_fitness] * len(fitness_list))    
+    g_best_fitness_list.extend_constant(g_best_fitness, len(fitness_list))    
 
     # Inicializa a lista ordenada para as 10% melhores partículas
     num_top_particles = max(1, swarmSize // 10)
 
     def get_top_10_percent_particles(swarm, fitness_list, num_top_particles):
-        sorted_indices = np.argsort(fitness_list)
-        top_indices = sorted_indices[:num_top_particles]
+        top_indices = top_k_indices(fitness_list, num_top_particles)
         top_particles = swarm[top_indices]
         return top_particles, top_indices
     
@@ -1767,9 +2248,10 @@ def c_deepso_powell_global_best_paralelo_powell_varias_vezes(function, dimension
         while True:
             try:
                 # Mutação dos pesos
-                W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+                mutation = rng.normal(0, 1, size=4)
+                W_i = np.clip(W_i + (T_mut * mutation[0]), 0, 1)
+                W_a = np.clip(W_a + (T_mut * mutation[1]), 0, 1)
+                W_c = np.clip(W_c + (T_mut * mutation[2]), 0, 1)
 
                 # Extrai Xr conforme o tipo selecionado
                 
@@ -1779,38 +2261,20 @@ def c_deepso_powell_global_best_paralelo_powell_varias_vezes(function, dimension
                 top_particles = None
 
                 if type == 'sg':
-                    random_indices = np.random.randint(0, swarmSize, size=(swarmSize,))
-                    same_particle_mask = (random_indices == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_indices[same_particle_mask] = np.random.randint(0, swarmSize, size=np.sum(same_particle_mask))
-                        same_particle_mask = (random_indices == np.arange(swarmSize))
+                    random_indices = partner_indices(rng, swarmSize)
                     
                     Xr_matrix = swarm[random_indices]
                 elif type == 'pb':
                     top_particles, top_indices = get_top_10_percent_particles(swarm, fitness_list, num_top_particles)
-                    random_top_indices = np.random.randint(0, len(top_particles), size=(swarmSize,))
-                    same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_top_indices[same_particle_mask] = np.random.randint(0, len(top_particles), size=np.sum(same_particle_mask))
-                        same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
+                    random_top_indices = top_partner_indices(rng, top_indices, swarmSize)
                     
                     Xr_matrix = top_particles[random_top_indices]
                 elif type == 'sgpb':  
-                    random_indices = np.random.randint(0, swarmSize, size=(swarmSize,))
-                    
-                    same_particle_mask = (random_indices == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_indices[same_particle_mask] = np.random.randint(0, swarmSize, size=np.sum(same_particle_mask))
-                        same_particle_mask = (random_indices == np.arange(swarmSize))
+                    random_indices = partner_indices(rng, swarmSize)
                     
                     Xr_matrix = swarm[random_indices]
                     top_particles, top_indices = get_top_10_percent_particles(swarm, fitness_list, num_top_particles)
-                    random_top_indices = np.random.randint(0, len(top_particles), size=(swarmSize,))
-                    
-                    same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
-                    while np.any(same_particle_mask):
-                        random_top_indices[same_particle_mask] = np.random.randint(0, len(top_particles), size=np.sum(same_particle_mask))
-                        same_particle_mask = (top_indices[random_top_indices] == np.arange(swarmSize))
+                    random_top_indices = top_partner_indices(rng, top_indices, swarmSize)
 
                     Xr_matrix = (Xr_matrix + top_particles[random_top_indices]) / 2
                 
@@ -1831,10 +2295,10 @@ def c_deepso_powell_global_best_paralelo_powell_varias_vezes(function, dimension
                 X_st_matrix = Xr_matrix + F * (g_best - Xr_matrix) #+ F * (Xr1_matrix - Xr2_matrix)
                 #del Xr1_matrix, Xr2_matrix
                 # Gera matriz/vetor de comunicação
-                C = np.random.choice([0, 1], size=dimension, p=[1-T_com, T_com])
+                C = rng.choice([0, 1], size=dimension, p=[1-T_com, T_com])
 
                 selected_global_best = g_best
-                mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+                mutated_global_best = np.clip(g_best * (1 + T_mut * mutation[3]), lowerBound, upperBound)
                 # if evaluate_function(mutated_global_best) < g_best_fitness:
                 selected_global_best = mutated_global_best
 
@@ -1858,7 +2322,7 @@ def c_deepso_powell_global_best_paralelo_powell_varias_vezes(function, dimension
                     g_best_fitness = candidate_g_best_fitness
                     g_best = swarm[candidate_g_best_index]
                     g_best_index = candidate_g_best_index
-                g_best_fitness_list.extend([g_best_fitness] * len(fitness_list))
+                g_best_fitness_list.extend_constant(g_best_fitness, len(fitness_list))
 
                 
 
@@ -1935,9 +2399,11 @@ def c_deepso_powell_global_best_paralelo_backup(function, dimension, swarmSize,
              T_com=0.5819630448962767,
              T_mut=0.1,
              type='sgpb',
-             F=0.5):
+             F=0.5,
+             rng=None):
+    rng = np.random.default_rng(rng)
     k = 0
-    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound)
+    swarm = generatePopulation(dimension, swarmSize, lowerBound, upperBound, rng)
     velocity = np.zeros((swarmSize, dimension))
     g_best_fitness_list = []
     fitness_list = []
@@ -2025,17 +2491,17 @@ def c_deepso_powell_global_best_paralelo_backup(function, dimension, swarmSize,
     num_top_particles = max(1, swarmSize // 10)
 
     def get_top_10_percent_particles(swarm, fitness_list, num_top_particles):
-        sorted_indices = np.argsort(fitness_list)
-        top_indices = sorted_indices[:num_top_particles]
+        top_indices = top_k_indices(fitness_list, num_top_particles)
         return swarm[top_indices]
     position_tqdm = (id_execucao % 5) + 1
     with tqdm(total=max_fun_evals, position=position_tqdm, desc=f"Execução {id_execucao}", unit="evals", leave=False) as pbar:
         while True:
             try:
                 # Mutação dos pesos
-                W_i = np.clip(W_i + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_a = np.clip(W_a + (T_mut * np.random.normal(0, 1)), 0, 1)
-                W_c = np.clip(W_c + (T_mut * np.random.normal(0, 1)), 0, 1)
+                mutation = rng.normal(0, 1, size=4)
+                W_i = np.clip(W_i + (T_mut * mutation[0]), 0, 1)
+                W_a = np.clip(W_a + (T_mut * mutation[1]), 0, 1)
+                W_c = np.clip(W_c + (T_mut * mutation[2]), 0, 1)
 
                 # # Atualiza Particle Best e Global Best
                 # particle = swarm[i]
@@ -2056,14 +2522,14 @@ def c_deepso_powell_global_best_paralelo_backup(function, dimension, swarmSize,
                 Xr = None
                 top_particles = get_top_10_percent_particles(swarm, fitness_list, num_top_particles)
 
-                r = np.random.randint(0, swarmSize)
+                r = rng.integers(0, swarmSize)
 
                 if type == 'sg':  # Extraído aleatoriamente da população atual
                     Xr = swarm[r]
                 elif type == 'pb':  # Extraído aleatoriamente dentre os 10% melhores salvos
-                    Xr = top_particles[np.random.randint(num_top_particles)]
+                    Xr = top_particles[rng.integers(num_top_particles)]
                 elif type == 'sgpb':  # Média entre Sg e Pb
-                    pb = top_particles[np.random.randint(num_top_particles)]
+                    pb = top_particles[rng.integers(num_top_particles)]
                     Xr = ((swarm[r] + pb) / 2)
                 else:
                     return "Tipo inválido. Aceitos: sg, pb e sgpb."
@@ -2073,7 +2539,7 @@ def c_deepso_powell_global_best_paralelo_backup(function, dimension, swarmSize,
 
                 # Realiza possível mutação do global best
                 selected_global_best = g_best
-                mutated_global_best = np.clip(g_best * (1 + T_mut * np.random.normal(0, 1)), lowerBound, upperBound)
+                mutated_global_best = np.clip(g_best * (1 + T_mut * mutation[3]), lowerBound, upperBound)
                 if evaluate_function(mutated_global_best) < g_best_fitness:
                     selected_global_best = mutated_global_best
 
@@ -2083,7 +2549,7 @@ def c_deepso_powell_global_best_paralelo_backup(function, dimension, swarmSize,
                 # X_r2 = swarm[r2]
 
                 X_st = Xr + F * (g_best - Xr)
-                C = np.random.choice([0, 1], size=dimension, p=[1-T_com, T_com])
+                C = rng.choice([0, 1], size=dimension, p=[1-T_com, T_com])
                 # Equação de movimento nas matrizes
                 #V = np.clip(wm*V + c1m*(Xst - X) + c2m*C*(gbestm_X - X), -diff, diff)
                 # inertia = W_i * velocity[i]
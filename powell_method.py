@@ -1,49 +1,131 @@
 import numpy as np
-from scipy_functions import _line_for_search, _minimize_scalar_bounded
+from scipy_functions import _line_for_search, _minimize_scalar_bounded, _minimize_scalar_batched, _minimize_scalar_bounded_steps
 import traceback
+from instrumentation import NULL_PROFILER
 
-def line_search(function, x, direction, bounds, global_max_fun, get_global_fun_calls, tol=1e-4):
+def line_search(function, x, direction, bounds, global_max_fun, get_global_fun_calls, tol=1e-4,
+                batch_function=None, batch_points=8, method='golden', incremental=None, axis=None):
     def f1d(alpha):
         return function(x + alpha * direction)
 
+    # Avalia vários passos de uma vez, como uma matriz (n_passos, D)
+    def f1d_batch(alphas):
+        return batch_function(x + alphas[:, np.newaxis] * direction)
+
+    # Direção coordenada com objetivo incremental: o valor vem do estado do
+    # objetivo e a função recebe o ponto apenas para a contabilidade
+    def f1d_incremental(alpha):
+        return function(x + alpha * direction, incremental.probe(axis, alpha))
+
+    def f1d_batch_incremental(alphas):
+        return batch_function(x + alphas[:, np.newaxis] * direction, incremental.probe(axis, alphas))
+
+    use_incremental = incremental is not None and axis is not None
     bound = _line_for_search(x, direction, bounds[0], bounds[1])
-    res = _minimize_scalar_bounded(f1d, bound, global_max_fun, get_global_fun_calls, xatol=tol)
+    if batch_function is not None:
+        res = _minimize_scalar_batched(f1d_batch_incremental if use_incremental else f1d_batch, bound,
+                                       global_max_fun, get_global_fun_calls, xatol=tol, n_points=batch_points)
+    else:
+        res = _minimize_scalar_bounded(f1d_incremental if use_incremental else f1d, bound,
+                                       global_max_fun, get_global_fun_calls, xatol=tol, method=method)
+    if use_incremental:
+        incremental.update(axis, res.x)
     alpha = res.x
     new_dir = res.x * direction
     return x + alpha * direction, new_dir, res.fun
 
-def powell(function, x0, bounds, max_fun_evals, get_function_evals, tol=1e-4, max_iter=None, ftol=1e-4):
+def powell(function, x0, bounds, max_fun_evals, get_function_evals, tol=1e-4, max_iter=None, ftol=1e-4,
+           batch_function=None, batch_points=8, line_search_method='golden', incremental=None,
+           state=None, on_sweep=None, profiler=None):
+    """
+    Método de Powell com busca linear limitada.
+
+    Para quando `get_function_evals()` (o contador de avaliações de quem
+    chamou, incrementado por `function`) chega a `max_fun_evals`, ou quando
+    uma varredura inteira não faz avaliações novas.
+
+    Se `incremental` for um objetivo incremental (ver incremental_functions),
+    as buscas ao longo de direções que ainda são eixos canônicos usam
+    `incremental.probe`, e `function`/`batch_function` recebem o valor já
+    calculado como segundo argumento, apenas para contabilizar a avaliação.
+
+    `on_sweep`, se informado, recebe no início de cada varredura o estado do
+    método (dicionário com x, f, directions, axes e iters), que pode ser
+    devolvido em `state` para retomar a busca daquele ponto (checkpoints).
+
+    `profiler` (instrumentation.PhaseProfiler) mede as fases
+    'powell_busca_linear' e 'powell_extrapolacao' e conta varreduras, buscas
+    lineares e substituições de direção.
+    """
+    if profiler is None:
+        profiler = NULL_PROFILER
     n = len(x0)
     a, b = bounds
     lower_bound_array = np.full(n,a)
     upper_bound_array = np.full(n,b)
     bounds_array = np.array([lower_bound_array, upper_bound_array])
     directions = np.eye(n)
+    # Eixo canônico de cada direção (None depois que a direção é substituída)
+    axes = list(range(n))
     x = x0.copy()
-    f0 = function(x)
-    f_ret = f0
-    iters = 0
-    function_evals_inside_powell = get_function_evals()
-
-    def evaluate_function(x):
-        nonlocal function_evals_inside_powell
-        nonlocal max_fun_evals
-        result = function(x)
-        function_evals_inside_powell += 1
-        if max_fun_evals is not None and function_evals_inside_powell >= max_fun_evals:
+    if state is not None:
+        x = np.array(state['x'], dtype=np.float64)
+        f_ret = float(state['f'])
+        directions = np.array(state['directions'], dtype=np.float64)
+        axes = [None if axis < 0 else int(axis) for axis in state['axes']]
+        iters = int(state['iters'])
+    else:
+        f0 = function(x)
+        f_ret = f0
+        iters = 0
+    # O orçamento é lido do contador de quem chamou, e não contado aqui: uma
+    # avaliação que ele não conta (ex.: acerto de cache com count_hits=False)
+    # não encurta a fase do Powell
+    def evaluate_function(x, result=None):
+        result = function(x) if result is None else function(x, result)
+        if max_fun_evals is not None and get_function_evals() >= max_fun_evals:
             raise MaxFunEvalsReached
         return result
+
+    def evaluate_batch(points, results=None):
+        if max_fun_evals is not None:
+            points = points[:max_fun_evals - get_function_evals()]
+        if results is None:
+            results = batch_function(points)
+        else:
+            results = batch_function(points, results[:len(points)])
+        if max_fun_evals is not None and get_function_evals() >= max_fun_evals:
+            raise MaxFunEvalsReached
+        return results
+
+    line_search_options = {'method': line_search_method, 'incremental': incremental}
+    if batch_function is not None:
+        line_search_options.update(batch_function=evaluate_batch, batch_points=batch_points)
     
     try:
         while True:
+            if on_sweep is not None:
+                # Eixos substituídos são gravados como -1
+                on_sweep({'x': x, 'f': f_ret, 'directions': directions,
+                          'axes': np.array([-1 if axis is None else axis for axis in axes]), 'iters': iters})
+            profiler.count('powell_varreduras')
+            sweep_start_evals = get_function_evals()
             x_old = x.copy()
             f_old = f_ret
             delta = 0.0
             biggest_decrease_index = 0
+            if incremental is not None:
+                # Recalcula o estado a cada varredura para não acumular erro de arredondamento
+                incremental.reset(x)
             for i in range(n):
                 f_aux = f_ret
                 direction = directions[i]
-                x, _, f_ret = line_search(evaluate_function, x, direction, bounds_array, max_fun_evals, get_function_evals, tol)
+                profiler.count('powell_buscas_lineares')
+                with profiler.phase('powell_busca_linear'):
+                    x, _, f_ret = line_search(evaluate_function, x, direction, bounds_array, max_fun_evals, get_function_evals, tol,
+                                              axis=axes[i], **line_search_options)
+                if incremental is not None and axes[i] is None:
+                    incremental.reset(x)
                 decrease = f_aux - f_ret
                 if decrease > delta:
                     delta = decrease
@@ -56,6 +138,10 @@ def powell(function, x0, bounds, max_fun_evals, get_function_evals, tol=1e-4, ma
             # print(f'Function evals dentro do powell: {function_evals}, iters: {iters}')
             if max_fun_evals is not None and function_evals >= max_fun_evals:
                 break
+            # Varredura inteira sem avaliações novas (só acertos de cache não
+            # contabilizados): o orçamento não avança e a busca não terminaria
+            if function_evals == sweep_start_evals:
+                break
             if max_iter is not None and iters >= max_iter:
                 break
             if np.isnan(f_old) and np.isnan(f_ret):
@@ -64,16 +150,22 @@ def powell(function, x0, bounds, max_fun_evals, get_function_evals, tol=1e-4, ma
             new_direction = x - x_old
             if np.all(new_direction == 0):
                 break
-            _,lmax = _line_for_search(x, new_direction, lower_bound_array, upper_bound_array)
-            x_extrapolated = x + min(lmax,1) * new_direction
-            f_ext = evaluate_function(x_extrapolated)
+            with profiler.phase('powell_extrapolacao'):
+                _,lmax = _line_for_search(x, new_direction, lower_bound_array, upper_bound_array)
+                x_extrapolated = x + min(lmax,1) * new_direction
+                f_ext = evaluate_function(x_extrapolated)
 
             if(f_ext < f_old):
                 t = 2.0 * (f_old - 2.0 * f_ret + f_ext) * pow(f_old - f_ret - delta, 2) - delta * pow(f_old - f_ext, 2)
                 if(t < 0.0):
-                    x, _, f_ret = line_search(evaluate_function, x, new_direction, bounds_array, max_fun_evals, get_function_evals, tol)
+                    profiler.count('powell_buscas_lineares')
+                    with profiler.phase('powell_busca_linear'):
+                        x, _, f_ret = line_search(evaluate_function, x, new_direction, bounds_array, max_fun_evals, get_function_evals, tol, **line_search_options)
+                    profiler.count('powell_substituicoes_direcao')
                     directions[biggest_decrease_index] = directions[-1]
                     directions[-1] = new_direction
+                    axes[biggest_decrease_index] = axes[-1]
+                    axes[-1] = None
             
             iters += 1
     
@@ -90,5 +182,75 @@ def powell(function, x0, bounds, max_fun_evals, get_function_evals, tol=1e-4, ma
 
     return x
 
+def line_search_steps(x, direction, bounds, tol=1e-4, method='golden'):
+    """Versão geradora de `line_search`: entrega os pontos x + alpha * direction e recebe os valores."""
+    bound = _line_for_search(x, direction, bounds[0], bounds[1])
+    steps = _minimize_scalar_bounded_steps(bound, xatol=tol, method=method)
+    alpha = next(steps)
+    while True:
+        fx = yield x + alpha * direction
+        try:
+            alpha = steps.send(fx)
+        except StopIteration as stop:
+            res = stop.value
+            return x + res.x * direction, res.fun
+
+def powell_steps(x0, bounds, tol=1e-4, max_iter=None, line_search_method='golden'):
+    """
+    Método de Powell escrito como gerador, para ser conduzido de fora (ver
+    ask_tell.py): cada `yield` entrega um ponto (D,) e recebe o valor da
+    função via `send`. O orçamento fica com quem conduz: para encerrar, lance
+    MaxFunEvalsReached no gerador (`throw`). Em qualquer caso o ponto final é
+    o valor de StopIteration, como o retorno de `powell`.
+    """
+    n = len(x0)
+    a, b = bounds
+    lower_bound_array = np.full(n, a)
+    upper_bound_array = np.full(n, b)
+    bounds_array = np.array([lower_bound_array, upper_bound_array])
+    directions = np.eye(n)
+    x = x0.copy()
+    iters = 0
+
+    try:
+        f_ret = yield x.copy()
+        while True:
+            x_old = x.copy()
+            f_old = f_ret
+            delta = 0.0
+            biggest_decrease_index = 0
+            for i in range(n):
+                f_aux = f_ret
+                x, f_ret = yield from line_search_steps(x, directions[i], bounds_array, tol, line_search_method)
+                decrease = f_aux - f_ret
+                if decrease > delta:
+                    delta = decrease
+                    biggest_decrease_index = i
+
+            if max_iter is not None and iters >= max_iter:
+                break
+            if np.isnan(f_old) and np.isnan(f_ret):
+                break
+
+            new_direction = x - x_old
+            if np.all(new_direction == 0):
+                break
+            _, lmax = _line_for_search(x, new_direction, lower_bound_array, upper_bound_array)
+            x_extrapolated = x + min(lmax, 1) * new_direction
+            f_ext = yield x_extrapolated
+
+            if f_ext < f_old:
+                t = 2.0 * (f_old - 2.0 * f_ret + f_ext) * pow(f_old - f_ret - delta, 2) - delta * pow(f_old - f_ext, 2)
+                if t < 0.0:
+                    x, f_ret = yield from line_search_steps(x, new_direction, bounds_array, tol, line_search_method)
+                    directions[biggest_decrease_index] = directions[-1]
+                    directions[-1] = new_direction
+
+            iters += 1
+    except MaxFunEvalsReached:
+        return x
+
+    return x
+
 class MaxFunEvalsReached(Exception):
     pass
\ No newline at end of file
@@ -0,0 +1,227 @@
+import numpy as np
+from collections import namedtuple
+
+# Fase do Powell disparada por um agendamento: `budget` avaliações (None: até o
+# fim do orçamento da execução) e, opcionalmente, limite de iterações do Powell
+PowellPhase = namedtuple('PowellPhase', ['budget', 'max_iter'], defaults=[None])
+
+
+class PowellSchedule:
+    """
+    Decide em que momento a busca local (Powell) começa a partir do g_best.
+
+    O motor chama o agendamento ao fim de cada iteração do enxame com o
+    estado atual; quando ele devolve uma PowellPhase, o Powell roda com
+    aquele orçamento. Subclasses implementam `_check`.
+
+    Parameters
+    ----------
+    max_phases : int, opcional
+        Quantidade máxima de fases disparadas por este agendamento.
+    """
+
+    def __init__(self, max_phases=None):
+        self.max_phases = max_phases
+        self.phases = 0
+
+    def __call__(self, function_evals, k, g_best_fitness, swarm=None, fitness_list=None):
+        if self.max_phases is not None and self.phases >= self.max_phases:
+            return None
+        phase = self._check(function_evals, k, g_best_fitness, swarm, fitness_list)
+        if phase is not None:
+            self.phases += 1
+        return phase
+
+    def _check(self, function_evals, k, g_best_fitness, swarm, fitness_list):
+        raise NotImplementedError
+
+    def state_dict(self):
+        """Estado do agendamento (valores serializáveis em JSON), para checkpoints."""
+        return {key: value for key, value in vars(self).items() if not callable(value)}
+
+    def load_state_dict(self, state):
+        vars(self).update(state)
+
+
+class FixedWindows(PowellSchedule):
+    """
+    Janelas fixas (início, duração) em avaliações: o Powell começa quando a
+    contagem cai dentro de [início, início + duração] e roda por `duração`
+    avaliações.
+    """
+
+    def __init__(self, windows, max_phases=None):
+        super().__init__(max_phases)
+        self.windows = [(int(start), int(length)) for start, length in windows]
+
+    @classmethod
+    def cec2013(cls, powell_func_evals):
+        """Agendamento original do PC-DEEPSO: 60k/360k/1,8M com 4%/20%/76% do orçamento do Powell."""
+        return cls([(60_000, powell_func_evals * 0.04),
+                    (360_000, powell_func_evals * 0.2),
+                    (1_800_000, powell_func_evals * 0.76)])
+
+    @classmethod
+    def proportional(cls, max_fun_evals, percent_powell_func_evals=0.1, starts=(0.02, 0.12, 0.6),
+                     splits=(0.04, 0.2, 0.76)):
+        """
+        As mesmas janelas como frações do orçamento (`starts`), para
+        orçamentos diferentes dos 3M avaliações do CEC.
+        """
+        powell_func_evals = max_fun_evals * percent_powell_func_evals
+        return cls([(max_fun_evals * start, powell_func_evals * split) for start, split in zip(starts, splits)])
+
+    def _check(self, function_evals, k, g_best_fitness, swarm, fitness_list):
+        for start, length in self.windows:
+            if start <= function_evals <= start + length:
+                return PowellPhase(length)
+        return None
+
+
+class EveryNEvals(PowellSchedule):
+    """
+    Powell a cada `interval` avaliações (como em
+    `c_deepso_powell_global_best_paralelo_powell_varias_vezes`).
+    """
+
+    def __init__(self, interval=100_000, budget=None, max_iter=1, first=None, max_phases=None):
+        super().__init__(max_phases)
+        self.interval = interval
+        self.budget = budget
+        self.max_iter = max_iter
+        self.next_milestone = interval if first is None else first
+
+    def _check(self, function_evals, k, g_best_fitness, swarm, fitness_list):
+        if function_evals < self.next_milestone:
+            return None
+        self.next_milestone += self.interval
+        return PowellPhase(self.budget, self.max_iter)
+
+
+class StagnationTrigger(PowellSchedule):
+    """
+    Powell quando o g_best não melhora (relativamente, mais que `tol`) por
+    `patience` iterações seguidas.
+    """
+
+    def __init__(self, patience, budget, tol=0.0, max_iter=None, max_phases=None):
+        super().__init__(max_phases)
+        self.patience = patience
+        self.budget = budget
+        self.tol = tol
+        self.max_iter = max_iter
+        self.best = None
+        self.stagnant_iters = 0
+
+    def _check(self, function_evals, k, g_best_fitness, swarm, fitness_list):
+        g_best_fitness = float(g_best_fitness)
+        if self.best is None or self.best - g_best_fitness > self.tol * abs(self.best):
+            self.best = g_best_fitness
+            self.stagnant_iters = 0
+            return None
+        self.stagnant_iters += 1
+        if self.stagnant_iters < self.patience:
+            return None
+        self.stagnant_iters = 0
+        return PowellPhase(self.budget, self.max_iter)
+
+
+def swarm_dispersion(swarm):
+    """Distância média das partículas ao centróide do enxame."""
+    deviations = swarm - swarm.mean(axis=0)
+    return float(np.mean(np.sqrt(np.einsum('ij,ij->i', deviations, deviations))))
+
+
+class DispersionTrigger(PowellSchedule):
+    """
+    Powell quando a dispersão do enxame cai abaixo de `threshold`, como no
+    gatilho das variantes _com_kmeans. A dispersão é medida a cada `every`
+    iterações depois de `min_iter`, com `metric` (padrão: swarm_dispersion;
+    use dispersion.DispersionMonitor() para o mesmo sinal 2-means daquelas
+    variantes).
+    """
+
+    def __init__(self, threshold, budget=None, every=5, min_iter=10, metric=None, max_iter=None, max_phases=1):
+        super().__init__(max_phases)
+        self.threshold = threshold
+        self.budget = budget
+        self.every = every
+        self.min_iter = min_iter
+        self.metric = swarm_dispersion if metric is None else metric
+        self.max_iter = max_iter
+        self.last_dispersion = None
+
+    def _check(self, function_evals, k, g_best_fitness, swarm, fitness_list):
+        if k <= self.min_iter or k % self.every != 0:
+            return None
+        self.last_dispersion = float(self.metric(swarm))
+        if self.last_dispersion < self.threshold:
+            return PowellPhase(self.budget, self.max_iter)
+        return None
+
+
+class ImprovementRateTrigger(PowellSchedule):
+    """
+    Powell quando a melhora relativa do g_best nas últimas `window_evals`
+    avaliações fica abaixo de `min_rate`.
+    """
+
+    def __init__(self, window_evals, min_rate, budget, max_iter=None, max_phases=None):
+        super().__init__(max_phases)
+        self.window_evals = window_evals
+        self.min_rate = min_rate
+        self.budget = budget
+        self.max_iter = max_iter
+        self.history = []
+
+    def _check(self, function_evals, k, g_best_fitness, swarm, fitness_list):
+        self.history.append((int(function_evals), float(g_best_fitness)))
+        # Mantém só o ponto mais recente que ainda cobre a janela inteira
+        while len(self.history) > 1 and function_evals - self.history[1][0] >= self.window_evals:
+            self.history.pop(0)
+        start_evals, start_fitness = self.history[0]
+        if function_evals - start_evals < self.window_evals:
+            return None
+        rate = (start_fitness - float(g_best_fitness)) / max(abs(start_fitness), 1e-300)
+        if rate >= self.min_rate:
+            return None
+        self.history = [(int(function_evals), float(g_best_fitness))]
+        return PowellPhase(self.budget, self.max_iter)
+
+
+class MilestoneRecorder:
+    """
+    Melhor fitness em contagens de avaliações arbitrárias (os antigos
+    g_best_fitness_120k_evals e g_best_fitness_600k_evals).
+
+    Avaliações de população registram o g_best de antes do lote na primeira
+    vez que a contagem passa do marco, como o laço original; avaliações
+    pontuais registram o valor exato na avaliação do marco.
+    """
+
+    def __init__(self, milestones=(120_000, 600_000)):
+        self.milestones = sorted(int(m) for m in milestones)
+        self.values = {m: None for m in self.milestones}
+
+    def record_population(self, function_evals, g_best_fitness):
+        for m in self.milestones:
+            if function_evals >= m and self.values[m] is None:
+                self.values[m] = g_best_fitness
+
+    def record_points(self, previous_evals, running_best):
+        """`running_best[i]` é o melhor fitness após a avaliação previous_evals + i + 1."""
+        for m in self.milestones:
+            if previous_evals < m <= previous_evals + len(running_best):
+                self.values[m] = running_best[m - previous_evals - 1]
+
+    def record_point(self, function_evals, g_best_fitness):
+        self.record_points(function_evals - 1, (g_best_fitness,))
+
+    def get(self, milestone):
+        return self.values.get(milestone)
+
+    def state_dict(self):
+        return {str(m): (None if v is None else float(v)) for m, v in self.values.items()}
+
+    def load_state_dict(self, state):
+        self.values.update({int(m): v for m, v in state.items() if int(m) in self.values})
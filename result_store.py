@@ -0,0 +1,199 @@
+import os
+import json
+import hashlib
+import numpy as np
+from convergence_trace import ConvergenceTrace, ConvergenceAggregator
+from utils import calculate_statistics
+
+# Marcos de avaliação do CEC2013 LSGO usados nas tabelas
+MILESTONES = (120_000, 600_000, 3_000_000)
+
+_TRACE_DTYPE = np.dtype([('eval', '<i8'), ('value', '<f8')])
+
+
+def config_hash(parametros):
+    """Hash curto e estável de um dicionário de parâmetros."""
+    texto = json.dumps(parametros, sort_keys=True, default=str)
+    return hashlib.sha1(texto.encode()).hexdigest()[:12]
+
+
+class ResultStore:
+    """
+    Resultados dos experimentos em formato binário colunar, no lugar dos CSVs
+    por execução e das planilhas .xlsx.
+
+    Estrutura da pasta:
+        index.jsonl          uma linha de metadados por execução (função,
+                             algoritmo, configuração, semente, hash da
+                             configuração, marcos, ...)
+        traces/<run_id>.npy  curva de convergência como pontos de mudança
+                             (campos `eval` e `value`), mapeável em memória
+        g_best/<run_id>.npy  melhor posição encontrada
+        aggregates/<grupo>.npz
+                             curvas agregadas (ConvergenceAggregator) de um
+                             grupo (função, algoritmo, configuração, variante)
+
+    Os arrays são gravados pelos processos que executam os jobs
+    (`write_run`); o índice só é escrito pelo processo principal (`append`),
+    então não há escrita concorrente no mesmo arquivo.
+    """
+
+    def __init__(self, path='resultados'):
+        self.path = path
+        self.index_path = os.path.join(path, 'index.jsonl')
+        os.makedirs(os.path.join(path, 'traces'), exist_ok=True)
+        os.makedirs(os.path.join(path, 'g_best'), exist_ok=True)
+        os.makedirs(os.path.join(path, 'aggregates'), exist_ok=True)
+
+    @staticmethod
+    def _save(path, array):
+        # Grava em um arquivo temporário e renomeia, para nunca deixar um .npy pela metade
+        temporary = f"{path}.tmp.npy"
+        np.save(temporary, array)
+        os.replace(temporary, path)
+
+    def write_run(self, record, trace, global_best=None, milestones=MILESTONES, milestone_values=None):
+        """
+        Grava a curva e o g_best de uma execução e completa `record` com o
+        comprimento da curva e o melhor fitness em cada marco. Retorna o
+        registro, que deve ser passado a `append`.
+
+        `milestone_values` ({marco: valor}) traz os valores registrados pelo
+        próprio motor (MilestoneRecorder), os mesmos das antigas abas
+        Estatisticas_120k e Estatisticas_600k; eles têm precedência sobre a
+        curva. Os demais marcos saem da curva, que, no último marco, é o
+        best_fitness da execução. Marcos que a execução não alcançou (valor
+        None ou curva mais curta que o marco) ficam de fora.
+        """
+        if not isinstance(trace, ConvergenceTrace):
+            values = trace
+            trace = ConvergenceTrace()
+            trace.extend(values)
+        evals, values = trace.change_points
+        array = np.empty(len(evals), dtype=_TRACE_DTYPE)
+        array['eval'], array['value'] = evals, values
+        run_id = record['run_id']
+        self._save(os.path.join(self.path, 'traces', f"{run_id}.npy"), array)
+        if global_best is not None:
+            self._save(os.path.join(self.path, 'g_best', f"{run_id}.npy"), np.asarray(global_best, dtype=np.float64))
+        record = dict(record)
+        record['trace_length'] = len(trace)
+        milestone_values = {} if milestone_values is None else {int(m): v for m, v in milestone_values.items()}
+        record['milestones'] = {}
+        for m in milestones:
+            if m in milestone_values:
+                if milestone_values[m] is not None:
+                    record['milestones'][str(m)] = float(milestone_values[m])
+            elif len(trace) >= m:
+                record['milestones'][str(m)] = trace.best_at(m - 1)
+        return record
+
+    def append(self, record):
+        with open(self.index_path, 'a') as file:
+            file.write(json.dumps(record, default=float) + '\n')
+
+    def records(self, **filters):
+        """Registros do índice cujos campos batem com `filters` (ex.: func_name='f1_shifted_elliptic')."""
+        if not os.path.exists(self.index_path):
+            return []
+        with open(self.index_path) as file:
+            records = [json.loads(line) for line in file if line.strip()]
+        # Uma execução regravada substitui a anterior com o mesmo run_id
+        records = list({r['run_id']: r for r in records}.values())
+        return [r for r in records if all(r.get(k) == v for k, v in filters.items())]
+
+    def load_trace(self, record, mmap=True):
+        """
+        Curva de uma execução, a partir do registro ou do run_id. O .npy só
+        guarda os pontos de mudança; o comprimento (que inclui o trecho final
+        sem melhora) vem de `trace_length` no registro do índice.
+        """
+        if not isinstance(record, dict):
+            matches = self.records(run_id=record)
+            if not matches:
+                raise KeyError(f"Execução {record!r} não está no índice de {self.path}")
+            record = matches[0]
+        run_id = record['run_id']
+        array = np.load(os.path.join(self.path, 'traces', f"{run_id}.npy"), mmap_mode='r' if mmap else None)
+        length = record['trace_length']
+        return ConvergenceTrace.from_change_points(array['eval'], array['value'], length)
+
+    def load_global_best(self, record, mmap=True):
+        run_id = record['run_id'] if isinstance(record, dict) else record
+        return np.load(os.path.join(self.path, 'g_best', f"{run_id}.npy"), mmap_mode='r' if mmap else None)
+
+    def best_fitness(self, **filters):
+        return np.array([r['best_fitness'] for r in self.records(**filters)])
+
+    @staticmethod
+    def group_name(func_name, algoritmo, configuracao='padrao', variante=None):
+        name = f"{func_name}_{algoritmo}_{configuracao}"
+        return name if variante is None else f"{name}_{variante}"
+
+    def save_aggregate(self, aggregator, func_name, algoritmo, configuracao='padrao', variante=None):
+        path = os.path.join(self.path, 'aggregates', f"{self.group_name(func_name, algoritmo, configuracao, variante)}.npz")
+        temporary = f"{path}.tmp.npz"
+        np.savez(temporary, **aggregator.__getstate__())
+        os.replace(temporary, path)
+
+    def aggregate(self, func_name, algoritmo, configuracao='padrao', variante=None):
+        """
+        ConvergenceAggregator das execuções de um grupo. Usa o agregado
+        gravado pelo executor se ele cobrir todas as execuções do índice;
+        senão incorpora as curvas uma a uma, sem carregá-las juntas.
+        `variante` None junta todas as variantes com o mesmo rótulo.
+        """
+        filters = dict(func_name=func_name, algoritmo=algoritmo, configuracao=configuracao)
+        if variante is not None:
+            filters['variante'] = variante
+        records = self.records(**filters)
+        if not records:
+            raise ValueError(f"nenhuma execução encontrada para {self.group_name(func_name, algoritmo, configuracao, variante)}")
+        variantes = {record.get('variante') for record in records}
+        if len(variantes) == 1:
+            variante = variantes.pop()
+        path = os.path.join(self.path, 'aggregates', f"{self.group_name(func_name, algoritmo, configuracao, variante)}.npz")
+        if os.path.exists(path):
+            with np.load(path) as data:
+                aggregator = ConvergenceAggregator.__new__(ConvergenceAggregator)
+                aggregator.__setstate__({key: data[key] for key in data.files})
+            if aggregator.count == len(records):
+                return aggregator
+        aggregator = ConvergenceAggregator()
+        for record in records:
+            aggregator.add(self.load_trace(record))
+        return aggregator
+
+    def mean_curve(self, func_name, algoritmo, configuracao='padrao', evals=None, variante=None):
+        """Convergência média de um grupo nas avaliações `evals` (índices base 0; padrão: todas)."""
+        return self.aggregate(func_name, algoritmo, configuracao, variante).mean(evals)
+
+    def summary(self, milestones=MILESTONES, **filters):
+        """
+        Estatísticas (Minimo, Maximo, Media, Mediana, Desvio_Padrao) por
+        função, algoritmo, configuração e marco, como nas antigas abas
+        Estatisticas_120k, Estatisticas_600k e Estatisticas, com a média de
+        avaliações de função das execuções do grupo (Aval_Func_Media).
+        """
+        # Importado aqui: os workers só gravam execuções e não precisam do pandas
+        import pandas as pd
+        df = pd.DataFrame(self.records(**filters))
+        rows = []
+        columns = ['func_name', 'dimension', 'algoritmo', 'variante', 'configuracao', 'Milestone', 'Minimo', 'Maximo',
+                   'Media', 'Mediana', 'Desvio_Padrao', 'Aval_Func_Media', 'Execucoes']
+        if df.empty:
+            return pd.DataFrame(rows, columns=columns)
+        # Variantes com o mesmo rótulo (ex.: pcdeepso e pcdeepso_varias_vezes) ficam em linhas separadas
+        df['variante'] = df['variante'].fillna(df['algoritmo']) if 'variante' in df else df['algoritmo']
+        for (func_name, algoritmo, configuracao, variante), group in df.groupby(
+                ['func_name', 'algoritmo', 'configuracao', 'variante']):
+            for milestone in milestones:
+                values = [m[str(milestone)] for m in group['milestones'] if str(milestone) in m]
+                if not values:
+                    continue
+                minimum, maximum, mean, std_dev, median = calculate_statistics(values)
+                rows.append({'func_name': func_name, 'dimension': group['dimension'].iloc[0], 'algoritmo': algoritmo,
+                             'variante': variante, 'configuracao': configuracao, 'Milestone': milestone, 'Minimo': minimum,
+                             'Maximo': maximum, 'Media': mean, 'Mediana': median, 'Desvio_Padrao': std_dev,
+                             'Aval_Func_Media': float(group['function_evals'].mean()), 'Execucoes': len(values)})
+        return pd.DataFrame(rows, columns=columns)
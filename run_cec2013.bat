@@ -1,15 +1 @@
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f1_shifted_elliptic\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f2_rastrigin_shifted\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f3_shifted_ackley\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f4_shifted_rotated_elliptic\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f5_shifted_rotated_rastrigin\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f6_shifted_rotated_ackley\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f7_shifted_schwefel\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f8_shifted_rotated_elliptic\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f9_shifted_rotated_rastrigin\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f10_shifted_rotated_ackley\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f11_shifted_schwefel\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f12_rosenbrock_shifted\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f13_schwefel_conforming_overlapping\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f14_schwefel_conflicting_overlapping\experimento_cec_2013_paralelo_v3.py"
-py "C:\Users\patri\OneDrive\Documentos\UFRJ\TCC\powell-cdeepso\experimentacao\f15_schwefel_shifted\experimento_cec_2013_paralelo_v3.py"
\ No newline at end of file
+py "%~dp0experimentacao\executar_experimentos.py" %*
@@ -1,12 +1,28 @@
 import numpy as np
-from scipy.optimize import OptimizeResult
+
+
+class OptimizeResult(dict):
+    """
+    Resultado da busca com acesso por atributo, como scipy.optimize.OptimizeResult.
+    Definido aqui para que o caminho do Powell não precise importar o SciPy.
+    """
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(name) from e
+
+    __setattr__ = dict.__setitem__
+    __delattr__ = dict.__delitem__
+
 
 def _minimize_scalar_bounded(func, bounds, global_max_fun, get_global_fun_calls, args=(),
-                             xatol=1e-5, maxiter=500, disp=0,
+                             xatol=1e-5, maxiter=500, disp=0, method='golden',
                              **unknown_options):
     """
     Minimiza a função `func` dentro do intervalo `bounds` usando busca da seção áurea
-    e interpolação parabólica.
+    e, no modo 'brent', interpolação parabólica.
 
     Parameters
     ----------
@@ -22,8 +38,29 @@ def _minimize_scalar_bounded(func, bounds, global_max_fun, get_global_fun_calls,
         Número máximo de iterações.
     disp : int, optional
         Controle de impressão de mensagens de status.
+    method : str, optional
+        'golden' usa apenas passos de seção áurea. 'brent' tenta primeiro um
+        ajuste parabólico e só recorre à seção áurea quando a parábola não é
+        aceitável. A contagem de avaliações é a mesma nos dois modos.
     """
     _check_unknown_options(unknown_options)
+    steps = _minimize_scalar_bounded_steps(bounds, xatol=xatol, maxiter=maxiter, disp=disp, method=method)
+    x = next(steps)
+    while True:
+        try:
+            x = steps.send(func(x, *args))
+        except StopIteration as stop:
+            return stop.value
+
+def _minimize_scalar_bounded_steps(bounds, xatol=1e-5, maxiter=500, disp=0, method='golden'):
+    """
+    Mesma busca de `_minimize_scalar_bounded`, escrita como gerador: cada
+    `yield` entrega o próximo ponto a avaliar e recebe o valor da função
+    (via `send`). Ao terminar, o OptimizeResult é o valor de StopIteration.
+    Permite conduzir a busca de fora, como na interface ask/tell.
+    """
+    if method not in ('golden', 'brent'):
+        raise ValueError("method must be 'golden' or 'brent'.")
     maxfun = maxiter
 
     # Verifica se os limites do intervalo são válidos
@@ -44,7 +81,7 @@ def _minimize_scalar_bounded(func, bounds, global_max_fun, get_global_fun_calls,
     nfc, xf = fulc, fulc
     rat = e = 0.0
     x = xf
-    fx = func(x, *args)
+    fx = yield x
     num = 1
     fmin_data = (1, xf, fx)
     fu = np.inf
@@ -61,29 +98,29 @@ def _minimize_scalar_bounded(func, bounds, global_max_fun, get_global_fun_calls,
     while (np.abs(xf - xm) > (tol2 - 0.5 * (b - a))):
         golden = 1
         # Verifica ajuste parabólico
-        # if np.abs(e) > tol1:
-        #     golden = 0
-        #     r = (xf - nfc) * (fx - ffulc)
-        #     q = (xf - fulc) * (fx - fnfc)
-        #     p = (xf - fulc) * q - (xf - nfc) * r
-        #     q = 2.0 * (q - r)
-        #     if q > 0.0:
-        #         p = -p
-        #     q = np.abs(q)
-        #     r = e
-        #     e = rat
-
-        #     # Verifica aceitabilidade da parábola
-        #     if ((np.abs(p) < np.abs(0.5*q*r)) and (p > q*(a - xf)) and
-        #             (p < q * (b - xf))):
-        #         rat = (p + 0.0) / q
-        #         x = xf + rat
-        #         step = '       parabolic'
-        #         if ((x - a) < tol2) or ((b - x) < tol2):
-        #             si = np.sign(xm - xf) + ((xm - xf) == 0)
-        #             rat = tol1 * si
-        #     else:
-        #         golden = 1
+        if method == 'brent' and np.abs(e) > tol1:
+            golden = 0
+            r = (xf - nfc) * (fx - ffulc)
+            q = (xf - fulc) * (fx - fnfc)
+            p = (xf - fulc) * q - (xf - nfc) * r
+            q = 2.0 * (q - r)
+            if q > 0.0:
+                p = -p
+            q = np.abs(q)
+            r = e
+            e = rat
+
+            # Verifica aceitabilidade da parábola
+            if ((np.abs(p) < np.abs(0.5*q*r)) and (p > q*(a - xf)) and
+                    (p < q * (b - xf))):
+                rat = (p + 0.0) / q
+                x = xf + rat
+                step = '       parabolic'
+                if ((x - a) < tol2) or ((b - x) < tol2):
+                    si = np.sign(xm - xf) + ((xm - xf) == 0)
+                    rat = tol1 * si
+            else:
+                golden = 1
 
         if golden:
             if xf >= xm:
@@ -95,7 +132,7 @@ def _minimize_scalar_bounded(func, bounds, global_max_fun, get_global_fun_calls,
 
         si = np.sign(rat) + (rat == 0)
         x = xf + si * np.maximum(np.abs(rat), tol1)
-        fu = func(x, *args)
+        fu = yield x
         num += 1
         fmin_data = (num, x, fu)
         if disp > 2:
@@ -147,6 +184,78 @@ def _minimize_scalar_bounded(func, bounds, global_max_fun, get_global_fun_calls,
 
     return result
 
+def _minimize_scalar_batched(func_batch, bounds, global_max_fun, get_global_fun_calls,
+                             xatol=1e-5, maxiter=500, n_points=8):
+    """
+    Minimiza `func_batch` dentro do intervalo `bounds` por busca multi-seção:
+    a cada passo avalia `n_points` pontos internos igualmente espaçados em uma
+    única chamada e reduz o intervalo aos vizinhos do melhor ponto já avaliado
+    (da grade ou de um passo anterior), encolhendo o intervalo por um fator de
+    até 2 / (n_points + 1) por chamada.
+
+    Parameters
+    ----------
+    func_batch : callable
+        Recebe um array 1-D de passos e retorna um array com o valor da
+        função em cada um.
+    bounds : tuple
+        Intervalo (x1, x2) para a busca.
+    xatol : float, optional
+        Tolerância absoluta para a solução.
+    maxiter : int, optional
+        Número máximo de avaliações de função.
+    n_points : int, optional
+        Quantidade de pontos avaliados por chamada de `func_batch`.
+    """
+    if len(bounds) != 2:
+        raise ValueError('bounds must have two elements.')
+    x1, x2 = bounds
+    if not (is_finite_scalar(x1) and is_finite_scalar(x2)):
+        raise ValueError("Optimization bounds must be finite scalars.")
+    if x1 > x2:
+        raise ValueError("The lower bound exceeds the upper bound.")
+    if n_points < 2:
+        raise ValueError("n_points must be at least 2.")
+
+    flag = 0
+    sqrt_eps = np.sqrt(2.2e-16)
+    a, b = x1, x2
+    xf, fx = 0.5 * (a + b), np.inf
+    num = 0
+    tol1 = sqrt_eps * np.abs(xf) + xatol / 3.0
+
+    while True:
+        points = np.linspace(a, b, n_points + 2)
+        fvals = np.asarray(func_batch(points[1:-1]))
+        num += len(fvals)
+
+        j = np.nanargmin(fvals) if not np.all(np.isnan(fvals)) else 0
+        if fvals[j] <= fx or np.isnan(fx):
+            xf, fx = points[j + 1], fvals[j]
+            # O novo intervalo é formado pelos vizinhos do melhor ponto da grade
+            a, b = points[j], points[j + 2]
+        else:
+            # A grade não melhorou xf: xf continua sendo o melhor ponto e o
+            # intervalo é formado pelos vizinhos dele na grade, para que xf
+            # nunca fique fora de [a, b]
+            a, b = points[points < xf].max(), points[points > xf].min()
+
+        tol1 = sqrt_eps * np.abs(xf) + xatol / 3.0
+        if (b - a) <= 2.0 * tol1:
+            break
+        if num >= maxiter:
+            flag = 1
+            break
+
+    if np.isnan(xf) or np.isnan(fx):
+        flag = 2
+
+    return OptimizeResult(fun=fx, status=flag, success=(flag == 0),
+                          message={0: 'Solution found.',
+                                   1: 'Maximum number of function calls reached.',
+                                   2: 'NaN encountered.'}.get(flag, ''),
+                          x=xf, nfev=num, nit=num // n_points)
+
 def _check_unknown_options(unknown_options):
     if unknown_options:
         raise ValueError("Unknown options: %s" % unknown_options)
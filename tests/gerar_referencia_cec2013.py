@@ -0,0 +1,57 @@
+"""
+Gera tests/data/cec2013_referencia.npz: pontos de teste e os valores do pacote
+de referência cec2013lsgo para as 15 funções. Rodado uma vez (precisa do
+cec2013lsgo instalado); o teste só lê o arquivo.
+
+    py tests/gerar_referencia_cec2013.py
+"""
+import os
+import sys
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from cec2013 import CEC2013Function
+
+CAMINHO = os.path.join(os.path.dirname(__file__), 'data', 'cec2013_referencia.npz')
+PONTOS_ALEATORIOS = 3
+SEMENTE = 0
+
+
+def pontos_de_teste(function, rng):
+    """
+    Pontos aleatórios em uma grade de passo (upper - lower) / 1024 (exatos em
+    float64 e compressíveis), o ponto com cada subcomponente no seu
+    deslocamento e, na f12, xopt e xopt + 1 (o ótimo da referência).
+    """
+    passos = rng.integers(0, 1025, (PONTOS_ALEATORIOS, function.dimension))
+    pontos = [function.lower + (function.upper - function.lower) * passos / 1024]
+    deslocado = np.zeros(function.dimension)
+    for indices, shift in zip(function.groups, function.group_shifts):
+        deslocado[indices] = shift
+    if function.separable_indices is not None:
+        deslocado[function.separable_indices] = function.separable_shift
+    pontos.append(deslocado[None])
+    if function.function_id == 12:
+        pontos.append(deslocado[None] + 1)
+    return np.vstack(pontos)
+
+
+def main():
+    from cec2013lsgo.cec2013 import Benchmark as ReferenceBenchmark
+
+    reference = ReferenceBenchmark()
+    rng = np.random.default_rng(SEMENTE)
+    arrays = {}
+    for function_id in range(1, 16):
+        function = CEC2013Function(function_id)
+        reference_function = reference.get_function(function_id)
+        pontos = pontos_de_teste(function, rng)
+        arrays[f'f{function_id}_pontos'] = pontos
+        arrays[f'f{function_id}_valores'] = np.array([reference_function(p) for p in pontos])
+    os.makedirs(os.path.dirname(CAMINHO), exist_ok=True)
+    np.savez_compressed(CAMINHO, **arrays)
+    print(f"Referência gravada em {CAMINHO}")
+
+
+if __name__ == "__main__":
+    main()
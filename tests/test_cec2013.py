@@ -0,0 +1,47 @@
+import os
+import numpy as np
+import pytest
+from cec2013 import CEC2013Function, default_data_dir
+
+REFERENCIA = os.path.join(os.path.dirname(__file__), 'data', 'cec2013_referencia.npz')
+
+pytestmark = pytest.mark.skipif(not os.path.isdir(default_data_dir()),
+                                reason="arquivos de dados do CEC2013 (cdatafiles) não encontrados")
+
+
+@pytest.fixture(scope='module')
+def referencia():
+    with np.load(REFERENCIA) as data:
+        return {key: data[key] for key in data.files}
+
+
+@pytest.mark.parametrize('function_id', range(1, 16))
+def test_matches_reference(referencia, function_id):
+    pontos = referencia[f'f{function_id}_pontos']
+    esperado = referencia[f'f{function_id}_valores']
+    function = CEC2013Function(function_id)
+    assert function.dimension == pontos.shape[1]
+    np.testing.assert_allclose(function(pontos), esperado, rtol=1e-12, atol=1e-12)
+    # Um ponto de cada vez dá o mesmo que o lote
+    np.testing.assert_allclose([function(p) for p in pontos], esperado, rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize('function_id', [13, 14])
+def test_overlapping_dimension(function_id):
+    # 20 subcomponentes compartilhando 5 variáveis com o seguinte: 1000 - 19 * 5
+    assert CEC2013Function(function_id).dimension == 905
+
+
+def test_rosenbrock_optimum_at_xopt_plus_one(referencia):
+    # Últimos pontos da f12: xopt (valor D - 1) e xopt + 1 (o ótimo)
+    function = CEC2013Function(12)
+    xopt, otimo = referencia['f12_pontos'][-2:]
+    assert function(xopt) == pytest.approx(function.dimension - 1)
+    assert function(otimo) == pytest.approx(0.0, abs=1e-12)
+
+
+def test_rosenbrock_incremental_matches_reference(referencia):
+    # O objetivo incremental do Powell usa o mesmo deslocamento da f12
+    incremental = CEC2013Function(12).incremental()
+    np.testing.assert_allclose(incremental(referencia['f12_pontos']), referencia['f12_valores'],
+                               rtol=1e-12, atol=1e-12)
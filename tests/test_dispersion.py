@@ -0,0 +1,43 @@
+import numpy as np
+from sklearn.cluster import KMeans
+
+from dispersion import DispersionMonitor
+from functions import shifted_rastrigin, sphere
+from powell_cdeepso import c_deepso_powell_global_best_com_kmeans
+
+# Enxames gravados de execuções curtas (sem troca para o Powell: limiar 0),
+# verificados nas mesmas gerações que as variantes _com_kmeans
+MAX_ITER = 156
+# 2-means tem mínimos locais; o sklearn com n_init=10 também não acha sempre o
+# mesmo agrupamento, então a comparação tolera alguns por cento
+RTOL = 0.03
+
+
+def recorded_swarms(function, lower, upper):
+    *_, positions, _, _ = c_deepso_powell_global_best_com_kmeans(function, 20, 40, lower, upper, 0.0,
+                                                                max_iter=MAX_ITER, rng=3)
+    return [positions[k] for k in range(len(positions)) if k > 10 and k % 5 == 0]
+
+
+def kmeans_dispersion(positions):
+    kmeans = KMeans(n_clusters=2, n_init=10, random_state=0).fit(positions)
+    return np.mean(np.linalg.norm(positions - kmeans.cluster_centers_[kmeans.labels_], axis=1))
+
+
+def crossing(values, threshold):
+    below = np.flatnonzero(np.asarray(values) < threshold)
+    return below[0] if len(below) else None
+
+
+def test_dispersion_matches_sklearn_kmeans():
+    for function, lower, upper in [(sphere, -100, 100), (shifted_rastrigin, -5, 5)]:
+        swarms = recorded_swarms(function, lower, upper)
+        monitor = DispersionMonitor(rng=0)
+        values = np.array([monitor(swarm) for swarm in swarms])
+        expected = np.array([kmeans_dispersion(swarm) for swarm in swarms])
+        np.testing.assert_allclose(values, expected, rtol=RTOL)
+
+        # A verificação em que a dispersão cruza o limiar (e o Powell começaria)
+        # é a mesma, ou a vizinha quando o limiar cai entre os dois valores
+        for threshold in np.geomspace(expected.min(), expected.max(), 7)[1:-1]:
+            assert abs(crossing(values, threshold) - crossing(expected, threshold)) <= 1
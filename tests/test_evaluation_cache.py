@@ -0,0 +1,28 @@
+import numpy as np
+from functions import shifted_rastrigin
+from evaluation_cache import EvaluationCache
+from powell_cdeepso import c_deepso_powell_global_best_paralelo
+from powell_schedule import FixedWindows
+
+MAX_FUN_EVALS = 6_000
+
+
+def run_uncounted(lower, upper):
+    # Com count_hits=False um acerto de cache não consome orçamento; o motor
+    # precisa terminar mesmo quando só sobram pontos já avaliados
+    cache = EvaluationCache(shifted_rastrigin, count_hits=False)
+    return c_deepso_powell_global_best_paralelo(
+        shifted_rastrigin, 10, 30, lower, upper, max_fun_evals=MAX_FUN_EVALS, rng=7, cache=cache,
+        powell_batch_points=6, powell_schedule=FixedWindows.proportional(MAX_FUN_EVALS, 0.3))
+
+
+def test_powell_stops_when_every_point_is_cached():
+    g_best_fitness, g_best, *_ = run_uncounted(-5, 5)
+    assert np.isclose(shifted_rastrigin(g_best), g_best_fitness)
+
+
+def test_collapsed_swarm_stops():
+    # Limites (0, 0): todas as partículas ficam no mesmo ponto, avaliado uma única vez
+    g_best_fitness, _, g_best_fitness_list, _, _, function_evals, *_ = run_uncounted(0, 0)
+    assert function_evals < MAX_FUN_EVALS
+    assert len(g_best_fitness_list) == function_evals
@@ -0,0 +1,22 @@
+import numpy as np
+
+from functions import elliptic_function
+from incremental_functions import EllipticIncremental
+
+
+def test_elliptic_single_dimension():
+    # i / (D - 1) com D == 1: o único termo tem peso 1, sem divisão por zero
+    objective = EllipticIncremental(1, shift=[0.5])
+    assert objective.reset([2.0]) == elliptic_function([1.5]) == 2.25
+    assert objective.probe(0, -1.5) == 0.0
+    assert objective.update(0, -1.0) == elliptic_function([0.5])
+
+
+def test_elliptic_matches_full_evaluation():
+    rng = np.random.default_rng(0)
+    shift = rng.uniform(-1, 1, 50)
+    x = rng.uniform(-5, 5, 50)
+    objective = EllipticIncremental(50, shift=shift)
+    assert np.isclose(objective.reset(x), elliptic_function(x - shift))
+    x[7] += 0.3
+    assert np.isclose(objective.update(7, 0.3), elliptic_function(x - shift))
@@ -0,0 +1,47 @@
+import numpy as np
+from functions import sphere
+from powell_method import powell
+from scipy_functions import _minimize_scalar_batched
+
+
+def test_budget_follows_caller_counter():
+    # Metade das chamadas não é contada por quem chama (como um acerto de
+    # cache com count_hits=False) e não pode encurtar a fase do Powell
+    calls = 0
+    evals = 0
+
+    def function(x, result=None):
+        nonlocal calls, evals
+        calls += 1
+        evals += calls % 2
+        return sphere(x) if result is None else result
+
+    budget = 300
+    powell(function, np.full(5, 3.0), (-10, 10), budget, lambda: evals, tol=1e-12, ftol=0)
+    assert evals == budget
+
+
+# Função 1-D multimodal (soma de senos)
+AMPLITUDES = np.array([0.6, -0.9, 0.1])
+FREQUENCIES = np.array([7.0, 16.0, 10.0])
+
+
+def test_batched_line_search_keeps_best_point_inside_interval():
+    # Quando a grade não melhora o melhor ponto já avaliado, o intervalo
+    # seguinte ainda tem de contê-lo (em funções multimodais a melhor
+    # posição da grade pode estar longe dele)
+    best = [np.inf, None]
+
+    def func_batch(alphas):
+        values = np.sin(np.outer(alphas, FREQUENCIES)) @ AMPLITUDES + 0.01 * alphas ** 2
+        if best[1] is not None:
+            step = alphas[1] - alphas[0]
+            assert alphas[0] - step < best[1] < alphas[-1] + step
+        j = np.argmin(values)
+        if values[j] < best[0]:
+            best[:] = values[j], alphas[j]
+        return values
+
+    result = _minimize_scalar_batched(func_batch, (-5.0, 5.0), None, None, xatol=1e-8)
+    assert result.fun == best[0]
+    assert result.x == best[1]
@@ -0,0 +1,21 @@
+import numpy as np
+
+from functions import sphere
+from powell_cdeepso import c_deepso_powell_global_best_paralelo
+from powell_schedule import FixedWindows
+
+# Execução curta do motor de produção no sphere: com o agendamento proporcional
+# o Powell também roda dentro do orçamento
+MAX_FUN_EVALS = 4000
+
+
+def test_pcdeepso_runs_on_sphere():
+    (g_best_fitness, g_best, g_best_fitness_list, _, _, function_evals,
+     *_) = c_deepso_powell_global_best_paralelo(sphere, 30, 20, -100, 100, max_fun_evals=MAX_FUN_EVALS, rng=1,
+                                                powell_schedule=FixedWindows.proportional(MAX_FUN_EVALS))
+    assert function_evals == MAX_FUN_EVALS
+    assert len(g_best_fitness_list) == MAX_FUN_EVALS
+    assert np.isfinite(g_best_fitness)
+    assert g_best_fitness == g_best_fitness_list[-1]
+    assert np.isclose(sphere(g_best), g_best_fitness)
+    assert g_best_fitness < g_best_fitness_list[0]
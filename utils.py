@@ -1,16 +1,39 @@
 import numpy as np
-from scipy.stats import ttest_ind
 
-def generatePopulation(dimension, populationSize, lowerBound, upperBound):
-    population = np.random.uniform(lowerBound, upperBound, size=(populationSize, dimension))
+# `rng` é um numpy.random.Generator; sem ele usa o estado global de np.random
+def generatePopulation(dimension, populationSize, lowerBound, upperBound, rng=None):
+    population = (np.random if rng is None else rng).uniform(lowerBound, upperBound, size=(populationSize, dimension))
     return population
 
-def generateMultiplicationMatrix(dimension, T_com):
-  C = np.zeros((dimension, dimension))
+def generateMultiplicationMatrix(dimension, T_com, rng=None):
+  return np.diag(generateCommunicationMask(dimension, T_com, rng).astype(float))
 
-  for i in range(dimension):
-    C[i][i] = 1 if np.random.uniform() <= T_com else 0
-  return C
+# Diagonal de C como máscara booleana: C @ v == mask * v, sem a matriz D x D.
+# Com `size` gera as máscaras de `size` partículas de uma vez, shape (size, dimension)
+def generateCommunicationMask(dimension, T_com, rng=None, size=None):
+  shape = dimension if size is None else (size, dimension)
+  return (np.random if rng is None else rng).uniform(size=shape) <= T_com
+
+def update_swarm_in_place(swarm, velocity, X_st_matrix, selected_global_best, C, W_i, W_a, W_c, max_v, lowerBound, upperBound, work):
+    """
+    Aplica a equação de movimento do C-DEEPSO sobre `velocity` e `swarm` sem
+    alocar matrizes novas. `work` é um buffer com o mesmo shape do enxame.
+    A ordem das operações é a mesma da versão vetorizada, então o resultado
+    é idêntico bit a bit.
+    """
+    # inertia = W_i * velocity
+    np.multiply(velocity, W_i, out=velocity)
+    # cognitive = W_a * (X_st - swarm)
+    np.subtract(X_st_matrix, swarm, out=work)
+    work *= W_a
+    velocity += work
+    # social = W_c * C * (selected_global_best - swarm)
+    np.subtract(selected_global_best, swarm, out=work)
+    work *= W_c * C
+    velocity += work
+    np.clip(velocity, -max_v, max_v, out=velocity)
+    swarm += velocity
+    np.clip(swarm, lowerBound, upperBound, out=swarm)
 
 def print_statistics(function, dimension, PCDEEPSO_stats, CDEEPSO_stats, PCDEEPSO_evals, CDEEPSO_evals):
     print("Estatísticas dos Resultados dos Algoritmos PC-DEEPSO e C-DEEPSO\n")
@@ -32,6 +55,8 @@ def calculate_statistics(results):
     return minimum, maximum, mean, std_dev, median
 
 def perform_t_test(results_PCDEEPSO, results_CDEEPSO, alpha=0.05):
+    # Importado aqui para o scipy.stats não pesar na importação do motor
+    from scipy.stats import ttest_ind
     t_stat, p_value = ttest_ind(results_PCDEEPSO, results_CDEEPSO, equal_var=False)
     action = 'Rejeitar' if p_value < alpha else 'Aceitar'
     winner = 'PC-DEEPSO' if np.mean(results_PCDEEPSO) < np.mean(results_CDEEPSO) else 'C-DEEPSO'